@@ -0,0 +1,58 @@
+'''
+Measures the memory that the ASTs of a large program hold, with the
+default and the compact AST classes of the Python backend, for the
+grammar of tests/end-to-end/parse/print-json-ast. Each program is a
+line of its own (so each Token of the default classes holds a line of
+its own), and every tree is kept, as a tool that processes all
+programs before it reports would.
+
+    PYTHONPATH=src python benchmarks/compact_ast.py [PROGRAMS]
+'''
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+
+from plcc.load_spec import load_spec
+from plcc.generate_code.generate_python_backend import generate_python_backend
+from plcc.write_files import write_files
+
+
+GRAMMAR = Path(__file__).parents[1] / 'tests' / 'end-to-end' / 'parse' / 'print-json-ast' / 'given-grammar.lang'
+
+MEASURE = '''\
+import sys
+import tracemalloc
+from Scan import Scan
+from _Start import _Start
+scan = Scan(open(sys.argv[1]))
+tracemalloc.start()
+trees = []
+while not scan.isEOF():
+    trees.append(_Start.parse(scan))
+print(tracemalloc.get_traced_memory()[0])
+'''
+
+
+def measure(spec, directory: Path, program: Path, compact: bool) -> int:
+    write_files(directory, generate_python_backend(spec.lexicalSpec, spec.syntacticSpec, compact=compact))
+    result = subprocess.run([sys.executable, '-c', MEASURE, str(program)], cwd=directory, capture_output=True, text=True, check=True)
+    return int(result.stdout)
+
+
+def main(argv):
+    programs = int(argv[0]) if argv else 20000
+    spec = load_spec(GRAMMAR)
+    with tempfile.TemporaryDirectory() as temp:
+        temp = Path(temp)
+        program = temp / 'program'
+        program.write_text(''.join(f'+(x{i}, add1({i}), sub1(-(y, 2)))  % program {i}\n' for i in range(programs)))
+        default = measure(spec, temp / 'default', program, compact=False)
+        compact = measure(spec, temp / 'compact', program, compact=True)
+    print(f'{programs} programs')
+    print(f'  default {default / 2**20:8.1f} MiB')
+    print(f'  compact {compact / 2**20:8.1f} MiB  ({default / compact:.1f}x less)')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
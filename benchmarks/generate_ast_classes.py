@@ -0,0 +1,118 @@
+'''
+Times generating the Java AST classes of a large synthetic grammar with
+the template-compiled generator (plcc.generate_code) against an
+object-tree pipeline in the style of the archived AstClassGenerator and
+JavaPresenter (one frozen dataclass per class, field, parameter and
+assignment, presented bottom-up by a Transformation), and the template
+generator sharded across a process pool.
+
+    PYTHONPATH=src python benchmarks/generate_ast_classes.py [CLASSES] [REPEAT]
+'''
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import sys
+import timeit
+
+from plcc.load_spec.load_rough_spec.parse_lines import Line
+from plcc.load_spec.parse_spec.parse_syntactic_spec import parse_syntactic_spec
+from plcc.generate_code import describe_ast_classes, generate_ast_classes
+from plcc.visitor_pattern import Transform, Transformation
+
+
+def make_grammar(classes: int) -> list[Line]:
+    lines = [Line('%', 1), Line('<prog> ::= <exp0> <rands>', 2), Line('<rands> **= <exp0> +COMMA', 3)]
+    for i in range(classes):
+        lines.append(Line(f'<exp{i}>:Lit{i} ::= <LIT> <ID>name{i} <exp{(i + 1) % classes}>', len(lines) + 1))
+        lines.append(Line(f'<exp{i}>:Other{i} ::= OTHER <exp{(i + 7) % classes}>left <exp{(i + 3) % classes}>right', len(lines) + 1))
+    return lines
+
+
+@dataclass(frozen=True)
+class Class:
+    name: str
+    extends: str
+    fields: list
+    constructor: object
+
+
+@dataclass(frozen=True)
+class FieldDeclaration:
+    name: str
+    type: str
+
+
+@dataclass(frozen=True)
+class Constructor:
+    className: str
+    parameters: list
+    assignments: list
+
+
+@dataclass(frozen=True)
+class Parameter:
+    name: str
+    type: str
+
+
+@dataclass(frozen=True)
+class AssignVariableToField:
+    lhs: str
+    rhs: str
+
+
+class JavaPresenter(Transform):
+    def visit_Class(self, obj, name, extends, fields, constructor):
+        extends = f' extends {extends}' if extends else ''
+        fields = '\n'.join(f'    {f}' for f in fields)
+        constructor = '\n'.join(f'    {line}' if line else line for line in (constructor or '').split('\n'))
+        return f'import java.util.*;\n\npublic class {name}{extends} {{\n\n{fields}\n\n{constructor}\n}}\n'
+
+    def visit_FieldDeclaration(self, obj, name, type):
+        return f'public {type} {name};'
+
+    def visit_Constructor(self, obj, className, parameters, assignments):
+        assignments = '\n'.join(f'    {a}' for a in assignments)
+        return f'public {className}({", ".join(parameters)}) {{\n{assignments}\n}}\n'
+
+    def visit_Parameter(self, obj, name, type):
+        return f'{type} {name}'
+
+    def visit_AssignVariableToField(self, obj, lhs, rhs):
+        return f'this.{lhs} = {rhs};'
+
+
+def generate_with_object_tree(syntacticSpec) -> dict[str, str]:
+    files = {}
+    presenter = Transformation(JavaPresenter())
+    for astClass in describe_ast_classes(syntacticSpec):
+        types = [f'List<{f.typeName}>' if f.isList else f.typeName for f in astClass.fields]
+        tree = Class(
+            name=astClass.name,
+            extends=astClass.extends,
+            fields=[FieldDeclaration(f.name, t) for f, t in zip(astClass.fields, types)],
+            constructor=None if astClass.isAbstract else Constructor(
+                className=astClass.name,
+                parameters=[Parameter(f.name, t) for f, t in zip(astClass.fields, types)],
+                assignments=[AssignVariableToField(f.name, f.name) for f in astClass.fields],
+            ),
+        )
+        files[f'{astClass.name}.java'] = presenter.visit(tree)
+    return files
+
+
+def main(argv):
+    classes = int(argv[0]) if argv else 300
+    repeat = int(argv[1]) if len(argv) > 1 else 5
+    syntacticSpec = parse_syntactic_spec(make_grammar(classes))
+    with ProcessPoolExecutor() as executor:
+        for name, generate in [
+            ('object tree', lambda: generate_with_object_tree(syntacticSpec)),
+            ('templates', lambda: generate_ast_classes(syntacticSpec, 'Java')),
+            ('sharded', lambda: generate_ast_classes(syntacticSpec, 'Java', executor=executor)),
+        ]:
+            best = min(timeit.repeat(generate, number=1, repeat=repeat))
+            print(f'{name:12} {len(generate()):5} files  {best * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
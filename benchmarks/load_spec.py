@@ -0,0 +1,221 @@
+'''
+Times and memory-profiles each stage of loading a spec, on a synthetic
+spec of the given size whose sections are spread over a tree of
+%include files, and writes the results as JSON so that runs on
+different commits can be compared.
+
+    PYTHONPATH=src python benchmarks/load_spec.py [options] [--output FILE] [--compare FILE]
+
+Each stage runs on the output of the previous ones, so stages are timed
+alone. The time of a stage is its best over --repeat runs; its memory is
+the peak traced by tracemalloc while it runs, in a separate run (tracing
+slows the code down). With --compare, each stage is also reported as a
+ratio to the same stage in an earlier result file.
+'''
+from argparse import ArgumentParser
+from pathlib import Path
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from plcc.load_spec import load_spec
+from plcc.load_spec.load_spec import withoutBlocks
+from plcc.load_spec.load_rough_spec.parse_lines import parse_lines
+from plcc.load_spec.load_rough_spec.parse_blocks import parse_blocks
+from plcc.load_spec.load_rough_spec.parse_includes import parse_includes
+from plcc.load_spec.load_rough_spec.parse_dividers import parse_dividers
+from plcc.load_spec.load_rough_spec.load_rough_spec import process_includes
+from plcc.load_spec.load_rough_spec.split_rough_spec import split_rough_spec
+from plcc.load_spec.load_rough_spec.validate_rough_spec import validate_rough_spec
+from plcc.load_spec.parse_spec.parse_lexical_spec import parse_lexical_spec
+from plcc.load_spec.parse_spec.parse_syntactic_spec import parse_syntactic_spec
+from plcc.load_spec.parse_spec.parse_semantic_spec import parse_semantic_spec
+from plcc.load_spec.validate_spec.validate_syntactic_spec import validate_syntactic_spec
+from plcc.load_spec.validate_spec.validate_semantic_spec import validate_semantic_spec
+
+
+def make_spec(directory: Path, lexical: int, syntactic: int, fragments: int, depth: int, fanout: int) -> Path:
+    '''
+    Write a valid spec with about lexical token rules, syntactic rules
+    and fragments semantic code fragments to directory, and return the
+    path of its main file. Each section is a tree of %include files of
+    the given depth and fanout, whose leaves share the section's items.
+    '''
+    terminals = max(1, lexical - 4)
+    lexicalItems = ["skip WS '\\s+'", "COMMA ','", "END 'end'", "ID '[A-Za-z]\\w*'"]
+    lexicalItems[1:1] = [f"T{j} 'kw{j}'" for j in range(terminals)]
+    nonTerminals = max(1, (syntactic - 2) // 2)
+    syntacticItems = ['<prog> ::= <n0> <items>', '<items> **= <ID> +COMMA']
+    for i in range(nonTerminals):
+        tail = f' <n{i + 1}>' if i + 1 < nonTerminals else ''
+        syntacticItems.append(f'<n{i}>:A{i} ::= T{i % terminals} <ID>name{tail}')
+        syntacticItems.append(f'<n{i}>:B{i} ::= END')
+    modifiers = ['', ':init', ':import', ':top']
+    semanticItems = []
+    for k in range(fragments):
+        className = f'A{k % nonTerminals}'
+        modifier = modifiers[min(k // nonTerminals, len(modifiers) - 1)]
+        semanticItems.append(f'{className}{modifier}\n%%%\n// fragment {k}\nint f{k}() {{\n    return {k};\n}}\n%%%')
+    sections = [
+        write_tree(directory, 'lexical', lexicalItems, depth, fanout),
+        write_tree(directory, 'syntactic', syntacticItems, depth, fanout),
+        write_tree(directory, 'semantic', semanticItems, depth, fanout),
+    ]
+    main = directory / 'spec'
+    main.write_text(f'%include {sections[0]}\n%\n%include {sections[1]}\n% Java\n%include {sections[2]}\n')
+    return main
+
+
+def write_tree(directory: Path, name: str, items: list[str], depth: int, fanout: int) -> str:
+    '''
+    Write items to a tree of files under directory/name and return the
+    path of its root, relative to directory. Paths in %include lines are
+    relative to the including file.
+    '''
+    root = directory / name
+    root.mkdir(parents=True, exist_ok=True)
+    leaves = fanout ** depth
+    size = -(-len(items) // leaves) or 1
+
+    def write(path: Path, level: int, index: int):
+        if level == depth:
+            path.write_text(''.join(item + '\n' for item in items[index * size:(index + 1) * size]))
+            return
+        children = []
+        for i in range(fanout):
+            child = f'{path.stem}_{i}'
+            children.append(f'%include {child}')
+            write(path.parent / child, level + 1, index * fanout + i)
+        path.write_text('\n'.join(children) + '\n')
+
+    write(root / 'n', 0, 0)
+    return f'{name}/n'
+
+
+class Pipeline:
+    '''
+    The stages of load_spec, each a function of the results of the
+    previous stages (a dict by stage name). The files of the include
+    tree are parsed one by one, then inlined with process_includes.
+    '''
+    def __init__(self, main: Path):
+        self.main = str(main.resolve())
+        self.files = {str(path.resolve()): path.read_text() for path in main.parent.rglob('*') if path.is_file()}
+
+    def stages(self):
+        return [
+            ('parse_lines', lambda r: {f: list(parse_lines(s, file=f)) for f, s in self.files.items()}),
+            ('parse_blocks', lambda r: {f: list(parse_blocks(lines)) for f, lines in r['parse_lines'].items()}),
+            ('parse_includes', lambda r: {f: list(parse_includes(lines)) for f, lines in r['parse_blocks'].items()}),
+            ('parse_dividers', lambda r: {f: list(parse_dividers(lines)) for f, lines in r['parse_includes'].items()}),
+            ('process_includes', lambda r: list(process_includes(r['parse_dividers'][self.main], parse_file=r['parse_dividers'].__getitem__))),
+            ('split_rough_spec', lambda r: split_rough_spec(r['process_includes'])),
+            ('validate_rough_spec', lambda r: validate_rough_spec(r['split_rough_spec'])),
+            ('parse_lexical_spec', lambda r: parse_lexical_spec(withoutBlocks(r['split_rough_spec'].lexicalSection))),
+            ('parse_syntactic_spec', lambda r: parse_syntactic_spec(withoutBlocks(r['split_rough_spec'].syntacticSection))),
+            ('parse_semantic_spec', lambda r: [parse_semantic_spec(section) for section in r['split_rough_spec'].semanticSectionList]),
+            ('validate_syntactic_spec', lambda r: validate_syntactic_spec(r['parse_syntactic_spec'], r['parse_lexical_spec'])),
+            ('validate_semantic_spec', lambda r: [validate_semantic_spec(spec, r['parse_syntactic_spec']) for spec in r['parse_semantic_spec']]),
+            ('load_spec', lambda r: load_spec(self.main)),
+        ]
+
+    def time(self) -> dict[str, float]:
+        results, seconds = {}, {}
+        for name, stage in self.stages():
+            start = time.perf_counter()
+            results[name] = stage(results)
+            seconds[name] = time.perf_counter() - start
+        self._check(results)
+        return seconds
+
+    def trace(self) -> dict[str, int]:
+        results, peaks = {}, {}
+        tracemalloc.start()
+        try:
+            for name, stage in self.stages():
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                results[name] = stage(results)
+                peaks[name] = tracemalloc.get_traced_memory()[1] - before
+        finally:
+            tracemalloc.stop()
+        return peaks
+
+    @staticmethod
+    def _check(results: dict):
+        errorList = results['load_spec'].errorList
+        if errorList:
+            raise AssertionError(f'the synthetic spec has errors, e.g.: {errorList[0].message}')
+
+
+def run(arguments) -> dict:
+    with tempfile.TemporaryDirectory() as temp:
+        main = make_spec(Path(temp), arguments.lexical, arguments.syntactic, arguments.fragments, arguments.depth, arguments.fanout)
+        pipeline = Pipeline(main)
+        timings = [pipeline.time() for _ in range(arguments.repeat)]
+        peaks = pipeline.trace()
+    return {
+        'commit': get_commit(),
+        'python': platform.python_version(),
+        'parameters': {
+            'lexical': arguments.lexical,
+            'syntactic': arguments.syntactic,
+            'fragments': arguments.fragments,
+            'depth': arguments.depth,
+            'fanout': arguments.fanout,
+            'repeat': arguments.repeat,
+        },
+        'stages': {
+            name: {'seconds': min(timing[name] for timing in timings), 'peakBytes': peaks[name]}
+            for name in timings[0]
+        },
+    }
+
+
+def get_commit() -> str | None:
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=Path(__file__).parent, capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def report(result: dict, baseline: dict | None = None):
+    print(f'commit {result["commit"]}, python {result["python"]}, {result["parameters"]}')
+    for name, stage in result['stages'].items():
+        line = f'  {name:24} {stage["seconds"] * 1000:9.1f} ms {stage["peakBytes"] / 2**20:9.2f} MiB'
+        old = (baseline or {}).get('stages', {}).get(name)
+        if old:
+            line += f'  x{stage["seconds"] / old["seconds"]:.2f} time  x{stage["peakBytes"] / max(old["peakBytes"], 1):.2f} memory'
+        print(line)
+
+
+def main(argv):
+    parser = ArgumentParser(description='Benchmark the stages of load_spec.')
+    parser.add_argument('--lexical', type=int, default=200, help='lexical rules')
+    parser.add_argument('--syntactic', type=int, default=2000, help='syntactic rules')
+    parser.add_argument('--fragments', type=int, default=2000, help='semantic code fragments')
+    parser.add_argument('--depth', type=int, default=2, help='depth of the include tree of each section')
+    parser.add_argument('--fanout', type=int, default=4, help='files included by each non-leaf file')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='a JSON file of earlier results to compare with')
+    arguments = parser.parse_args(argv)
+    baseline = None
+    if arguments.compare:
+        with open(arguments.compare) as f:
+            baseline = json.load(f)
+    result = run(arguments)
+    report(result, baseline)
+    if arguments.output:
+        with open(arguments.output, 'w') as f:
+            json.dump(result, f, indent=2)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
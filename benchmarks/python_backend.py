@@ -0,0 +1,89 @@
+'''
+Times parsing a large program end to end with a grammar of
+tests/end-to-end/parse: the generated Python backend (generate, write
+and run Parse with python), the generated parser alone (without
+generation or startup), the interpreter (plcc.interpret_spec.Parser),
+and, if java and plccmk are on the PATH, the generated Java code
+(plccmk, then parse). The program is the test's given-program repeated.
+
+    PYTHONPATH=src python benchmarks/python_backend.py [COPIES] [REPEAT]
+'''
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+from plcc.load_spec import load_spec
+from plcc.generate_code.generate_python_backend import generate_python_backend
+from plcc.interpret_spec import Parser
+from plcc.write_files import write_files
+
+
+TESTS = Path(__file__).parents[1] / 'tests' / 'end-to-end' / 'parse'
+# The grammar in parses is left out: the newline that ends each line is
+# an $ERROR token for it, so it parses no program.
+GRAMMARS = [
+    (TESTS / 'print-json-ast' / 'given-grammar.lang', TESTS / 'print-json-ast' / 'given-program.lang'),
+]
+
+
+def run_python_backend(spec, directory: Path, program: Path):
+    write_files(directory, generate_python_backend(spec.lexicalSpec, spec.syntacticSpec))
+    with open(program) as input:
+        subprocess.run([sys.executable, 'Parse.py', '-n'], cwd=directory, stdin=input, stdout=subprocess.DEVNULL, check=True)
+
+
+def time_parser(directory: Path, program: Path, repeat: int) -> float:
+    '''
+    Time the generated parser without interpreter startup, in a process
+    of its own so the generated modules of each grammar are kept apart.
+    '''
+    script = f'''\
+import timeit
+from Scan import Scan
+from ProcessFiles import process
+print(min(timeit.repeat(lambda: process(Scan(open({str(program)!r})), lambda tree: None, ''), number=1, repeat={repeat})))
+'''
+    result = subprocess.run([sys.executable, '-c', script], cwd=directory, capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
+
+def run_java(grammar: Path, directory: Path, program: Path):
+    shutil.copy(grammar, directory / 'grammar')
+    subprocess.run(['plccmk', '-c', 'grammar'], cwd=directory, stdout=subprocess.DEVNULL, check=True)
+    with open(program) as input:
+        subprocess.run(['parse', '-n'], cwd=directory, stdin=input, stdout=subprocess.DEVNULL, check=True)
+
+
+def main(argv):
+    copies = int(argv[0]) if argv else 20000
+    repeat = int(argv[1]) if len(argv) > 1 else 3
+    hasJava = shutil.which('java') is not None and shutil.which('plccmk') is not None
+    for grammar, given in GRAMMARS:
+        print(f'{grammar.relative_to(TESTS)} x {copies}')
+        spec = load_spec(grammar)
+        with tempfile.TemporaryDirectory() as temp:
+            temp = Path(temp)
+            program = temp / 'program'
+            program.write_text((given.read_text().rstrip('\n') + '\n') * copies)
+            parser = Parser(spec.lexicalSpec, spec.syntacticSpec)
+            text = program.read_text()
+            timings = [
+                ('python backend', lambda: run_python_backend(spec, temp / 'Python', program)),
+                ('interpreter', lambda: sum(1 for _ in parser.parseAll(text))),
+            ]
+            if hasJava:
+                timings.append(('java', lambda: run_java(grammar, temp / 'Java', program)))
+            for name, function in timings:
+                best = min(timeit.repeat(function, number=1, repeat=repeat))
+                print(f'  {name:16} {best * 1000:9.1f} ms')
+                if name == 'python backend':
+                    print(f'  {"generated parser":16} {time_parser(temp / "Python", program, repeat) * 1000:9.1f} ms')
+            if not hasJava:
+                print('  java             skipped (java or plccmk not on the PATH)')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
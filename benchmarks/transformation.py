@@ -0,0 +1,79 @@
+'''
+Times a bottom-up Transformation of a complete binary tree of dataclass
+nodes (recursive traversal), and of a chain of nodes deeper than
+RECURSION_DEPTH (recursive, then iterative below that depth), with and
+without memoization. Each run uses a new Transformation, so memoized
+results are not reused across runs.
+
+    PYTHONPATH=src python benchmarks/transformation.py [DEPTH] [CHAIN] [REPEAT]
+'''
+from dataclasses import dataclass
+import sys
+import timeit
+
+from plcc.visitor_pattern import Transform, Transformation
+
+
+@dataclass(frozen=True)
+class Leaf:
+    value: int
+
+
+@dataclass(frozen=True)
+class Pair:
+    left: object
+    right: object
+
+
+@dataclass(frozen=True)
+class Items:
+    items: list
+
+
+class Sum(Transform):
+    def visit_Leaf(self, obj, value):
+        return value
+
+    def visit_Pair(self, obj, left, right):
+        return left + right
+
+    def visit_Items(self, obj, items):
+        return sum(items)
+
+
+def make_tree(depth: int, counter=None):
+    '''
+    Return a complete binary tree of Pairs of the given depth, whose
+    leaves are numbered in order, so that no two subtrees are equal.
+    '''
+    counter = [0] if counter is None else counter
+    if depth == 0:
+        counter[0] += 1
+        return Leaf(counter[0])
+    return Pair(make_tree(depth - 1, counter), make_tree(depth - 1, counter))
+
+
+def make_chain(length: int):
+    tree = Leaf(0)
+    for i in range(length):
+        tree = Items([tree, Leaf(i)])
+    return tree
+
+
+def main(argv):
+    depth = int(argv[0]) if argv else 14
+    chain = int(argv[1]) if len(argv) > 1 else 10000
+    repeat = int(argv[2]) if len(argv) > 2 else 5
+    tree = make_tree(depth)
+    deep = make_chain(chain)
+    for name, makeTransformation, root in [
+        (f'tree, depth {depth}', lambda: Transformation(Sum()), tree),
+        (f'tree, depth {depth}, memoized', lambda: Transformation(Sum(), memoize='identity', maxsize=1 << 16), tree),
+        (f'chain, length {chain}', lambda: Transformation(Sum()), deep),
+    ]:
+        best = min(timeit.repeat(lambda: makeTransformation().visit(root), number=1, repeat=repeat))
+        print(f'{name:32} {best * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
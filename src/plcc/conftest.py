@@ -0,0 +1,23 @@
+from pytest import fixture
+
+
+NOT_LL1 = '''\
+A 'a'
+B 'b'
+%
+<s>:X ::= <p> B
+<s>:Y ::= <q> A
+<p> ::= A
+<q> ::= A
+'''
+
+
+@fixture
+def notLL1Spec(tmp_path):
+    '''
+    A spec file whose grammar is not LL(1): both rules of <s> start with
+    A, and the conflict is reported on line 5.
+    '''
+    spec = tmp_path / 'spec'
+    spec.write_text(NOT_LL1)
+    return spec
@@ -0,0 +1,3 @@
+from .template import Template
+from .describe_ast_classes import AstClass, AstField, describe_ast_classes
+from .generate_ast_classes import AstClassGenerator, ShardedAstClassGenerator, UnsupportedLanguageError, generate_ast_classes, RENDERERS, COMPACT_RENDERERS
@@ -0,0 +1,108 @@
+from dataclasses import dataclass
+
+from plcc.load_spec.parse_spec.parse_syntactic_spec.structs import (
+    SyntacticSpec,
+    SyntacticRule,
+    RepeatingSyntacticRule,
+    CapturingTerminal,
+    RhsNonTerminal,
+)
+from plcc.load_spec.parse_spec.parse_syntactic_spec.names import (
+    getClassName,
+    getBaseClassName,
+    getFieldName,
+    getListFieldName,
+)
+from plcc.load_spec.analyze_spec.index_syntactic_spec import SyntacticIndex, index_syntactic_spec
+
+
+START_CLASS_NAME = '_Start'
+TOKEN_CLASS_NAME = 'Token'
+
+
+@dataclass(frozen=True)
+class AstField:
+    name: str
+    typeName: str
+    isList: bool = False
+
+    @property
+    def isToken(self) -> bool:
+        return self.typeName == TOKEN_CLASS_NAME
+
+
+@dataclass(frozen=True)
+class AstClass:
+    '''
+    A class to generate for the syntactic section. An abstract class is
+    the base class of the alternatives of a nonterminal; the other
+    classes are each made for one rule.
+
+        extends: The name of the superclass, or None.
+        rule: The rule the class is made for (None if abstract).
+    '''
+    name: str
+    extends: str | None
+    fields: tuple[AstField, ...] = ()
+    isAbstract: bool = False
+    rule: SyntacticRule | None = None
+
+
+def describe_ast_classes(syntacticSpec: SyntacticSpec) -> list[AstClass]:
+    '''
+    Return the classes to generate for syntacticSpec: the abstract base
+    classes, in the order their nonterminals are defined, then one class
+    per rule, in source order.
+
+    A nonterminal has a base class if any of its rules names its class
+    (e.g., <exp>:LitExp). The class of the start symbol, or its base
+    class, extends _Start.
+    '''
+    index = index_syntactic_spec(syntacticSpec)
+    if index.start is None:
+        return []
+    withBase = get_names_with_base_class(index)
+    classes = [
+        AstClass(
+            name=getBaseClassName(rules[0].lhs),
+            extends=START_CLASS_NAME if name == index.start else None,
+            isAbstract=True
+        )
+        for name, rules in index.rulesByName.items()
+        if name in withBase
+    ]
+    for rule in syntacticSpec:
+        classes.append(describe_ast_class(rule, index.start, rule.lhs.name in withBase))
+    return classes
+
+
+def get_names_with_base_class(index: SyntacticIndex) -> set[str]:
+    return {name for name, rules in index.rulesByName.items() if any(rule.lhs.altName for rule in rules)}
+
+
+def describe_ast_class(rule: SyntacticRule, start: str, hasBase: bool) -> AstClass:
+    if hasBase:
+        extends = getBaseClassName(rule.lhs)
+    elif rule.lhs.name == start:
+        extends = START_CLASS_NAME
+    else:
+        extends = None
+    return AstClass(
+        name=getClassName(rule.lhs),
+        extends=extends,
+        fields=tuple(describe_fields(rule)),
+        rule=rule
+    )
+
+
+def describe_fields(rule: SyntacticRule):
+    isList = isinstance(rule, RepeatingSyntacticRule)
+    for symbol in rule.rhsSymbolList:
+        if isinstance(symbol, CapturingTerminal):
+            typeName = TOKEN_CLASS_NAME
+        elif isinstance(symbol, RhsNonTerminal):
+            typeName = getBaseClassName(symbol)
+        else:
+            continue
+        name = getListFieldName(symbol) if isList else getFieldName(symbol)
+        yield AstField(name=name, typeName=typeName, isList=isList)
@@ -0,0 +1,45 @@
+from plcc.load_spec.load_rough_spec.parse_rough import parse_rough
+from plcc.load_spec.load_rough_spec.split_rough_spec import split_rough_spec
+from plcc.load_spec.parse_spec.parse_syntactic_spec import parse_syntactic_spec
+
+from .describe_ast_classes import AstClass, AstField, describe_ast_classes
+
+
+GRAMMAR = '''\
+%
+<program> ::= <exp>
+<exp>:LitExp ::= <LIT>
+<exp>:AddExp ::= PLUS <exp>left <exp>right
+<rands> **= <exp> +COMMA
+'''
+
+
+def test_base_classes_first_then_rules_in_order():
+    classes = describe_ast_classes(parseGrammar(GRAMMAR))
+    assert [(c.name, c.extends, c.isAbstract) for c in classes] == [
+        ('Exp', None, True),
+        ('Program', '_Start', False),
+        ('LitExp', 'Exp', False),
+        ('AddExp', 'Exp', False),
+        ('Rands', None, False),
+    ]
+
+
+def test_fields():
+    classes = {c.name: c for c in describe_ast_classes(parseGrammar(GRAMMAR))}
+    assert classes['LitExp'].fields == (AstField('lit', 'Token'),)
+    assert classes['AddExp'].fields == (AstField('left', 'Exp'), AstField('right', 'Exp'))
+    assert classes['Rands'].fields == (AstField('expList', 'Exp', isList=True),)
+
+
+def test_start_symbol_with_alternatives():
+    classes = describe_ast_classes(parseGrammar('%\n<exp>:A ::= X\n<exp>:B ::= Y\n'))
+    assert [(c.name, c.extends) for c in classes] == [('Exp', '_Start'), ('A', 'Exp'), ('B', 'Exp')]
+
+
+def test_empty_grammar():
+    assert describe_ast_classes(parseGrammar('%\n')) == []
+
+
+def parseGrammar(grammar):
+    return parse_syntactic_spec(split_rough_spec(list(parse_rough(grammar))).syntacticSection)
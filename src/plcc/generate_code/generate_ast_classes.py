@@ -0,0 +1,377 @@
+from concurrent.futures import Executor
+from hashlib import sha1
+from io import StringIO
+import os
+import pickle
+
+from plcc.load_spec.parse_spec.parse_syntactic_spec.structs import SyntacticSpec
+from plcc.load_spec.load_rough_spec.parse_blocks import Block
+from plcc.load_spec.analyze_spec.index_semantic_spec import CodeFragmentIndex
+
+from .describe_ast_classes import AstClass, AstField, describe_ast_classes
+from .template import Template
+
+
+class UnsupportedLanguageError(Exception):
+    def __init__(self, language):
+        self.language = language
+        super().__init__(f'No AST class generator for {language}')
+
+
+def generate_ast_classes(
+        syntacticSpec: SyntacticSpec,
+        language: str = 'Java',
+        codeFragmentIndex: CodeFragmentIndex | None = None,
+        executor: Executor | None = None,
+        shards: int | None = None,
+        compact: bool = False) -> dict[str, str]:
+    '''
+    Return the source files (file name -> content) of the AST classes for
+    syntacticSpec in language ('Java' or 'Python'), with the code
+    fragments in codeFragmentIndex inserted. The result can be passed to
+    write_files.
+
+        compact: If True, the classes store compact fields (see
+            COMPACT_RENDERERS).
+
+        executor: If given, the classes are rendered in shards as
+            separate tasks on it (e.g., a ProcessPoolExecutor); see
+            ShardedAstClassGenerator. The result is the same.
+        shards: The number of shards (default: the number of CPUs).
+    '''
+    generator = AstClassGenerator(language, codeFragmentIndex, compact)
+    classes = describe_ast_classes(syntacticSpec)
+    if executor is None:
+        return generator.generate(classes)
+    return ShardedAstClassGenerator(generator, executor, shards).generate(classes)
+
+
+class AstClassGenerator:
+    '''
+    Renders each AstClass with precompiled templates straight into one
+    buffer per file.
+
+    A class's fragments are inserted by modifier: top at the top of the
+    file, import after the imports, class after the class header (e.g.,
+    implements clauses), init at the end of the constructor, and those
+    without a modifier in the body of the class. A fragment without a
+    modifier for a class that is not generated is a file of its own.
+    '''
+    def __init__(self, language: str = 'Java', codeFragmentIndex: CodeFragmentIndex | None = None, compact: bool = False):
+        renderers = COMPACT_RENDERERS if compact else RENDERERS
+        if language not in renderers:
+            raise UnsupportedLanguageError(language)
+        self.renderer = renderers[language]
+        self.fragments = codeFragmentIndex if codeFragmentIndex is not None else CodeFragmentIndex()
+
+    def generate(self, classes: list[AstClass]) -> dict[str, str]:
+        files = {}
+        for astClass in classes:
+            files[self.renderer.getFileName(astClass.name)] = self.render(astClass)
+        files.update(self.generateStandalone(classes))
+        return files
+
+    def generateStandalone(self, classes: list[AstClass]) -> dict[str, str]:
+        '''
+        Return the files of the classes defined only by fragments. A class
+        that is not generated and has only fragments with modifiers (which
+        validate_semantic_spec reports) has no file.
+        '''
+        generated = {astClass.name for astClass in classes}
+        return {
+            self.renderer.getFileName(className): self.renderStandalone(className)
+            for className in self.fragments.getClassNames()
+            if className not in generated and self.fragments.getFragments(className)
+        }
+
+    def render(self, astClass: AstClass) -> str:
+        buffer = StringIO()
+        self.renderer.render(buffer.write, astClass, self._getHooks(astClass.name))
+        return buffer.getvalue()
+
+    def renderStandalone(self, className: str) -> str:
+        buffer = StringIO()
+        for fragment in self.fragments.getFragments(className):
+            fragment.block.writeTo(buffer)
+        return buffer.getvalue()
+
+    def _getHooks(self, className: str) -> dict[str | None, list[Block]]:
+        return {
+            modifier: [fragment.block for fragment in fragments]
+            for modifier, fragments in self.fragments.getModifiers(className).items()
+        }
+
+
+class ShardedAstClassGenerator:
+    '''
+    Renders the classes of an AstClassGenerator as shards on an executor.
+    A class's file depends only on the class and its own fragments, so
+    shards are independent. The generator (language and fragments) is
+    pickled once; every task gets the same read-only snapshot, which
+    each worker process unpickles once per generation.
+    '''
+    def __init__(self, generator: AstClassGenerator, executor: Executor, shards: int | None = None):
+        self.generator = generator
+        self.executor = executor
+        self.shards = max(1, shards or os.cpu_count() or 1)
+
+    def generate(self, classes: list[AstClass]) -> dict[str, str]:
+        snapshot = pickle.dumps(self.generator)
+        key = sha1(snapshot).hexdigest()
+        size = -(-len(classes) // self.shards) or 1
+        futures = [
+            self.executor.submit(render_shard, key, snapshot, classes[i:i + size])
+            for i in range(0, len(classes), size)
+        ]
+        files = {}
+        for future in futures:
+            files.update(future.result())
+        files.update(self.generator.generateStandalone(classes))
+        return files
+
+
+_snapshot = (None, None)
+
+
+def render_shard(key: str, snapshot: bytes, classes: list[AstClass]) -> list[tuple[str, str]]:
+    global _snapshot
+    cached = _snapshot
+    if cached[0] != key:
+        cached = _snapshot = (key, pickle.loads(snapshot))
+    generator = cached[1]
+    return [(generator.renderer.getFileName(astClass.name), generator.render(astClass)) for astClass in classes]
+
+
+def write_blocks(write, blocks: list[Block], indent: str = ''):
+    '''
+    Write the content of blocks, indenting each line that is not empty.
+    '''
+    for block in blocks:
+        for line in block.contentLines:
+            if line.string:
+                write(indent)
+                write(line.string)
+            write('\n')
+
+
+def join_blocks(blocks: list[Block], separator: str = ' ') -> str:
+    return separator.join(line.string.strip() for block in blocks for line in block.contentLines if line.string.strip())
+
+
+class JavaRenderer:
+    HEAD = Template('import java.util.*;\n{imports}\npublic {abstract}class {name}{extends} {classHook}{{\n\n')
+    FIELD = Template('    public {type} {name};\n')
+    CONSTRUCTOR = Template('    public {name}({parameters}) {{\n')
+    ASSIGNMENT = Template('        this.{name} = {name};\n')
+
+    @staticmethod
+    def getFileName(className: str) -> str:
+        return f'{className}.java'
+
+    @classmethod
+    def render(cls, write, astClass: AstClass, hooks: dict):
+        write_blocks(write, hooks.get('top', []))
+        imports = StringIO()
+        write_blocks(imports.write, hooks.get('import', []))
+        classHook = join_blocks(hooks.get('class', []))
+        cls.HEAD.render(write, {
+            'imports': imports.getvalue(),
+            'abstract': 'abstract ' if astClass.isAbstract else '',
+            'name': astClass.name,
+            'extends': f' extends {astClass.extends}' if astClass.extends else '',
+            'classHook': f'{classHook} ' if classHook else '',
+        })
+        if not astClass.isAbstract:
+            cls._renderFields(write, astClass)
+            cls._renderConstructor(write, astClass, hooks)
+        write_blocks(write, hooks.get(None, []), '    ')
+        write('}\n')
+
+    @classmethod
+    def _renderFields(cls, write, astClass: AstClass):
+        for field in astClass.fields:
+            cls._renderField(write, field)
+        if astClass.fields:
+            write('\n')
+
+    @classmethod
+    def _renderField(cls, write, field: AstField):
+        cls.FIELD.render(write, {'type': cls._getType(field), 'name': field.name})
+
+    @classmethod
+    def _renderConstructor(cls, write, astClass: AstClass, hooks: dict):
+        parameters = ', '.join(f'{cls._getType(field)} {field.name}' for field in astClass.fields)
+        cls.CONSTRUCTOR.render(write, {'name': astClass.name, 'parameters': parameters})
+        for field in astClass.fields:
+            cls._renderAssignment(write, field)
+        write_blocks(write, hooks.get('init', []), '        ')
+        write('    }\n\n')
+
+    @classmethod
+    def _renderAssignment(cls, write, field: AstField):
+        cls.ASSIGNMENT.render(write, {'name': field.name})
+
+    @staticmethod
+    def _getType(field: AstField) -> str:
+        return f'List<{field.typeName}>' if field.isList else field.typeName
+
+
+class PythonRenderer:
+    '''
+    Classes without code fragments declare __slots__, so their nodes
+    have no __dict__. Classes with fragments keep a __dict__, since the
+    fragments may add attributes.
+    '''
+    HEAD = Template('from __future__ import annotations\n{imports}{extendsImport}\n\nclass {name}{bases}:\n')
+    SLOTS = Template('    __slots__ = {names}\n')
+    CONSTRUCTOR = Template('    def __init__(self{parameters}):\n')
+    ASSIGNMENT = Template('        self.{name} = {name}\n')
+
+    @staticmethod
+    def getFileName(className: str) -> str:
+        return f'{className}.py'
+
+    @classmethod
+    def render(cls, write, astClass: AstClass, hooks: dict):
+        write_blocks(write, hooks.get('top', []))
+        imports = StringIO()
+        write_blocks(imports.write, hooks.get('import', []))
+        bases = [astClass.extends] if astClass.extends else []
+        classHook = join_blocks(hooks.get('class', []))
+        if classHook:
+            bases.append(classHook)
+        cls.HEAD.render(write, {
+            'imports': cls._getImports(astClass) + imports.getvalue(),
+            'extendsImport': f'from {astClass.extends} import {astClass.extends}\n' if astClass.extends else '',
+            'name': astClass.name,
+            'bases': f'({", ".join(bases)})' if bases else '',
+        })
+        body = hooks.get(None, [])
+        if not hooks:
+            cls._renderSlots(write, astClass)
+        if astClass.isAbstract:
+            if not body and hooks:
+                write('    pass\n')
+        else:
+            if not hooks:
+                write('\n')
+            cls._renderConstructor(write, astClass, hooks)
+            if body:
+                write('\n')
+        write_blocks(write, body, '    ')
+
+    @staticmethod
+    def _getImports(astClass: AstClass) -> str:
+        return ''
+
+    @classmethod
+    def _renderSlots(cls, write, astClass: AstClass):
+        cls.SLOTS.render(write, {'names': repr(tuple(cls._getSlots(astClass)))})
+
+    @staticmethod
+    def _getSlots(astClass: AstClass) -> list[str]:
+        return [field.name for field in astClass.fields]
+
+    @classmethod
+    def _renderConstructor(cls, write, astClass: AstClass, hooks: dict):
+        parameters = ''.join(f', {field.name}: {cls._getType(field)}' for field in astClass.fields)
+        cls.CONSTRUCTOR.render(write, {'parameters': parameters})
+        for field in astClass.fields:
+            cls._renderAssignment(write, field)
+        init = hooks.get('init', [])
+        write_blocks(write, init, '        ')
+        if not astClass.fields and not init:
+            write('        pass\n')
+
+    @classmethod
+    def _renderAssignment(cls, write, field: AstField):
+        cls.ASSIGNMENT.render(write, {'name': field.name})
+
+    @staticmethod
+    def _getType(field: AstField) -> str:
+        return f'list[{field.typeName}]' if field.isList else field.typeName
+
+
+class CompactJavaRenderer(JavaRenderer):
+    '''
+    Stores each captured Token as its interned lexeme (a String) and its
+    line number (an int, in a field named like the Token's with a Line
+    suffix), and each list as an array of exactly its size. The
+    constructor still takes Tokens and Lists, so the parser is unchanged.
+    '''
+    LINE_FIELD = Template('    public {type} {name}Line;\n')
+    LEXEME = Template('        this.{name} = {name}.str.intern();\n        this.{name}Line = {name}.lno;\n')
+    ARRAY = Template('        this.{name} = {name}.toArray(new {typeName}[0]);\n')
+    LEXEMES = Template('''\
+        this.{name} = new String[{name}.size()];
+        this.{name}Line = new int[{name}.size()];
+        for (int i = 0; i < {name}.size(); i++) {{
+            this.{name}[i] = {name}.get(i).str.intern();
+            this.{name}Line[i] = {name}.get(i).lno;
+        }}
+''')
+
+    @classmethod
+    def _renderField(cls, write, field: AstField):
+        if not field.isToken:
+            cls.FIELD.render(write, {'type': f'{field.typeName}[]' if field.isList else field.typeName, 'name': field.name})
+            return
+        cls.FIELD.render(write, {'type': 'String[]' if field.isList else 'String', 'name': field.name})
+        cls.LINE_FIELD.render(write, {'type': 'int[]' if field.isList else 'int', 'name': field.name})
+
+    @classmethod
+    def _renderAssignment(cls, write, field: AstField):
+        if field.isToken:
+            template = cls.LEXEMES if field.isList else cls.LEXEME
+        else:
+            template = cls.ARRAY if field.isList else cls.ASSIGNMENT
+        template.render(write, {'name': field.name, 'typeName': field.typeName})
+
+
+class CompactPythonRenderer(PythonRenderer):
+    '''
+    Stores each captured Token as its interned lexeme (a str) and its
+    line number (an int, in an attribute named like the Token's with a
+    Line suffix), and each list as a tuple. The constructor still takes
+    Tokens and lists, so the parser is unchanged.
+    '''
+    LEXEME = Template('        self.{name} = intern({name}.lexeme)\n        self.{name}Line = {name}.lineNumber\n')
+    TUPLE = Template('        self.{name} = tuple({name})\n')
+    LEXEMES = Template('''\
+        self.{name} = tuple([intern(token.lexeme) for token in {name}])
+        self.{name}Line = tuple([token.lineNumber for token in {name}])
+''')
+
+    @staticmethod
+    def _getImports(astClass: AstClass) -> str:
+        if any(field.isToken for field in astClass.fields):
+            return 'from sys import intern\n'
+        return ''
+
+    @staticmethod
+    def _getSlots(astClass: AstClass) -> list[str]:
+        slots = []
+        for field in astClass.fields:
+            slots.append(field.name)
+            if field.isToken:
+                slots.append(f'{field.name}Line')
+        return slots
+
+    @classmethod
+    def _renderAssignment(cls, write, field: AstField):
+        if field.isToken:
+            template = cls.LEXEMES if field.isList else cls.LEXEME
+        else:
+            template = cls.TUPLE if field.isList else cls.ASSIGNMENT
+        template.render(write, {'name': field.name})
+
+
+RENDERERS = {
+    'Java': JavaRenderer,
+    'Python': PythonRenderer,
+}
+
+COMPACT_RENDERERS = {
+    'Java': CompactJavaRenderer,
+    'Python': CompactPythonRenderer,
+}
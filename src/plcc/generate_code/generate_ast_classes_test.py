@@ -0,0 +1,217 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from pytest import raises
+
+from plcc.load_spec.load_rough_spec.parse_rough import parse_rough
+from plcc.load_spec.load_rough_spec.split_rough_spec import split_rough_spec
+from plcc.load_spec.parse_spec.parse_syntactic_spec import parse_syntactic_spec
+from plcc.load_spec.parse_spec.parse_semantic_spec import parse_semantic_spec
+from plcc.load_spec.analyze_spec import index_semantic_spec
+
+from .generate_ast_classes import generate_ast_classes, UnsupportedLanguageError
+from .describe_ast_classes_test import GRAMMAR
+
+
+SEMANTICS = '''\
+Program
+%%%
+public String toString() {
+
+    return exp.toString();
+}
+%%%
+LitExp:import
+%%%
+import java.io.*;
+%%%
+LitExp:init
+%%%
+check(lit);
+%%%
+LitExp:class
+%%%
+implements Cloneable
+%%%
+Env
+%%%
+public class Env {}
+%%%
+'''
+
+
+def test_java_files():
+    files = generate_ast_classes(parseGrammar(GRAMMAR), 'Java')
+    assert list(files) == ['Exp.java', 'Program.java', 'LitExp.java', 'AddExp.java', 'Rands.java']
+    assert files['Exp.java'] == '''\
+import java.util.*;
+
+public abstract class Exp {
+
+}
+'''
+    assert files['Rands.java'] == '''\
+import java.util.*;
+
+public class Rands {
+
+    public List<Exp> expList;
+
+    public Rands(List<Exp> expList) {
+        this.expList = expList;
+    }
+
+}
+'''
+
+
+def test_java_fragments():
+    files = generate_ast_classes(parseGrammar(GRAMMAR), 'Java', parseFragments('Java', SEMANTICS))
+    assert files['LitExp.java'] == '''\
+import java.util.*;
+import java.io.*;
+
+public class LitExp extends Exp implements Cloneable {
+
+    public Token lit;
+
+    public LitExp(Token lit) {
+        this.lit = lit;
+        check(lit);
+    }
+
+}
+'''
+    assert files['Program.java'].endswith('''\
+    public String toString() {
+
+        return exp.toString();
+    }
+}
+''')
+    assert files['Env.java'] == 'public class Env {}\n'
+
+
+def test_no_file_for_undefined_class_with_only_modifiers():
+    files = generate_ast_classes(parseGrammar(GRAMMAR), 'Java', parseFragments('Java', 'Missing:init\n%%%\nx();\n%%%\n'))
+    assert 'Missing.java' not in files
+
+
+def test_python_files():
+    files = generate_ast_classes(parseGrammar(GRAMMAR), 'Python')
+    assert files['Exp.py'] == '''\
+from __future__ import annotations
+
+
+class Exp:
+    __slots__ = ()
+'''
+    assert files['AddExp.py'] == '''\
+from __future__ import annotations
+from Exp import Exp
+
+
+class AddExp(Exp):
+    __slots__ = ('left', 'right')
+
+    def __init__(self, left: Exp, right: Exp):
+        self.left = left
+        self.right = right
+'''
+
+
+def test_python_fragments():
+    semantics = '''\
+Program
+%%%
+def __str__(self):
+    return str(self.exp)
+%%%
+Rands:init
+%%%
+self.count = len(expList)
+%%%
+'''
+    files = generate_ast_classes(parseGrammar(GRAMMAR), 'Python', parseFragments('Python', semantics))
+    assert files['Program.py'].endswith('''\
+class Program(_Start):
+    def __init__(self, exp: Exp):
+        self.exp = exp
+
+    def __str__(self):
+        return str(self.exp)
+''')
+    assert 'self.count = len(expList)\n' in files['Rands.py']
+    assert '__slots__' not in files['Program.py']
+    assert '__slots__' not in files['Rands.py']
+    assert "    __slots__ = ('left', 'right')\n" in files['AddExp.py']
+
+
+def test_class_without_fields():
+    files = generate_ast_classes(parseGrammar('%\n<a> ::= X\n'), 'Python')
+    assert files['A.py'].endswith('    def __init__(self):\n        pass\n')
+
+
+def test_compact_java():
+    files = generate_ast_classes(parseGrammar(GRAMMAR + '<ids> **= <ID>\n'), 'Java', compact=True)
+    assert '    public String lit;\n    public int litLine;\n' in files['LitExp.java']
+    assert '        this.lit = lit.str.intern();\n        this.litLine = lit.lno;\n' in files['LitExp.java']
+    assert '    public Exp[] expList;\n' in files['Rands.java']
+    assert '        this.expList = expList.toArray(new Exp[0]);\n' in files['Rands.java']
+    assert '    public String[] idList;\n    public int[] idListLine;\n' in files['Ids.java']
+    assert '    public Ids(List<Token> idList) {\n' in files['Ids.java']
+
+
+def test_compact_python():
+    files = generate_ast_classes(parseGrammar(GRAMMAR), 'Python', compact=True)
+    assert files['LitExp.py'] == '''\
+from __future__ import annotations
+from sys import intern
+from Exp import Exp
+
+
+class LitExp(Exp):
+    __slots__ = ('lit', 'litLine')
+
+    def __init__(self, lit: Token):
+        self.lit = intern(lit.lexeme)
+        self.litLine = lit.lineNumber
+'''
+    assert '        self.expList = tuple(expList)\n' in files['Rands.py']
+    assert 'intern' not in files['Rands.py']
+
+
+def test_unsupported_language():
+    with raises(UnsupportedLanguageError):
+        generate_ast_classes(parseGrammar(GRAMMAR), 'Cobol')
+
+
+def parseGrammar(grammar):
+    return parse_syntactic_spec(split_rough_spec(list(parse_rough(grammar))).syntacticSection)
+
+
+def parseFragments(language, semantics):
+    roughSpec = split_rough_spec(list(parse_rough(f'%\n<a> ::= X\n% {language}\n{semantics}')))
+    return index_semantic_spec(parse_semantic_spec(roughSpec.semanticSectionList[0]))
+
+
+def test_sharded_generation_on_thread_pool():
+    syntacticSpec = parseGrammar(GRAMMAR)
+    fragments = parseFragments('Java', SEMANTICS)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        files = generate_ast_classes(syntacticSpec, 'Java', fragments, executor, shards=3)
+    expected = generate_ast_classes(syntacticSpec, 'Java', fragments)
+    assert files == expected
+    assert list(files) == list(expected)
+
+
+def test_sharded_generation_on_process_pool():
+    syntacticSpec = parseGrammar(GRAMMAR)
+    fragments = parseFragments('Java', SEMANTICS)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        files = generate_ast_classes(syntacticSpec, 'Python', fragments, executor)
+    assert files == generate_ast_classes(syntacticSpec, 'Python', fragments)
+
+
+def test_sharded_generation_of_empty_grammar():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert generate_ast_classes(parseGrammar('%\n'), 'Java', executor=executor) == {}
@@ -0,0 +1,80 @@
+from pathlib import Path
+import re
+import sys
+
+from plcc.load_spec import load_spec
+from plcc.load_spec.parse_spec.parse_syntactic_spec.structs import SyntacticSpec
+from plcc.load_spec.analyze_spec.index_semantic_spec import CodeFragmentIndex, index_semantic_specs
+from plcc.write_files import write_files, read_manifest, MANIFEST
+
+from .generate_ast_classes import generate_ast_classes
+
+
+def generate_java(syntacticSpec: SyntacticSpec, codeFragmentIndex: CodeFragmentIndex | None = None) -> dict[str, str]:
+    '''
+    Return the Java source files (file name -> content) that plcc
+    generates from a spec: the AST classes with the fragments in
+    codeFragmentIndex. The result can be passed to write_files.
+    '''
+    return generate_ast_classes(syntacticSpec, 'Java', codeFragmentIndex)
+
+
+def write_java(directory, files: dict[str, str]) -> list[str]:
+    '''
+    Write files under directory and return the paths that changed. The
+    changed paths are also added to the manifest in directory, from which
+    get_sources_to_compile selects what plccmk recompiles.
+    '''
+    return write_files(directory, files, MANIFEST)
+
+
+def get_sources_to_compile(directory) -> list[str]:
+    '''
+    Return the Java sources in directory that plccmk must compile: the
+    sources listed in the manifest, and the sources that mention the class
+    of one of them, since they may use a member that changed. The class
+    files of other sources are up to date, and javac reads them instead.
+
+    Every source is returned if there is no manifest, or no class file
+    yet (e.g., after plccmk -c).
+    '''
+    directory = Path(directory)
+    sources = sorted(path.name for path in directory.glob('*.java'))
+    if not (directory / MANIFEST).is_file() or not any(directory.glob('*.class')):
+        return sources
+    changed = [path for path in read_manifest(directory) if path in sources]
+    if not changed:
+        return []
+    names = re.compile(r'\b(?:' + '|'.join(re.escape(Path(path).stem) for path in changed) + r')\b')
+    dependents = [
+        source for source in sources
+        if source not in changed and names.search((directory / source).read_text())
+    ]
+    return changed + dependents
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) == 2 and argv[0] == '--sources':
+        for source in get_sources_to_compile(argv[1]):
+            print(source)
+        return 0
+    if len(argv) not in (1, 2):
+        print('usage: python -m plcc.generate_code.generate_java SPEC [DIRECTORY]\n'
+              '       python -m plcc.generate_code.generate_java --sources DIRECTORY', file=sys.stderr)
+        return 2
+    spec = load_spec(argv[0])
+    for error in spec.errorList:
+        print(f'{error.line.number}: {error.message}', file=sys.stderr)
+    if spec.errorList:
+        return 1
+    codeFragmentIndex = CodeFragmentIndex()
+    for (_, language), index in index_semantic_specs(spec.semanticSpecList).items():
+        if language == 'Java':
+            codeFragmentIndex.merge(index)
+    write_java(argv[1] if len(argv) > 1 else 'Java', generate_java(spec.syntacticSpec, codeFragmentIndex))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
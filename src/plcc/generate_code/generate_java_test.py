@@ -0,0 +1,89 @@
+from plcc.write_files import read_manifest, MANIFEST
+
+from .generate_java import get_sources_to_compile, main
+
+
+SPEC = '''\
+skip WHITESPACE '\\s+'
+LIT '\\d+'
+VAR '[a-z]+'
+%
+<prog>       ::= <exp>
+<exp>:Lit    ::= <LIT>
+<exp>:Var    ::= <VAR>
+% Java
+Exp
+%%%
+public abstract int eval();
+%%%
+Lit
+%%%
+public int eval() { return Integer.parseInt(lit.toString()); }
+%%%
+Var
+%%%
+public int eval() { return 0; }
+%%%
+'''
+
+
+def test_writes_classes_and_manifest(tmp_path):
+    java = build(tmp_path, SPEC)
+    assert sorted(path.name for path in java.glob('*.java')) == ['Exp.java', 'Lit.java', 'Prog.java', 'Var.java']
+    assert 'public int eval() { return 0; }' in (java / 'Var.java').read_text()
+
+
+def test_first_build_compiles_everything(tmp_path):
+    java = build(tmp_path, SPEC)
+    assert get_sources_to_compile(java) == ['Exp.java', 'Lit.java', 'Prog.java', 'Var.java']
+
+
+def test_unchanged_spec_compiles_nothing(tmp_path):
+    java = build(tmp_path, SPEC)
+    compiled(java)
+    build(tmp_path, SPEC)
+    assert read_manifest(java) == []
+    assert get_sources_to_compile(java) == []
+
+
+def test_one_fragment_change_compiles_its_class_and_dependents(tmp_path):
+    java = build(tmp_path, SPEC)
+    compiled(java)
+    spec = SPEC.replace('return 0;', 'return 1;')
+    build(tmp_path, spec)
+    assert get_sources_to_compile(java) == ['Var.java']
+    compiled(java)
+    build(tmp_path, spec.replace('public abstract int eval();', 'public abstract long eval();'))
+    assert get_sources_to_compile(java) == ['Exp.java', 'Lit.java', 'Prog.java', 'Var.java']
+
+
+def test_changes_accumulate_until_a_build_succeeds(tmp_path):
+    java = build(tmp_path, SPEC)
+    compiled(java)
+    build(tmp_path, SPEC.replace('return 0;', 'return 1;'))
+    build(tmp_path, SPEC.replace('return 0;', 'return 1;').replace('parseInt', 'valueOf'))
+    assert get_sources_to_compile(java) == ['Var.java', 'Lit.java']
+
+
+def test_main_lists_sources(tmp_path, capsys):
+    java = build(tmp_path, SPEC)
+    compiled(java)
+    build(tmp_path, SPEC.replace('return 0;', 'return 1;'))
+    assert main(['--sources', str(java)]) == 0
+    assert capsys.readouterr().out == 'Var.java\n'
+
+
+def build(directory, spec):
+    (directory / 'spec').write_text(spec)
+    assert main([str(directory / 'spec'), str(directory / 'Java')]) == 0
+    return directory / 'Java'
+
+
+def compiled(java):
+    '''
+    Do what a successful plccmk build does: write the class files and
+    remove the manifest.
+    '''
+    for source in java.glob('*.java'):
+        source.with_suffix('.class').write_bytes(b'')
+    (java / MANIFEST).unlink()
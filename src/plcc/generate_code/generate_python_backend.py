@@ -0,0 +1,200 @@
+from io import StringIO
+from pathlib import Path
+import sys
+
+from plcc.load_spec import load_spec
+from plcc.load_spec.parse_spec.parse_lexical_spec import LexicalSpec, LexicalRule
+from plcc.load_spec.parse_spec.parse_syntactic_spec.structs import SyntacticSpec
+from plcc.load_spec.analyze_spec.index_semantic_spec import CodeFragmentIndex, index_semantic_specs
+from plcc.interpret_spec.build_parse_table import ParseTable, Production, build_parse_table, MATCH, CAPTURE
+from plcc.write_files import write_files
+
+from .generate_ast_classes import generate_ast_classes
+from .template import Template
+
+
+PYTHON_LIB = Path(__file__).parent / 'python_lib'
+
+
+def generate_python_backend(
+        lexicalSpec: LexicalSpec,
+        syntacticSpec: SyntacticSpec,
+        codeFragmentIndex: CodeFragmentIndex | None = None,
+        compact: bool = False) -> dict[str, str]:
+    '''
+    Return the source files (file name -> content) of a Python program
+    that scans and parses like the generated Java code, without a JVM:
+    the runtime in python_lib (Scan, Token, ProcessFiles, Rep, Parse,
+    ...), Tokens.py with the lexical rules, Parser.py with a recursive
+    descent parser, and the AST classes with the fragments in
+    codeFragmentIndex. The result can be passed to write_files. If compact
+    is True, the AST classes are compact (see CompactPythonRenderer).
+
+    Raises ParseTableConflictError if the grammar is not LL(1), and
+    ValueError if an AST class has the name of a runtime file.
+    '''
+    files = {path.name: path.read_text() for path in sorted(PYTHON_LIB.glob('*.py'))}
+    files['Tokens.py'] = generate_tokens(lexicalSpec)
+    files['Parser.py'] = ParserGenerator(build_parse_table(syntacticSpec)).generate()
+    for name, content in generate_ast_classes(syntacticSpec, 'Python', codeFragmentIndex, compact=compact).items():
+        if name in files:
+            raise ValueError(f'The generated class file {name} would replace a runtime file.')
+        files[name] = content
+    return files
+
+
+def generate_tokens(lexicalSpec: LexicalSpec) -> str:
+    buffer = StringIO()
+    buffer.write('RULES = [\n')
+    for rule in lexicalSpec.ruleList:
+        if isinstance(rule, LexicalRule):
+            buffer.write(f'    ({rule.name!r}, {rule.isSkip!r}, {rule.pattern!r}),\n')
+    buffer.write(']\n')
+    return buffer.getvalue()
+
+
+class ParserGenerator:
+    '''
+    Generates one function per nonterminal, which predicts a production
+    from the current token with the LL(1) table, and one function per
+    production, which matches its symbols and builds its AST node. The
+    table's prediction sets become frozensets, so a prediction is a
+    single membership test.
+
+    The parser accepts exactly what plcc.interpret_spec.Parser accepts
+    and reports the first syntax error the same way.
+    '''
+    HEAD = Template('''\
+from PLCCException import PLCCException
+{imports}
+
+def parse(scan):
+    before = scan.cur()
+    tree = parse_{start}(scan)
+    if scan.cur() is before and not scan.isEOF():
+        raise _error(scan, _EXPECTED_{start})
+    return tree
+
+
+def _error(scan, expected):
+    token = scan.cur()
+    return PLCCException('Parse error', f'{{token.lineNumber}}: expected {{" or ".join(sorted(expected))}}, got {{token.name}} "{{token.lexeme}}"')
+''')
+    CONSTANT = Template('{name} = frozenset({terminals})\n')
+    NONTERMINAL = Template('\n\ndef parse_{name}(scan):\n')
+    PREDICTION = Template('    if name in _PREDICT_{className}:\n        return _parse_{className}(scan)\n')
+    PRODUCTION = Template('\n\ndef _parse_{className}(scan):\n')
+
+    def __init__(self, table: ParseTable):
+        self.table = table
+        self.productions = self._getProductions()
+
+    def generate(self) -> str:
+        buffer = StringIO()
+        write = buffer.write
+        imports = ''.join(
+            f'from {className} import {className}\n'
+            for className in dict.fromkeys(p.className for p in self.productions)
+        )
+        self.HEAD.render(write, {'imports': imports, 'start': self.table.start})
+        write('\n\n')
+        self._renderConstants(write)
+        for name, row in self.table.predictions.items():
+            self._renderNonTerminal(write, name, row)
+        for production in self.productions:
+            self._renderProduction(write, production)
+        return buffer.getvalue()
+
+    def _getProductions(self) -> list[Production]:
+        productions = [p for row in self.table.predictions.values() for p in row.values()]
+        productions.extend(self.table.defaults.values())
+        return sorted(_unique(productions), key=lambda p: p.rule.line.number)
+
+    def _renderConstants(self, write):
+        for name, row in self.table.predictions.items():
+            self.CONSTANT.render(write, {'name': f'_EXPECTED_{name}', 'terminals': _presentSet(row)})
+        for production in self.productions:
+            predicted = [t for t, p in self.table.predictions[production.rule.lhs.name].items() if p is production]
+            self.CONSTANT.render(write, {'name': f'_PREDICT_{production.className}', 'terminals': _presentSet(predicted)})
+            if production.isRepeating:
+                self.CONSTANT.render(write, {'name': f'_FIRST_{production.className}', 'terminals': _presentSet(production.first)})
+
+    def _renderNonTerminal(self, write, name: str, row: dict[str, Production]):
+        default = self.table.defaults.get(name)
+        self.NONTERMINAL.render(write, {'name': name})
+        predicted = [p for p in _unique(row.values()) if p is not default]
+        if predicted:
+            write('    name = scan.cur().name\n')
+        for production in predicted:
+            self.PREDICTION.render(write, {'className': production.className})
+        if default is not None:
+            write(f'    return _parse_{default.className}(scan)\n')
+        else:
+            write(f'    raise _error(scan, _EXPECTED_{name})\n')
+
+    def _renderProduction(self, write, production: Production):
+        self.PRODUCTION.render(write, {'className': production.className})
+        fields = ', '.join(production.fieldNames)
+        if not production.isRepeating:
+            for step in production.steps:
+                write(f'    {self._presentStep(step)}\n')
+            write(f'    return {production.className}({fields})\n')
+            return
+        for fieldName in production.fieldNames:
+            write(f'    {fieldName} = []\n')
+        if production.steps:
+            indent = '            '
+            write(f'    if scan.cur().name in _FIRST_{production.className}:\n')
+            write('        while True:\n')
+            for step in production.steps:
+                write(f'{indent}{self._presentStep(step, isRepeating=True)}\n')
+            if production.separator is not None:
+                write(f'{indent}if scan.cur().name != {production.separator!r}:\n{indent}    break\n')
+                write(f'{indent}scan.adv()\n')
+            else:
+                write(f'{indent}if scan.cur().name not in _FIRST_{production.className}:\n{indent}    break\n')
+        write(f'    return {production.className}({fields})\n')
+
+    @staticmethod
+    def _presentStep(step: tuple, isRepeating: bool = False) -> str:
+        kind, name, fieldName = step
+        if kind == MATCH:
+            return f'scan.match({name!r})'
+        value = f'scan.match({name!r})' if kind == CAPTURE else f'parse_{name}(scan)'
+        if isRepeating:
+            return f'{fieldName}.append({value})'
+        return f'{fieldName} = {value}'
+
+
+def _unique(productions) -> list[Production]:
+    # Productions hold their rule, which is not hashable.
+    return list({id(p): p for p in productions}.values())
+
+
+def _presentSet(terminals) -> str:
+    return '{' + ', '.join(repr(t) for t in sorted(terminals)) + '}' if terminals else ''
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    compact = '--compact' in argv
+    argv = [arg for arg in argv if arg != '--compact']
+    if len(argv) not in (1, 2):
+        print('usage: python -m plcc.generate_code.generate_python_backend [--compact] SPEC [DIRECTORY]', file=sys.stderr)
+        return 2
+    spec = load_spec(argv[0])
+    for error in spec.errorList:
+        print(f'{error.line.number}: {error.message}', file=sys.stderr)
+    if spec.errorList:
+        return 1
+    codeFragmentIndex = CodeFragmentIndex()
+    for (_, language), index in index_semantic_specs(spec.semanticSpecList).items():
+        if language == 'Python':
+            codeFragmentIndex.merge(index)
+    files = generate_python_backend(spec.lexicalSpec, spec.syntacticSpec, codeFragmentIndex, compact)
+    write_files(argv[1] if len(argv) > 1 else 'Python', files)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,165 @@
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+from pytest import fixture, raises
+
+from plcc.load_spec.load_rough_spec.parse_rough import parse_rough
+from plcc.load_spec.load_rough_spec.split_rough_spec import split_rough_spec
+from plcc.load_spec.parse_spec.parse_lexical_spec import parse_lexical_spec
+from plcc.load_spec.parse_spec.parse_syntactic_spec import parse_syntactic_spec
+from plcc.interpret_spec import Parser, UnexpectedTokenError, scan
+from plcc.write_files import write_files
+
+from .generate_python_backend import generate_python_backend, main
+from .generate_ast_classes_test import parseFragments
+
+
+GRAMMAR = '''\
+skip WHITESPACE '\\s+'
+skip COMMENT '%.*'
+LIT '\\d+'
+LPAREN '\\('
+RPAREN '\\)'
+COMMA ','
+ADDOP '\\+'
+ADD1OP 'add1'
+VAR '[A-Za-z]\\w*'
+%
+<program>        ::= <exp>
+<exp>:LitExp     ::= <LIT>
+<exp>:VarExp     ::= <VAR>
+<exp>:PrimappExp ::= <prim> LPAREN <rands> RPAREN
+<rands>          **= <exp> +COMMA
+<prim>:AddPrim   ::= ADDOP
+<prim>:Add1Prim  ::= ADD1OP
+'''
+
+SEMANTICS = '''\
+Program
+%%%
+def run(self):
+    print(self.exp)
+%%%
+LitExp
+%%%
+def __str__(self):
+    return str(self.lit)
+%%%
+VarExp
+%%%
+def __str__(self):
+    return str(self.var)
+%%%
+PrimappExp
+%%%
+def __str__(self):
+    return f'{type(self.prim).__name__}({", ".join(map(str, self.rands.expList))})'
+%%%
+'''
+
+
+@fixture
+def backend(tmp_path):
+    lexicalSpec, syntacticSpec = parseSpec(GRAMMAR)
+    write_files(tmp_path, generate_python_backend(lexicalSpec, syntacticSpec, parseFragments('Python', SEMANTICS)))
+    return tmp_path
+
+
+def test_files():
+    files = generate_python_backend(*parseSpec(GRAMMAR))
+    assert {'Scan.py', 'Token.py', 'Tokens.py', 'Parser.py', 'ProcessFiles.py', 'Rep.py', 'Parse.py'} <= set(files)
+    assert {'Exp.py', 'Program.py', 'Rands.py', 'AddPrim.py'} <= set(files)
+    assert "    ('WHITESPACE', True, '\\\\s+'),\n" in files['Tokens.py']
+
+
+def test_class_file_may_not_replace_runtime_file():
+    with raises(ValueError):
+        generate_python_backend(*parseSpec("A 'a'\n%\n<parser> ::= A\n"))
+
+
+def test_scan_matches_interpreter(backend):
+    program = 'add1 add1x 12% comment\n(\n  x , #\n'
+    output = run(backend, 'Scan.py', program)
+    expected = [
+        f'{token.line.number}: {token.name} \'{token.lexeme}\''
+        for token in scan(parseSpec(GRAMMAR)[0], program)
+        if token.name != '$EOF'
+    ]
+    assert output.splitlines() == expected
+
+
+def test_parse(backend):
+    assert run(backend, 'Parse.py', '+(3, add1(x)) 4\n5', '-n') == 'OK\nOK\nOK\n'
+
+
+def test_rep(backend):
+    assert run(backend, 'Rep.py', '+(3, add1(x))\n4', '-n') == 'AddPrim(3, Add1Prim(x))\n4\n'
+
+
+def test_rep_files(backend):
+    (backend / 'program').write_text('add1(7)\n')
+    assert run(backend, 'Rep.py', '', '-n', 'program') == 'Add1Prim(7)\n'
+
+
+def test_verbose_names_each_input(backend):
+    (backend / 'program').write_text('add1(7)\n')
+    assert run(backend, 'Rep.py', '4', '-n', '-t', '-v', 'program') == '[program]Add1Prim(7)\n[stdin]4\n'
+
+
+def test_missing_file_exits(backend):
+    result = subprocess.run([sys.executable, 'Rep.py', '-n', 'missing'], cwd=backend, input='', capture_output=True, text=True)
+    assert result.returncode == 1
+    assert result.stderr == 'missing: no such file ... exiting\n'
+
+
+def test_semantic_error_is_reported(backend):
+    (backend / 'Program.py').write_text((backend / 'Program.py').read_text().replace('print(self.exp)', 'raise ValueError("bad program")'))
+    result = subprocess.run([sys.executable, 'Rep.py', '-n'], cwd=backend, input='1\n2', capture_output=True, text=True)
+    assert result.stderr == 'bad program\n'
+
+
+def test_parse_error_matches_interpreter(backend):
+    for program in ['+(3 4)', '+(3, )', ')', '+ 3']:
+        result = subprocess.run([sys.executable, 'Parse.py', '-n'], cwd=backend, input=program, capture_output=True, text=True)
+        try:
+            list(Parser(*parseSpec(GRAMMAR)).parseAll(program))
+        except UnexpectedTokenError as e:
+            expected = str(e)
+        assert result.stderr == f'Parse error: {expected}\n'
+
+
+def test_compact(tmp_path):
+    lexicalSpec, syntacticSpec = parseSpec(GRAMMAR)
+    write_files(tmp_path, generate_python_backend(lexicalSpec, syntacticSpec, parseFragments('Python', SEMANTICS), compact=True))
+    assert run(tmp_path, 'Rep.py', '+(3, add1(x))\n4', '-n') == 'AddPrim(3, Add1Prim(x))\n4\n'
+    script = 'from Scan import Scan\nfrom _Start import _Start\nlit = _Start.parse(Scan("\\n+(1)")).exp.rands.expList[0]\nprint(repr((lit.lit, lit.litLine)))\n'
+    assert run(tmp_path, '-c', '', script) == "('1', 2)\n"
+
+
+def test_ast_classes_have_slots(backend):
+    script = 'from Scan import Scan\nfrom _Start import _Start\nprint(hasattr(_Start.parse(Scan("+(1)")).exp.rands, "__dict__"))\n'
+    assert run(backend, '-c', '', script) == 'False\n'
+
+
+def test_main_reports_grammar_that_is_not_ll1(notLL1Spec, tmp_path, capsys):
+    assert main([str(notLL1Spec), str(tmp_path / 'Python')]) == 1
+    assert capsys.readouterr().err.startswith('5: Conflict on A for <s>')
+    assert not (tmp_path / 'Python').exists()
+
+
+def test_runs_as_module_without_warnings():
+    environment = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[2]))
+    result = subprocess.run([sys.executable, '-m', 'plcc.generate_code.generate_python_backend'], capture_output=True, text=True, env=environment)
+    assert result.stderr.startswith('usage:')
+
+
+def run(directory, script, input, *args):
+    result = subprocess.run([sys.executable, script, *args], cwd=directory, input=input, capture_output=True, text=True, check=True)
+    return result.stdout
+
+
+def parseSpec(spec):
+    roughSpec = split_rough_spec(list(parse_rough(spec)))
+    return parse_lexical_spec(roughSpec.lexicalSection), parse_syntactic_spec(roughSpec.syntacticSection)
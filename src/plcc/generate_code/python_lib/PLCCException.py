@@ -0,0 +1,4 @@
+class PLCCException(Exception):
+    def __init__(self, kind, message):
+        self.kind = kind
+        super().__init__(f'{kind}: {message}')
@@ -0,0 +1,54 @@
+import sys
+
+from Scan import Scan
+from _Start import _Start
+
+
+def process_files(action, args=None):
+    '''
+    Parse each program in the files named in args, then in standard
+    input, and call action on each parse tree, like the Java
+    ProcessFiles. The -n flag turns off the prompt for standard input;
+    -v toggles printing the name of the input ([file] or [stdin]) before
+    each program. The Python parser has no trace, so -t is accepted for
+    compatibility with the Java command line and ignored.
+    '''
+    args = sys.argv[1:] if args is None else args
+    prompt = '--> '
+    verbose = False
+    for arg in args:
+        if arg == '-n':
+            prompt = ''
+            continue
+        if arg == '-t':
+            continue
+        if arg == '-v':
+            verbose = not verbose
+            continue
+        try:
+            file = open(arg)
+        except FileNotFoundError:
+            print(f'{arg}: no such file ... exiting', file=sys.stderr)
+            sys.exit(1)
+        with file:
+            process(Scan(file), action, '', f'[{arg}]' if verbose else '')
+    process(Scan(sys.stdin), action, prompt, '[stdin]' if verbose else '')
+
+
+def process(scan, action, prompt, name=''):
+    '''
+    Like the Java ProcessFiles, any exception ends the input with its
+    message on standard error.
+    '''
+    while True:
+        print(prompt, end='', flush=True)
+        try:
+            if scan.isEOF():
+                break
+            print(name, end='', flush=True)
+            action(_Start.parse(scan))
+        except Exception as e:
+            print(e, file=sys.stderr)
+            return
+    if prompt:
+        print()
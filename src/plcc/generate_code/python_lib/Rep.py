@@ -0,0 +1,9 @@
+from ProcessFiles import process_files
+
+
+def action(tree):
+    tree.run()
+
+
+if __name__ == '__main__':
+    process_files(action)
@@ -0,0 +1,127 @@
+import re
+
+from PLCCException import PLCCException
+from Token import Token
+from Tokens import RULES
+
+
+EOF_NAME = '$EOF'
+ERROR_NAME = '$ERROR'
+
+
+def _compileMasterPattern(rules):
+    # One optional lookahead group per rule, so a single match reports
+    # how far every rule matches at a position. Groups are renumbered in
+    # it, so patterns that refer to a group by number are matched alone.
+    if any(re.search(r'\\[0-9]', pattern) for _, _, pattern in rules):
+        return None
+    try:
+        return re.compile(''.join(f'(?:(?=(?P<_{i}>{pattern}))|)' for i, (_, _, pattern) in enumerate(rules)))
+    except re.error:
+        return None
+
+
+_MASTER = _compileMasterPattern(RULES)
+_PATTERNS = [re.compile(pattern) for _, _, pattern in RULES]
+_GROUPS = [] if _MASTER is None else [(name, isSkip, _MASTER.groupindex[f'_{i}']) for i, (name, isSkip, _) in enumerate(RULES)]
+
+
+class Scan:
+    '''
+    Scans tokens like the Java Scan class: each line is scanned on its
+    own (with a newline appended), a skip listed before any matching
+    token is consumed, the longest token match wins, and ties go to the
+    token listed first. A character that starts no match is an $ERROR
+    token. After the last line, cur() is the $EOF token.
+
+    source is a string or an iterable of lines (e.g., a file).
+    '''
+    def __init__(self, source):
+        self.lines = iter(source.splitlines() if isinstance(source, str) else source)
+        self.lineNumber = 0
+        self.line = ''
+        self.text = ''
+        self.position = 0
+        self.token = None
+
+    def cur(self):
+        if self.token is None:
+            self.token = self._next()
+        return self.token
+
+    def adv(self):
+        token = self.cur()
+        if token.name != EOF_NAME:
+            self.token = None
+        return token
+
+    def match(self, name):
+        token = self.cur()
+        if token.name != name:
+            raise PLCCException('Parse error', f'{token.lineNumber}: expected {name}, got {token.name} "{token.lexeme}"')
+        return self.adv()
+
+    def isEOF(self):
+        return self.cur().name == EOF_NAME
+
+    def _next(self):
+        while True:
+            while self.position < len(self.text):
+                token = self._matchAt()
+                if token is not None:
+                    return token
+            line = next(self.lines, None)
+            if line is None:
+                return Token(EOF_NAME, '!EOF', self.lineNumber, self.line)
+            self.line = line.rstrip('\n')
+            self.text = self.line + '\n'
+            self.position = 0
+            self.lineNumber += 1
+
+    def _matchAt(self):
+        start = self.position
+        name, end = None, start
+        if _MASTER is not None:
+            # regs holds the span of every group, without a call per group.
+            regs = _MASTER.match(self.text, start).regs
+            for ruleName, isSkip, group in _GROUPS:
+                ruleEnd = regs[group][1]
+                if ruleEnd <= start:
+                    continue
+                if isSkip:
+                    if name is None:
+                        self.position = ruleEnd
+                        return None
+                elif end < ruleEnd:
+                    name, end = ruleName, ruleEnd
+        else:
+            for (ruleName, isSkip, _), pattern in zip(RULES, _PATTERNS):
+                if isSkip and name is not None:
+                    continue
+                m = pattern.match(self.text, start)
+                if m is None or m.end() == start:
+                    continue
+                if isSkip:
+                    self.position = m.end()
+                    return None
+                if end < m.end():
+                    name, end = ruleName, m.end()
+        if name is None:
+            self.position = start + 1
+            return Token(ERROR_NAME, _describeError(self.text[start]), self.lineNumber, self.line)
+        self.position = end
+        return Token(name, self.text[start:end], self.lineNumber, self.line)
+
+
+def _describeError(ch):
+    if ' ' <= ch <= '~':
+        return f'!ERROR("{ch}")'
+    return f'!ERROR(\\u{ord(ch):04x})'
+
+
+if __name__ == '__main__':
+    import sys
+    scan = Scan(sys.stdin)
+    while not scan.isEOF():
+        token = scan.adv()
+        print(f'{token.lineNumber}: {token.name} \'{token.lexeme}\'')
@@ -0,0 +1,17 @@
+class Token:
+    __slots__ = ('name', 'lexeme', 'lineNumber', 'line')
+
+    def __init__(self, name, lexeme, lineNumber, line):
+        self.name = name
+        self.lexeme = lexeme
+        self.lineNumber = lineNumber
+        self.line = line
+
+    def isEOF(self):
+        return self.name == '$EOF'
+
+    def __str__(self):
+        return self.lexeme
+
+    def __repr__(self):
+        return f'Token({self.name!r}, {self.lexeme!r}, {self.lineNumber})'
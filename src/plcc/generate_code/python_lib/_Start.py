@@ -0,0 +1,10 @@
+class _Start:
+    __slots__ = ()
+
+    @staticmethod
+    def parse(scan):
+        from Parser import parse
+        return parse(scan)
+
+    def run(self):
+        print(self)
@@ -0,0 +1,30 @@
+from string import Formatter
+
+
+class Template:
+    '''
+    A str.format-style template that is parsed once, when it is made.
+    render writes its literal text and the values of its {fields} to a
+    write function (e.g., StringIO.write) without formatting a new
+    string. Values must already be strings; format specs and conversions
+    are not supported. Use {{ and }} for literal braces.
+    '''
+    __slots__ = ('parts',)
+
+    def __init__(self, text: str):
+        parts = []
+        for literal, fieldName, _, _ in Formatter().parse(text):
+            if literal:
+                parts.append((True, literal))
+            if fieldName is not None:
+                parts.append((False, fieldName))
+        self.parts = tuple(parts)
+
+    def render(self, write, values: dict[str, str]):
+        for isLiteral, part in self.parts:
+            write(part if isLiteral else values[part])
+
+    def format(self, values: dict[str, str]) -> str:
+        result = []
+        self.render(result.append, values)
+        return ''.join(result)
@@ -0,0 +1,20 @@
+from io import StringIO
+
+from pytest import raises
+
+from .template import Template
+
+
+def test_render_to_buffer():
+    buffer = StringIO()
+    Template('class {name} {{\n{body}}}\n').render(buffer.write, {'name': 'A', 'body': '  x;\n'})
+    assert buffer.getvalue() == 'class A {\n  x;\n}\n'
+
+
+def test_repeated_field():
+    assert Template('{a}-{a}').format({'a': 'x'}) == 'x-x'
+
+
+def test_missing_value():
+    with raises(KeyError):
+        Template('{a}').format({})
@@ -0,0 +1,5 @@
+from .scan import Token, LazyToken, Scanner, scan, ERROR
+from .buffer_scan import BufferScanner, buffer_scan
+from .build_parse_table import ParseTable, Production, ParseTableConflictError, build_parse_table
+from .parse import AstNode, Parser, parse, RecoveredParse, UnexpectedTokenError, EmptyGrammarError, TreeBuilder
+from .server_pool import ServerPool, ServerError, evaluate_programs
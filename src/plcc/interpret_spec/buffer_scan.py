@@ -0,0 +1,193 @@
+from io import StringIO
+import re
+
+from plcc.load_spec.load_rough_spec.parse_lines import Line
+from plcc.load_spec.parse_spec.parse_lexical_spec import LexicalSpec, LexicalRule
+from plcc.load_spec.analyze_spec.compute_first_follow import END_OF_INPUT
+
+from .scan import Scanner, Token, LazyToken, ERROR
+
+
+CHUNK_SIZE = 1 << 16
+
+
+def buffer_scan(lexicalSpec: LexicalSpec, input, file=None, lazy: bool = False, chunkSize: int = CHUNK_SIZE):
+    '''
+    Yield the Tokens in input (a string or a text stream), ending with a
+    single END_OF_INPUT Token.
+    '''
+    return BufferScanner(lexicalSpec, lazy, chunkSize).scan(input, file=file)
+
+
+class BufferScanner(Scanner):
+    '''
+    Scans like Scanner, but reads its input in chunks of chunkSize
+    characters into a window and matches within the window, instead of
+    making a string of each line. Line numbers are kept by counting the
+    newlines that tokens and skips consume, and a Line is made only for
+    a line that has a token.
+
+    Rules marked multiline in the lexical spec may match across line
+    ends (the other rules match only up to the end of the current line,
+    as in Scanner); a multiline token must be at most chunkSize
+    characters long. The window is refilled whenever the current line,
+    or chunkSize characters for multiline rules, are not all in it.
+
+    The rules that are not multiline are matched at once, with one
+    pattern (see compile_master_pattern).
+
+    Lines end with '\\n', '\\r\\n' or '\\r', like the lines of Java's
+    readLine. Patterns are matched in the window, so, unlike in Scanner,
+    a lookbehind at the start of a line can see the previous line, and
+    \\A matches only at the start of the input.
+    '''
+    def __init__(self, lexicalSpec: LexicalSpec, lazy: bool = False, chunkSize: int = CHUNK_SIZE):
+        super().__init__(lexicalSpec, lazy)
+        rules = [rule for rule in lexicalSpec.ruleList if isinstance(rule, LexicalRule)]
+        self.hasMultiline = any(rule.isMultiline for rule in rules)
+        self.chunkSize = chunkSize
+        self.masterPattern = compile_master_pattern([rule for rule in rules if not rule.isMultiline])
+        groups = iter(range(1, len(rules) + 1))
+        self.ruleList = [
+            (
+                rule.name,
+                rule.isSkip,
+                None if rule.isMultiline or self.masterPattern is None else self.masterPattern.groupindex[f'_{next(groups)}'],
+                re.compile(rule.pattern, re.MULTILINE),
+                rule.isMultiline,
+            )
+            for rule in rules
+        ]
+
+    def scan(self, input, file=None):
+        if isinstance(input, str):
+            input = StringIO(input, newline=None)
+        return _Window(self, input, file).scan()
+
+
+def compile_master_pattern(rules: list[LexicalRule]) -> re.Pattern | None:
+    '''
+    Compile one pattern with an optional lookahead group per rule, so a
+    single match reports how far every rule matches at a position.
+    Returns None if the rules cannot be combined, e.g., if a pattern
+    refers to a group by number, since its groups are renumbered.
+    '''
+    if any(BACKREFERENCE.search(rule.pattern) for rule in rules):
+        return None
+    try:
+        return re.compile(''.join(f'(?:(?=(?P<_{i}>{rule.pattern}))|)' for i, rule in enumerate(rules, 1)), re.MULTILINE)
+    except re.error:
+        return None
+
+
+BACKREFERENCE = re.compile(r'\\[0-9]')
+
+
+class _Window:
+    def __init__(self, scanner: BufferScanner, stream, file):
+        self.scanner = scanner
+        self.stream = stream
+        self.file = file
+        self.text = ''
+        self.isEOF = False
+        self.lineStart = 0
+        self.lineNumber = 1
+        self.line = None
+
+    def scan(self):
+        scanner = self.scanner
+        chunkSize = scanner.chunkSize
+        start = lineEnd = 0
+        text = self.text
+        while True:
+            if start >= lineEnd or (scanner.hasMultiline and len(text) - start < chunkSize and not self.isEOF):
+                start, lineEnd = self._fill(start)
+                text = self.text
+                if start == len(text):
+                    break
+            name, end, isSkip = self._matchAt(text, start, lineEnd)
+            if isSkip:
+                pass
+            elif name is None:
+                yield Token(name=ERROR, lexeme=scanner._describeError(text[start]), line=self.line or self._getLine(lineEnd))
+                end = start + 1
+            elif scanner.lazy:
+                yield LazyToken(name, text, start, end, self.line or self._getLine(lineEnd))
+            else:
+                yield Token(name=name, lexeme=text[start:end], line=self.line or self._getLine(lineEnd))
+            if end >= lineEnd:
+                self._nextLine(start, end)
+            start = end
+        yield Token(name=END_OF_INPUT, lexeme='!EOF', line=self._getLastLine())
+
+    def _fill(self, start: int) -> tuple[int, int]:
+        '''
+        Read until the line at start, and chunkSize characters after
+        start if there are multiline rules, are in the window. Returns
+        start and the end of its line (after the newline), which move if
+        the window is refilled: consumed lines are dropped from it.
+        '''
+        while True:
+            lineEnd = self.text.find('\n', start) + 1
+            enough = lineEnd > 0
+            if enough and self.scanner.hasMultiline:
+                enough = len(self.text) - start >= self.scanner.chunkSize
+            if enough or self.isEOF:
+                if lineEnd == 0 and start < len(self.text):
+                    self.text += '\n'
+                    lineEnd = len(self.text)
+                return start, lineEnd
+            start = self._refill(start)
+
+    def _refill(self, start: int) -> int:
+        chunk = self.stream.read(self.scanner.chunkSize)
+        if not chunk:
+            self.isEOF = True
+            return start
+        shift = self.lineStart
+        self.text = self.text[shift:] + chunk
+        self.lineStart = 0
+        return start - shift
+
+    def _matchAt(self, text: str, start: int, lineEnd: int) -> tuple[str | None, int, bool]:
+        '''
+        Return the name and end of the token at start (None and start if
+        no token matches), or None, the end of the skip and True if a
+        skip applies.
+        '''
+        master = self.scanner.masterPattern
+        regs = None if master is None else master.match(text, start, lineEnd).regs
+        name, matchEnd = None, start
+        for ruleName, isSkip, group, pattern, isMultiline in self.scanner.ruleList:
+            if isSkip and name is not None:
+                continue
+            if group is not None:
+                end = regs[group][1]
+            else:
+                m = pattern.match(text, start) if isMultiline else pattern.match(text, start, lineEnd)
+                end = -1 if m is None else m.end()
+            if end <= start:
+                continue
+            if isSkip:
+                return None, end, True
+            if matchEnd < end:
+                name, matchEnd = ruleName, end
+        return name, matchEnd, False
+
+    def _nextLine(self, start: int, end: int):
+        self.lineNumber += self.text.count('\n', start, end)
+        self.lineStart = self.text.rindex('\n', start, end) + 1
+        self.line = None
+
+    def _getLine(self, lineEnd: int) -> Line:
+        if self.line is None:
+            self.line = Line(string=self.text[self.lineStart:lineEnd - 1], number=self.lineNumber, file=self.file)
+        return self.line
+
+    def _getLastLine(self) -> Line:
+        # The window is not refilled at the end of input, so it still
+        # holds the last line.
+        if self.lineNumber == 1:
+            return Line(string='', number=0, file=self.file)
+        end = self.lineStart - 1
+        return Line(string=self.text[self.text.rfind('\n', 0, end) + 1:end], number=self.lineNumber - 1, file=self.file)
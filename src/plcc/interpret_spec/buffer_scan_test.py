@@ -0,0 +1,79 @@
+from io import StringIO
+
+from pytest import mark
+
+from .buffer_scan import BufferScanner, buffer_scan
+from .scan import scan, LazyToken, ERROR
+from plcc.load_spec.load_rough_spec.parse_lines import Line, parse_lines
+from plcc.load_spec.parse_spec.parse_lexical_spec import parse_lexical_spec
+from plcc.load_spec.analyze_spec.compute_first_follow import END_OF_INPUT
+
+
+RULES = ["skip WS '\\s+'", "IF 'if'", "VAR '[a-z]+'", "NUM '\\d+'", "EOL '$'", "A 'a'", "skip S 'a+'"]
+
+INPUTS = [
+    '',
+    'if',
+    'iffy 12\n\nx ?? 3',
+    'if\nx\n',
+    '\n\n\n',
+    'aa a\na',
+    '  lead\ntrail  \n  ',
+    'x' * 50 + ' ' + 'y' * 30,
+]
+
+
+@mark.parametrize('chunkSize', [1, 2, 3, 7, 1 << 16])
+@mark.parametrize('string', INPUTS)
+def test_same_tokens_as_scan(string, chunkSize):
+    lexicalSpec = makeLexicalSpec(RULES)
+    assert list(buffer_scan(lexicalSpec, string, file='f', chunkSize=chunkSize)) == list(scan(lexicalSpec, string, file='f'))
+
+
+def test_unskipped_newline_is_error():
+    tokens = list(buffer_scan(makeLexicalSpec(["A 'a'"]), 'a\na', chunkSize=1))
+    assert names(tokens) == ['A', ERROR, 'A', ERROR, END_OF_INPUT]
+
+
+def test_reads_streams_with_any_line_ending():
+    lexicalSpec = makeLexicalSpec(["skip WS '\\s+'", "VAR '[a-z]+'"])
+    tokens = list(buffer_scan(lexicalSpec, StringIO('a\r\nb\rc\n', newline=None), chunkSize=2))
+    assert [(t.lexeme, t.line.number, t.line.string) for t in tokens] == [
+        ('a', 1, 'a'), ('b', 2, 'b'), ('c', 3, 'c'), ('!EOF', 3, 'c'),
+    ]
+
+
+def test_multiline_token():
+    lexicalSpec = makeLexicalSpec(["skip WS '\\s+'", "skip COMMENT '/\\*(?s:.)*?\\*/' multiline", "VAR '[a-z]+'", "DIV '/'"])
+    tokens = list(buffer_scan(lexicalSpec, 'a /* one\ntwo\n */ b /\nc', chunkSize=16))
+    assert [(t.name, t.lexeme, t.line.number) for t in tokens] == [
+        ('VAR', 'a', 1), ('VAR', 'b', 3), ('DIV', '/', 3), ('VAR', 'c', 4), (END_OF_INPUT, '!EOF', 4),
+    ]
+
+
+def test_multiline_token_keeps_its_first_line():
+    lexicalSpec = makeLexicalSpec(["skip WS '\\s+'", "TAG '<[^>]*>' multiline"])
+    tokens = list(buffer_scan(lexicalSpec, '\n <x\ny> ', chunkSize=4))
+    assert tokens[0].lexeme == '<x\ny>'
+    assert tokens[0].line == Line(' <x', 2)
+
+
+def test_backreferences_are_matched_rule_by_rule():
+    lexicalSpec = makeLexicalSpec(["skip WS '\\s+'", "PAIR '(.)\\1'", "ANY '.'"])
+    assert BufferScanner(lexicalSpec).masterPattern is None
+    assert names(buffer_scan(lexicalSpec, 'aab ba')) == ['PAIR', 'ANY', 'ANY', 'ANY', END_OF_INPUT]
+
+
+def test_lazy():
+    lexicalSpec = makeLexicalSpec(RULES)
+    lazy = list(buffer_scan(lexicalSpec, 'iffy 12\nx ?', lazy=True, chunkSize=3))
+    assert lazy == list(scan(lexicalSpec, 'iffy 12\nx ?'))
+    assert isinstance(lazy[0], LazyToken)
+
+
+def makeLexicalSpec(rules):
+    return parse_lexical_spec(list(parse_lines('\n'.join(rules))))
+
+
+def names(tokens):
+    return [t.name for t in tokens]
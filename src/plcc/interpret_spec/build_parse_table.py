@@ -0,0 +1,122 @@
+from dataclasses import dataclass, field
+
+from plcc.load_spec.parse_spec.parse_syntactic_spec.structs import (
+    SyntacticSpec,
+    SyntacticRule,
+    RepeatingSyntacticRule,
+    CapturingTerminal,
+    RhsNonTerminal,
+)
+from plcc.load_spec.parse_spec.parse_syntactic_spec.names import (
+    getClassName,
+    getFieldName,
+    getListFieldName,
+)
+from plcc.load_spec.analyze_spec.compute_first_follow import (
+    FirstFollow,
+    compute_first_follow,
+)
+
+
+MATCH = 0
+CAPTURE = 1
+DESCEND = 2
+
+
+@dataclass(frozen=True)
+class Production:
+    '''
+    A SyntacticRule compiled for interpretation. Each step is a tuple
+    (kind, name, fieldName) where kind is MATCH, CAPTURE or DESCEND.
+    '''
+    rule: SyntacticRule
+    className: str
+    steps: tuple
+    fieldNames: tuple
+    isRepeating: bool = False
+    separator: str | None = None
+    first: frozenset = frozenset()
+
+
+@dataclass
+class ParseTable:
+    start: str | None = None
+    predictions: dict[str, dict[str, Production]] = field(default_factory=dict)
+    defaults: dict[str, Production] = field(default_factory=dict)
+    firstFollow: FirstFollow = field(default_factory=FirstFollow)
+
+
+class ParseTableConflictError(Exception):
+    '''
+    Raised if the grammar is not LL(1). Like a spec error, it has the
+    line of the conflicting rule and a message. load_spec reports the
+    same conflicts as LL1ConflictErrors (see find_ll1_conflicts), so this
+    is only raised for grammars that were not validated.
+    '''
+    def __init__(self, line, terminal, nonTerminal=None):
+        self.line = line
+        self.terminal = terminal
+        self.nonTerminal = nonTerminal
+        self.message = (f"Conflict on {terminal} for <{nonTerminal}> "
+            f"(More than one of its rules can start with {terminal}; the grammar is not LL(1)).")
+        super().__init__(self.message)
+
+
+def build_parse_table(syntacticSpec: SyntacticSpec) -> ParseTable:
+    return ParseTableBuilder(syntacticSpec).build()
+
+
+class ParseTableBuilder:
+    def __init__(self, syntacticSpec: SyntacticSpec):
+        self.rules = list(syntacticSpec) if syntacticSpec else []
+        self.table = ParseTable()
+
+    def build(self) -> ParseTable:
+        self.table.firstFollow = compute_first_follow(self.rules)
+        self.table.start = self.table.firstFollow.start
+        for rule in self.rules:
+            self._addProduction(self._makeProduction(rule))
+        return self.table
+
+    def _makeProduction(self, rule: SyntacticRule) -> Production:
+        isRepeating = isinstance(rule, RepeatingSyntacticRule)
+        steps = tuple(self._makeStep(symbol, isRepeating) for symbol in rule.rhsSymbolList)
+        first, _ = self.table.firstFollow.firstOfSequence(rule.rhsSymbolList)
+        return Production(
+            rule=rule,
+            className=getClassName(rule.lhs),
+            steps=steps,
+            fieldNames=tuple(fieldName for _, _, fieldName in steps if fieldName),
+            isRepeating=isRepeating,
+            separator=rule.separator.name if isRepeating and rule.separator else None,
+            first=frozenset(first)
+        )
+
+    def _makeStep(self, symbol, isRepeating: bool) -> tuple:
+        if isinstance(symbol, RhsNonTerminal):
+            kind = DESCEND
+        elif isinstance(symbol, CapturingTerminal):
+            kind = CAPTURE
+        else:
+            return (MATCH, symbol.name, None)
+        fieldName = getListFieldName(symbol) if isRepeating else getFieldName(symbol)
+        return (kind, symbol.name, fieldName)
+
+    def _addProduction(self, production: Production):
+        name = production.rule.lhs.name
+        row = self.table.predictions.setdefault(name, {})
+        for terminal in self._getPredictSet(production):
+            if terminal in row and row[terminal] is not production:
+                raise ParseTableConflictError(production.rule.line, terminal, name)
+            row[terminal] = production
+        if self._isNullable(production):
+            self.table.defaults.setdefault(name, production)
+
+    def _getPredictSet(self, production: Production) -> set[str]:
+        return self.table.firstFollow.predict(production.rule)
+
+    def _isNullable(self, production: Production) -> bool:
+        if production.isRepeating:
+            return True
+        _, nullable = self.table.firstFollow.firstOfSequence(production.rule.rhsSymbolList)
+        return nullable
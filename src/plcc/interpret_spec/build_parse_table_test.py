@@ -0,0 +1,53 @@
+from pytest import raises, mark, fixture
+
+from .build_parse_table import build_parse_table, ParseTableConflictError, MATCH, CAPTURE, DESCEND
+from plcc.load_spec.load_rough_spec.parse_lines import parse_lines
+from plcc.load_spec.parse_spec.parse_syntactic_spec import parse_syntactic_spec
+from plcc.load_spec.analyze_spec.compute_first_follow import END_OF_INPUT
+
+
+def test_empty_spec():
+    table = build_parse_table(None)
+    assert table.start is None
+    assert table.predictions == {}
+
+
+def test_alternatives_are_predicted_by_first_token():
+    table = buildFrom('<exp>:Lit ::= <LIT>', '<exp>:Neg ::= MINUS <exp>')
+    assert table.predictions['exp']['LIT'].className == 'Lit'
+    assert table.predictions['exp']['MINUS'].className == 'Neg'
+
+
+def test_steps():
+    table = buildFrom('<exp>:Neg ::= MINUS <exp>right <LIT>')
+    assert table.predictions['exp']['MINUS'].steps == (
+        (MATCH, 'MINUS', None),
+        (DESCEND, 'exp', 'right'),
+        (CAPTURE, 'LIT', 'lit'),
+    )
+
+
+def test_repeating_steps_use_list_fields():
+    table = buildFrom('<exps> **= <exp> +COMMA', '<exp> ::= <LIT>')
+    production = table.predictions['exps']['LIT']
+    assert production.isRepeating
+    assert production.separator == 'COMMA'
+    assert production.fieldNames == ('expList',)
+
+
+def test_empty_alternative_is_predicted_by_follow_and_is_default():
+    table = buildFrom('<prog> ::= <opt>', '<opt>:Some ::= A', '<opt>:None ::=')
+    assert table.predictions['opt'][END_OF_INPUT].className == 'None'
+    assert table.defaults['opt'].className == 'None'
+
+
+def test_conflicting_alternatives_raise():
+    with raises(ParseTableConflictError) as e:
+        buildFrom('<exp>:One ::= A', '<exp>:Two ::= A B')
+    assert e.value.terminal == 'A'
+    assert e.value.line.string == '<exp>:Two ::= A B'
+
+
+def buildFrom(*rules):
+    lines = list(parse_lines('%\n' + '\n'.join(rules)))
+    return build_parse_table(parse_syntactic_spec(lines))
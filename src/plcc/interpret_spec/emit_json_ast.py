@@ -0,0 +1,197 @@
+from io import StringIO
+import json
+import sys
+
+from plcc.load_spec import load_spec
+
+from .parse import Parser, TreeBuilder, UnexpectedTokenError
+from .scan import Token
+
+
+def emit_json_ast(parser: Parser, string: str, output, jsonl: bool = False, file=None) -> int:
+    '''
+    Write the AST of each program in string to output as JSON, each
+    program ending with a newline, and return the number of programs
+    written. See JsonAstBuilder.
+
+    If a program has a syntax error, UnexpectedTokenError is raised and
+    output ends with the part of that program's AST written so far.
+    '''
+    builder = JsonAstBuilder(output.write, jsonl)
+    return sum(1 for _ in parser.parseAll(string, file=file, builder=builder))
+
+
+class JsonAstBuilder(TreeBuilder):
+    '''
+    Writes each node as JSON while it is being parsed instead of building
+    an AstNode tree, so memory does not grow with the size of the AST and
+    output starts before the parse completes.
+
+    By default, each program is written like ParseJsonAst writes it: the
+    root wrapped in an object keyed by its class name, lists as
+    ["java.util.ArrayList", [...]], pretty-printed as Jackson's default
+    pretty printer does (objects indented by two spaces per level, arrays
+    on one line). If jsonl is True, the root is not wrapped, lists are
+    plain JSON arrays, and each program is one compact line, for
+    consumption as JSON Lines.
+
+    The elements of a repeating rule with a single field are streamed. If
+    it has several fields, their elements are interleaved in the input,
+    so each field's elements are buffered as text until the rule ends.
+    '''
+    def __init__(self, write, jsonl: bool = False):
+        self.write = write
+        self.jsonl = jsonl
+        self.stack = []
+
+    def begin(self, frame):
+        className = frame.production.className
+        if self.stack:
+            parent = self.stack[-1]
+            write = self._openField(parent, frame.fieldName)
+            depth = parent.depth + 1
+        else:
+            write = self.write
+            depth = 1
+            if not self.jsonl:
+                write('{' + self._key(className, depth, first=True))
+                depth += 1
+        write('{' + self._key('$type', depth, first=True) + json.dumps(className))
+        node = _Node(write, frame.production, depth)
+        node.lists = self._openLists(node)
+        self.stack.append(node)
+
+    def store(self, frame, fieldName: str, value: Token | None):
+        node = self.stack[-1]
+        if value is None:
+            if node.lists is None:
+                node.write(self._key(fieldName, node.depth) + 'null')
+            return
+        self._openField(node, fieldName)(self._presentToken(value, node.depth + 1))
+
+    def end(self, frame, parent):
+        node = self.stack.pop()
+        if node.lists is not None:
+            self._closeLists(node)
+        node.write(self._objectEnd(node.depth))
+        if not self.stack:
+            self.write('\n' if self.jsonl else self._objectEnd(1) + '\n')
+        return True
+
+    def _openLists(self, node: '_Node') -> dict | None:
+        if not node.production.isRepeating:
+            return None
+        fieldNames = node.production.fieldNames
+        if len(fieldNames) == 1:
+            node.write(self._key(fieldNames[0], node.depth) + self._listStart())
+            return {fieldNames[0]: _List(node.write)}
+        return {name: _List.buffered() for name in fieldNames}
+
+    def _closeLists(self, node: '_Node'):
+        fieldNames = node.production.fieldNames
+        if len(fieldNames) == 1:
+            node.write(self._listEnd())
+            return
+        for name in fieldNames:
+            items = node.lists[name].buffer.getvalue()
+            node.write(self._key(name, node.depth) + self._listStart() + items + self._listEnd())
+
+    def _openField(self, node: '_Node', fieldName: str):
+        if node.lists is None:
+            node.write(self._key(fieldName, node.depth))
+            return node.write
+        items = node.lists[fieldName]
+        items.write(self._item(first=items.count == 0))
+        items.count += 1
+        return items.write
+
+    # The pieces of JSON text below are compact for JSON Lines, or laid
+    # out like Jackson's DefaultPrettyPrinter. depth is the nesting level
+    # of the object being written (the outermost object is 1); arrays do
+    # not add a level, since the pretty printer writes them inline.
+
+    def _key(self, name: str, depth: int, first: bool = False) -> str:
+        separator = '' if first else ','
+        if self.jsonl:
+            return f'{separator}{json.dumps(name)}:'
+        return f'{separator}\n{"  " * depth}{json.dumps(name)} : '
+
+    def _objectEnd(self, depth: int) -> str:
+        return '}' if self.jsonl else f'\n{"  " * (depth - 1)}}}'
+
+    def _item(self, first: bool) -> str:
+        if self.jsonl:
+            return '' if first else ','
+        return ' ' if first else ', '
+
+    def _listStart(self) -> str:
+        return '[' if self.jsonl else '[ "java.util.ArrayList", ['
+
+    def _listEnd(self) -> str:
+        return ']' if self.jsonl else ' ] ]'
+
+    def _presentToken(self, token: Token, depth: int) -> str:
+        fields = {
+            '$type': 'Token',
+            'match': token.name,
+            'str': token.lexeme,
+            'lno': token.line.number,
+            'line': token.line.string + '\n',
+            'eof': False,
+        }
+        text = ''.join(self._key(name, depth, first=i == 0) + json.dumps(value) for i, (name, value) in enumerate(fields.items()))
+        return '{' + text + self._objectEnd(depth)
+
+
+class _Node:
+    __slots__ = ('write', 'production', 'depth', 'lists')
+
+    def __init__(self, write, production, depth: int):
+        self.write = write
+        self.production = production
+        self.depth = depth
+        self.lists = None
+
+
+class _List:
+    __slots__ = ('write', 'count', 'buffer')
+
+    def __init__(self, write, buffer: StringIO | None = None):
+        self.write = write
+        self.count = 0
+        self.buffer = buffer
+
+    @classmethod
+    def buffered(cls) -> '_List':
+        buffer = StringIO()
+        return cls(buffer.write, buffer)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    jsonl = '--jsonl' in argv
+    files = [arg for arg in argv if arg != '--jsonl']
+    if not files:
+        print('usage: python -m plcc.interpret_spec.emit_json_ast [--jsonl] SPEC [PROGRAM...]', file=sys.stderr)
+        return 2
+    spec = load_spec(files[0])
+    for error in spec.errorList:
+        print(f'{error.line.number}: {error.message}', file=sys.stderr)
+    if spec.errorList:
+        return 1
+    parser = Parser(spec.lexicalSpec, spec.syntacticSpec)
+    try:
+        for file in files[1:]:
+            with open(file) as f:
+                emit_json_ast(parser, f.read(), sys.stdout, jsonl, file=file)
+        if len(files) == 1:
+            emit_json_ast(parser, sys.stdin.read(), sys.stdout, jsonl)
+    except UnexpectedTokenError as e:
+        sys.stdout.flush()
+        print(e, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
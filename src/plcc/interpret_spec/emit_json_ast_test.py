@@ -0,0 +1,124 @@
+from io import StringIO
+import json
+from pathlib import Path
+
+from pytest import raises
+
+from plcc.load_spec import load_spec
+
+from .emit_json_ast import emit_json_ast, main
+from .parse import Parser, UnexpectedTokenError
+from .parse_test import GRAMMAR, makeParser
+
+
+PRINT_JSON_AST = Path(__file__).parents[3] / 'tests' / 'end-to-end' / 'parse' / 'print-json-ast'
+
+
+def test_parse_json_ast_format():
+    output = StringIO()
+    assert emit_json_ast(makeParser(), '+(3, 2)', output) == 1
+    assert json.loads(output.getvalue()) == {'Program': {
+        '$type': 'Program',
+        'exp': {
+            '$type': 'PrimappExp',
+            'prim': {'$type': 'AddPrim'},
+            'rands': {
+                '$type': 'Rands',
+                'expList': ['java.util.ArrayList', [
+                    {'$type': 'LitExp', 'lit': makeToken('3')},
+                    {'$type': 'LitExp', 'lit': makeToken('2')},
+                ]],
+            },
+        },
+    }}
+
+
+def test_same_text_as_parse_json_ast():
+    spec = load_spec(PRINT_JSON_AST / 'given-grammar.lang')
+    output = StringIO()
+    emit_json_ast(Parser(spec.lexicalSpec, spec.syntacticSpec), (PRINT_JSON_AST / 'given-program.lang').read_text(), output)
+    expected = (PRINT_JSON_AST / 'expected.json').read_text()
+    assert output.getvalue() == expected.removeprefix('OK\n')
+
+
+def test_pretty_empty_list_and_several_programs():
+    output = StringIO()
+    assert emit_json_ast(makeParser(), '+() 3', output) == 2
+    first, second = output.getvalue().split('\n}\n')[:2]
+    assert '"expList" : [ "java.util.ArrayList", [ ] ]' in first
+    assert json.loads(second + '\n}')['Program']['exp']['$type'] == 'LitExp'
+
+
+def test_jsonl_one_program_per_line():
+    output = StringIO()
+    assert emit_json_ast(makeParser(), '3\n+(4)\n+()', output, jsonl=True) == 3
+    lines = output.getvalue().splitlines()
+    assert [json.loads(line)['exp']['$type'] for line in lines] == ['LitExp', 'PrimappExp', 'PrimappExp']
+    assert json.loads(lines[1])['exp']['rands']['expList'] == [
+        {'$type': 'LitExp', 'lit': makeToken('4', 2, '+(4)')}
+    ]
+    assert json.loads(lines[2])['exp']['rands']['expList'] == []
+
+
+def test_same_content_as_tree():
+    parser = makeParser()
+    output = StringIO()
+    emit_json_ast(parser, '+(1, +(2, 3), 4)', output, jsonl=True)
+    assert json.loads(output.getvalue()) == present(parser.parse('+(1, +(2, 3), 4)'))
+
+
+def test_repeating_rule_with_several_fields():
+    parser = makeParser("skip WS '\\s+'\nA 'a'\nB 'b'\n%\n<pairs> **= <A> <B>\n")
+    output = StringIO()
+    emit_json_ast(parser, 'a b a b', output, jsonl=True)
+    tree = json.loads(output.getvalue())
+    assert [t['str'] for t in tree['aList']] == ['a', 'a']
+    assert [t['str'] for t in tree['bList']] == ['b', 'b']
+    assert list(tree) == ['$type', 'aList', 'bList']
+
+
+def test_output_is_written_before_an_error():
+    output = StringIO()
+    with raises(UnexpectedTokenError):
+        emit_json_ast(makeParser(), '3 +(', output, jsonl=True)
+    first, partial = output.getvalue().split('\n')
+    assert json.loads(first)['exp']['$type'] == 'LitExp'
+    assert partial.startswith('{"$type":"Program"')
+
+
+def test_main_reads_program_files(tmp_path, capsys):
+    spec = tmp_path / 'spec'
+    spec.write_text(GRAMMAR)
+    program = tmp_path / 'program'
+    program.write_text('3 4')
+    assert main(['--jsonl', str(spec), str(program)]) == 0
+    assert len(capsys.readouterr().out.splitlines()) == 2
+
+
+def test_main_reports_syntax_error(tmp_path, capsys):
+    spec = tmp_path / 'spec'
+    spec.write_text(GRAMMAR)
+    program = tmp_path / 'program'
+    program.write_text('3\n+(3,')
+    assert main(['--jsonl', str(spec), str(program)]) == 1
+    captured = capsys.readouterr()
+    assert captured.err == '2: expected ADDOP or LIT, got $EOF "!EOF"\n'
+    assert json.loads(captured.out.split('\n')[0])['exp']['lit']['str'] == '3'
+
+
+def test_main_reports_grammar_that_is_not_ll1(notLL1Spec, capsys):
+    assert main([str(notLL1Spec)]) == 1
+    assert capsys.readouterr().err.startswith('5: Conflict on A for <s>')
+
+
+def makeToken(lexeme, number=1, line='+(3, 2)'):
+    return {'$type': 'Token', 'match': 'LIT', 'str': lexeme, 'lno': number, 'line': line + '\n', 'eof': False}
+
+
+def present(value):
+    if isinstance(value, list):
+        return [present(v) for v in value]
+    if hasattr(value, 'className'):
+        return {'$type': value.className, **{k: present(v) for k, v in value.fields.items()}}
+    return {'$type': 'Token', 'match': value.name, 'str': value.lexeme, 'lno': value.line.number,
+            'line': value.line.string + '\n', 'eof': False}
@@ -0,0 +1,340 @@
+from dataclasses import dataclass, field
+
+from plcc.load_spec.parse_spec.parse_lexical_spec import LexicalSpec
+from plcc.load_spec.parse_spec.parse_syntactic_spec.structs import SyntacticSpec
+from plcc.load_spec.analyze_spec.compute_first_follow import END_OF_INPUT
+
+from .scan import Scanner, Token
+from .buffer_scan import BufferScanner
+from .build_parse_table import (
+    ParseTable,
+    Production,
+    build_parse_table,
+    CAPTURE,
+    DESCEND,
+)
+
+
+@dataclass
+class AstNode:
+    className: str
+    fields: dict = field(default_factory=dict)
+
+
+class UnexpectedTokenError(Exception):
+    def __init__(self, token: Token, expected: set[str]):
+        self.token = token
+        self.expected = expected
+        self.line = token.line
+        super().__init__(
+            f'{token.line.number}: expected {" or ".join(sorted(expected))}, '
+            f'got {token.name} "{token.lexeme}"'
+        )
+
+
+class EmptyGrammarError(Exception):
+    pass
+
+
+@dataclass
+class RecoveredParse:
+    treeList: list[AstNode]
+    errorList: list[UnexpectedTokenError]
+
+
+def parse(lexicalSpec: LexicalSpec, syntacticSpec: SyntacticSpec, string: str, file=None, lazy: bool = False) -> AstNode:
+    return Parser(lexicalSpec, syntacticSpec, lazy).parse(string, file=file)
+
+
+class Parser:
+    '''
+    Parses programs directly from a LexicalSpec and a SyntacticSpec,
+    without generating or compiling any code. The scanner patterns and
+    the LL(1) table are built once, so reuse a Parser to parse many
+    programs.
+
+    AST nodes are AstNode objects whose className is the class that the
+    generated code would have instantiated (see getClassName), and whose
+    fields are named like the fields of that class.
+
+    If lazy is True, tokens are LazyTokens (see Scanner). If chunkSize
+    is given, input is scanned by a BufferScanner with chunks of that
+    size, so multiline lexical rules can match across lines, and input
+    can also be a text stream.
+    '''
+    def __init__(self, lexicalSpec: LexicalSpec, syntacticSpec: SyntacticSpec, lazy: bool = False, chunkSize: int | None = None):
+        if chunkSize is None:
+            self.scanner = Scanner(lexicalSpec, lazy)
+        else:
+            self.scanner = BufferScanner(lexicalSpec, lazy, chunkSize)
+        self.table = build_parse_table(syntacticSpec)
+        if self.table.start is None:
+            raise EmptyGrammarError()
+
+    def parse(self, string: str, file=None) -> AstNode:
+        '''
+        Parse a single program that must span all of string.
+        '''
+        tokens = _TokenStream(self.scanner.scan(string, file=file))
+        tree = _ParseRun(self.table, tokens).run()
+        tokens.match(END_OF_INPUT)
+        return tree
+
+    def parseAll(self, string: str, file=None, builder: 'TreeBuilder | None' = None):
+        '''
+        Yield each program in string, like Rep and Parse do for their input.
+
+        builder receives each program's nodes as they are parsed and
+        returns what is yielded (see TreeBuilder).
+        '''
+        tokens = _TokenStream(self.scanner.scan(string, file=file))
+        while tokens.current.name != END_OF_INPUT:
+            before = tokens.current
+            yield _ParseRun(self.table, tokens, builder=builder).run()
+            if tokens.current is before:
+                raise UnexpectedTokenError(before, set(self.table.predictions[self.table.start]))
+
+    def parseRecovering(self, string: str, file=None) -> RecoveredParse:
+        '''
+        Parse every program in string, reporting all syntax errors instead
+        of stopping at the first one.
+
+        Recovery is panic mode: after an error, tokens are skipped until
+        one can continue the parse. A nonterminal that cannot be predicted
+        resumes at a token in its FIRST set, or is omitted (its field is
+        None) at a token in its FOLLOW set. A missing terminal resumes at
+        that terminal, or abandons the rest of the current rule at a token
+        in the FOLLOW set of the rule's LHS (or at its separator or FIRST
+        set, to continue a repeating rule). Errors are not reported again
+        until a token has been matched, to avoid cascades.
+        '''
+        tokens = _TokenStream(self.scanner.scan(string, file=file))
+        recovery = _Recovery(self.table)
+        treeList = []
+        while tokens.current.name != END_OF_INPUT:
+            before = tokens.current
+            tree = _ParseRun(self.table, tokens, recovery).run()
+            if tree is not None:
+                treeList.append(tree)
+            if tokens.current is before:
+                recovery.report(UnexpectedTokenError(before, set(self.table.predictions[self.table.start])))
+                tokens.advance()
+        return RecoveredParse(treeList=treeList, errorList=recovery.errorList)
+
+
+class _TokenStream:
+    def __init__(self, tokens):
+        self.tokens = iter(tokens)
+        self.current = next(self.tokens)
+
+    def advance(self) -> Token:
+        token = self.current
+        if token.name != END_OF_INPUT:
+            self.current = next(self.tokens)
+        return token
+
+    def match(self, name: str) -> Token:
+        if self.current.name != name:
+            raise UnexpectedTokenError(self.current, {name})
+        return self.advance()
+
+    def skipUntil(self, names) -> Token:
+        while self.current.name not in names and self.current.name != END_OF_INPUT:
+            self.advance()
+        return self.current
+
+
+class _Recovery:
+    def __init__(self, table: ParseTable):
+        self.table = table
+        self.errorList = []
+        self.suppressing = False
+
+    def report(self, error: UnexpectedTokenError):
+        if not self.suppressing:
+            self.errorList.append(error)
+        self.suppressing = True
+
+    def matched(self):
+        self.suppressing = False
+
+    def getFollow(self, name: str) -> set[str]:
+        return self.table.firstFollow.follow.get(name, set())
+
+
+class TreeBuilder:
+    '''
+    Receives the nodes of a program as the parser completes them, and
+    builds the AstNode tree. Subclasses can consume the nodes some other
+    way (e.g., to stream them out) without building the tree.
+
+    begin is called when the parser starts a node; its fieldName is the
+    field of the parent node (the previous node begun and not yet ended)
+    that it fills, or None for the root. store is called for each token
+    captured for the current node, or with None for a field of a node
+    whose parse failed during error recovery. end is called when the
+    current node is complete; the root's result is the program's result.
+    '''
+    def begin(self, frame: '_Frame'):
+        pass
+
+    def store(self, frame: '_Frame', fieldName: str, value: Token | None):
+        frame.store(fieldName, value)
+
+    def end(self, frame: '_Frame', parent: '_Frame | None'):
+        node = frame.makeNode()
+        if parent is not None:
+            parent.store(frame.fieldName, node)
+        return node
+
+
+class _Frame:
+    __slots__ = ('production', 'fieldName', 'index', 'repeating', 'values')
+
+    def __init__(self, production: Production, fieldName: str | None):
+        self.production = production
+        self.fieldName = fieldName
+        self.index = 0
+        self.repeating = production.isRepeating and bool(production.steps)
+        if production.isRepeating:
+            self.values = {name: [] for name in production.fieldNames}
+        else:
+            self.values = {}
+
+    def store(self, fieldName: str, value):
+        if not self.production.isRepeating:
+            self.values[fieldName] = value
+        elif value is not None:
+            self.values[fieldName].append(value)
+
+    def makeNode(self) -> AstNode:
+        return AstNode(className=self.production.className, fields=self.values)
+
+
+TREE_BUILDER = TreeBuilder()
+
+
+class _ParseRun:
+    '''
+    Parses one program with an explicit stack of frames, one frame per
+    nonterminal being parsed, so deep programs do not exhaust Python's
+    call stack.
+
+    Without a _Recovery, the first syntax error is raised.
+    '''
+    def __init__(self, table: ParseTable, tokens: _TokenStream, recovery: _Recovery | None = None, builder: TreeBuilder | None = None):
+        self.table = table
+        self.tokens = tokens
+        self.recovery = recovery
+        self.builder = TREE_BUILDER if builder is None else builder
+
+    def run(self) -> AstNode | None:
+        builder = self.builder
+        root = self._enter(self.table.start, None)
+        if root is None:
+            return None
+        builder.begin(root)
+        stack = [root]
+        while True:
+            frame = stack[-1]
+            steps = frame.production.steps
+            if frame.index < len(steps):
+                kind, name, fieldName = steps[frame.index]
+                frame.index += 1
+                if kind == DESCEND:
+                    child = self._enter(name, fieldName)
+                    if child is None:
+                        builder.store(frame, fieldName, None)
+                    else:
+                        builder.begin(child)
+                        stack.append(child)
+                elif kind == CAPTURE:
+                    builder.store(frame, fieldName, self._match(frame, name))
+                else:
+                    self._match(frame, name)
+            elif frame.repeating and self._repeat(frame):
+                frame.index = 0
+            else:
+                stack.pop()
+                result = builder.end(frame, stack[-1] if stack else None)
+                if not stack:
+                    return result
+
+    def _match(self, frame: _Frame, name: str) -> Token | None:
+        if self.recovery is None:
+            return self.tokens.match(name)
+        if self.tokens.current.name != name:
+            self.recovery.report(UnexpectedTokenError(self.tokens.current, {name}))
+            if self.tokens.skipUntil(self._getResumeSet(frame, name)).name != name:
+                self._abandon(frame)
+                return None
+        self.recovery.matched()
+        return self.tokens.advance()
+
+    def _getResumeSet(self, frame: _Frame, name: str) -> set[str]:
+        production = frame.production
+        resume = {name} | self.recovery.getFollow(production.rule.lhs.name)
+        if production.isRepeating:
+            resume |= production.first
+            if production.separator is not None:
+                resume.add(production.separator)
+        return resume
+
+    def _abandon(self, frame: _Frame):
+        frame.index = len(frame.production.steps)
+        current = self.tokens.current.name
+        production = frame.production
+        if current != production.separator and current not in production.first:
+            frame.repeating = False
+
+    def _enter(self, name: str, fieldName: str | None) -> _Frame | None:
+        if self.recovery is None:
+            production = self._predict(name)
+        else:
+            production = self._predictRecovering(name)
+            if production is None:
+                return None
+        frame = _Frame(production, fieldName)
+        if frame.repeating and self.tokens.current.name not in frame.production.first:
+            frame.index = len(frame.production.steps)
+            frame.repeating = False
+        return frame
+
+    def _predict(self, name: str) -> Production:
+        token = self.tokens.current
+        production = self._lookup(name, token.name)
+        if production is None:
+            raise UnexpectedTokenError(token, set(self.table.predictions.get(name, {})))
+        return production
+
+    def _predictRecovering(self, name: str) -> Production | None:
+        try:
+            return self._predict(name)
+        except UnexpectedTokenError as e:
+            self.recovery.report(e)
+        self.tokens.skipUntil(set(self.table.predictions.get(name, {})) | self.recovery.getFollow(name))
+        return self._lookup(name, self.tokens.current.name)
+
+    def _lookup(self, name: str, terminal: str) -> Production | None:
+        '''
+        Return the production of name that terminal predicts, or else its
+        nullable production, if it has one.
+        '''
+        production = self.table.predictions.get(name, {}).get(terminal)
+        if production is None:
+            production = self.table.defaults.get(name)
+        return production
+
+    def _repeat(self, frame: _Frame) -> bool:
+        '''
+        Return whether a repeating rule continues with another repetition,
+        consuming the separator if it has one.
+        '''
+        production = frame.production
+        current = self.tokens.current.name
+        if production.separator is not None:
+            if current != production.separator:
+                return False
+            self.tokens.advance()
+            return True
+        return current in production.first
@@ -0,0 +1,200 @@
+from pytest import raises, mark, fixture
+
+from .parse import Parser, parse, AstNode, UnexpectedTokenError, EmptyGrammarError
+from plcc.load_spec.load_rough_spec.parse_rough import parse_rough
+from plcc.load_spec.load_rough_spec.split_rough_spec import split_rough_spec
+from plcc.load_spec.parse_spec.parse_lexical_spec import parse_lexical_spec
+from plcc.load_spec.parse_spec.parse_syntactic_spec import parse_syntactic_spec
+
+
+GRAMMAR = '''\
+skip WHITESPACE '\\s+'
+LIT '\\d+'
+LPAREN '\\('
+RPAREN '\\)'
+COMMA ','
+ADDOP '\\+'
+%
+<program>        ::= <exp>
+<exp>:LitExp     ::= <LIT>
+<exp>:PrimappExp ::= <prim> LPAREN <rands> RPAREN
+<rands>          **= <exp> +COMMA
+<prim>:AddPrim   ::= ADDOP
+'''
+
+
+def test_parse_literal():
+    tree = makeParser().parse('3')
+    assert tree.className == 'Program'
+    assert tree.fields['exp'].className == 'LitExp'
+    assert tree.fields['exp'].fields['lit'].lexeme == '3'
+
+
+def test_parse_nested():
+    tree = makeParser().parse('+(3, +(1, 2))')
+    exp = tree.fields['exp']
+    assert exp.className == 'PrimappExp'
+    assert exp.fields['prim'] == AstNode('AddPrim', {})
+    rands = exp.fields['rands'].fields['expList']
+    assert [r.className for r in rands] == ['LitExp', 'PrimappExp']
+
+
+def test_parse_empty_repetition():
+    tree = makeParser().parse('+()')
+    assert tree.fields['exp'].fields['rands'] == AstNode('Rands', {'expList': []})
+
+
+def test_repetition_without_separator():
+    parser = makeParser('A \'a\'\nskip WS \'\\s+\'\n%\n<as> **= <A>\n')
+    tree = parser.parse('a a a')
+    assert [t.lexeme for t in tree.fields['aList']] == ['a', 'a', 'a']
+
+
+def test_deep_nesting_does_not_exhaust_stack():
+    depth = 5000
+    tree = makeParser().parse('+(' * depth + '1' + ')' * depth)
+    for _ in range(depth):
+        tree = tree.fields.get('exp') or tree.fields['expList'][0]
+        tree = tree.fields['rands']
+    assert tree.fields['expList'][0].className == 'LitExp'
+
+
+def test_unexpected_token_raises():
+    with raises(UnexpectedTokenError) as e:
+        makeParser().parse('+(3 3)')
+    assert e.value.token.lexeme == '3'
+    assert e.value.expected == {'RPAREN'}
+    assert e.value.line.number == 1
+
+
+def test_trailing_input_raises():
+    with raises(UnexpectedTokenError):
+        makeParser().parse('3 4')
+
+
+def test_parse_all_yields_each_program():
+    trees = list(makeParser().parseAll('3\n+(1)\n4'))
+    assert [t.fields['exp'].className for t in trees] == ['LitExp', 'PrimappExp', 'LitExp']
+
+
+def test_module_level_parse():
+    lexicalSpec, syntacticSpec = loadSpecs(GRAMMAR)
+    assert parse(lexicalSpec, syntacticSpec, '3').className == 'Program'
+
+
+def test_empty_grammar_raises():
+    with raises(EmptyGrammarError):
+        makeParser("A 'a'\n")
+
+
+def test_lazy_parse_equals_parse():
+    string = '+(3, +(1, 2))'
+    assert Parser(*loadSpecs(GRAMMAR), lazy=True).parse(string) == makeParser().parse(string)
+
+
+def test_chunked_parse_equals_parse():
+    string = '+(3,\n +(1, 2))\n4'
+    chunked = Parser(*loadSpecs(GRAMMAR), chunkSize=4)
+    assert list(chunked.parseAll(string)) == list(makeParser().parseAll(string))
+
+
+def makeParser(grammar=GRAMMAR):
+    return Parser(*loadSpecs(grammar))
+
+
+def loadSpecs(grammar):
+    roughSpec = split_rough_spec(list(parse_rough(grammar)))
+    return (
+        parse_lexical_spec(roughSpec.lexicalSection),
+        parse_syntactic_spec(roughSpec.syntacticSection),
+    )
+
+
+RECOVERY_GRAMMAR = '''\
+skip WHITESPACE '\\s+'
+LIT '\\d+'
+VAR '[a-z]+'
+EQUALS '='
+SEMI ';'
+LBRACE '\\{'
+RBRACE '\\}'
+%
+<program>         ::= <stmts>
+<stmts>           **= <stmt>
+<stmt>:Assign     ::= <VAR> EQUALS <exp> SEMI
+<stmt>:Block      ::= LBRACE <stmts> RBRACE
+<exp>:LitExp      ::= <LIT>
+<exp>:VarExp      ::= <VAR>
+'''
+
+
+def test_recovering_valid_program_has_no_errors():
+    result = makeParser(RECOVERY_GRAMMAR).parseRecovering('a = 1; { b = a; }')
+    assert result.errorList == []
+    assert len(result.treeList) == 1
+
+
+def test_recovering_reports_every_error_with_line_numbers():
+    program = '\n'.join([
+        'a = 1;',
+        'b = = 2;',
+        'c = 3;',
+        'd = 4 5;',
+        '{ e = ; }',
+        'f = 6;',
+    ])
+    result = makeParser(RECOVERY_GRAMMAR).parseRecovering(program)
+    assert [e.line.number for e in result.errorList] == [2, 4, 5]
+    assert [e.token.lexeme for e in result.errorList] == ['=', '5', ';']
+
+
+def test_recovering_keeps_the_good_statements():
+    result = makeParser(RECOVERY_GRAMMAR).parseRecovering('a = 1; b = ; c = = 3;')
+    stmts = result.treeList[0].fields['stmts'].fields['stmtList']
+    assert [s.fields['var'].lexeme for s in stmts] == ['a', 'b', 'c']
+    assert stmts[1].fields['exp'] is None
+    assert stmts[2].fields['exp'].fields['lit'].lexeme == '3'
+
+
+def test_recovering_from_unpredictable_start():
+    result = makeParser().parseRecovering(') 3')
+    assert [e.token.lexeme for e in result.errorList] == [')']
+    assert [t.fields['exp'].className for t in result.treeList] == ['LitExp']
+
+
+def test_recovering_at_end_of_input():
+    result = makeParser().parseRecovering('+(1, 2')
+    assert [e.token.name for e in result.errorList] == ['$EOF']
+    assert len(result.treeList) == 1
+
+
+NULLABLE_GRAMMAR = '''\
+skip WHITESPACE '\\s+'
+LIT '\\d+'
+VAR '[a-z]+'
+EQUALS '='
+SEMI ';'
+%
+<program>         ::= <stmts>
+<stmts>           **= <stmt>
+<stmt>            ::= <VAR> EQUALS <exp> <opt> SEMI
+<exp>:LitExp      ::= <LIT>
+<exp>:VarExp      ::= <VAR>
+<opt>:Some        ::= EQUALS <LIT>
+<opt>:None        ::=
+'''
+
+
+def test_recovering_takes_the_nullable_production():
+    result = makeParser(NULLABLE_GRAMMAR).parseRecovering('a = ; b = 1; c = = 2;')
+    assert [e.token.lexeme for e in result.errorList] == [';', '=']
+    stmts = result.treeList[0].fields['stmts'].fields['stmtList']
+    assert [s.fields['opt'].className for s in stmts] == ['None', 'None', 'Some']
+
+
+def test_error_after_nullable_production_is_at_the_unexpected_token():
+    with raises(UnexpectedTokenError) as info:
+        makeParser(NULLABLE_GRAMMAR).parse('a = 1\n2;')
+    assert info.value.line.number == 2
+    assert info.value.token.lexeme == '2'
+    assert info.value.expected == {'SEMI'}
@@ -0,0 +1,123 @@
+from dataclasses import dataclass
+import re
+
+from plcc.load_spec.load_rough_spec.parse_lines import Line, parse_lines
+from plcc.load_spec.parse_spec.parse_lexical_spec import LexicalSpec, LexicalRule
+from plcc.load_spec.analyze_spec.compute_first_follow import END_OF_INPUT
+
+
+ERROR = '$ERROR'
+
+
+@dataclass(frozen=True)
+class Token:
+    name: str
+    lexeme: str
+    line: Line
+
+
+class LazyToken:
+    '''
+    A Token that refers to the scanned text of its line and its span in
+    that text instead of holding a copy of its lexeme. The text is
+    shared by every token of the line, and the lexeme is sliced from it
+    only when it is read. It equals the Token with the same name, lexeme
+    and line.
+    '''
+    __slots__ = ('name', 'text', 'start', 'end', 'line')
+
+    def __init__(self, name: str, text: str, start: int, end: int, line: Line):
+        self.name = name
+        self.text = text
+        self.start = start
+        self.end = end
+        self.line = line
+
+    @property
+    def lexeme(self) -> str:
+        return self.text[self.start:self.end]
+
+    def __eq__(self, other):
+        if not isinstance(other, (Token, LazyToken)):
+            return NotImplemented
+        return (self.name, self.lexeme, self.line) == (other.name, other.lexeme, other.line)
+
+    def __hash__(self):
+        return hash((self.name, self.lexeme, self.line))
+
+    def __repr__(self):
+        return f'LazyToken(name={self.name!r}, lexeme={self.lexeme!r}, line={self.line!r})'
+
+
+def scan(lexicalSpec: LexicalSpec, string: str, file=None, lazy: bool = False):
+    '''
+    Yield the Tokens in string, ending with a single END_OF_INPUT Token.
+    '''
+    return Scanner(lexicalSpec, lazy).scan(string, file=file)
+
+
+class Scanner:
+    '''
+    Matches tokens the same way the generated Java Scan class does:
+    each line is scanned separately (with a newline appended), skips
+    listed before a token are consumed, the longest token match wins,
+    and ties go to the token listed first. A character that starts no
+    match becomes an ERROR Token.
+
+    A Scanner compiles its patterns once, so reuse it to scan many inputs.
+
+    If lazy is True, matched tokens are LazyTokens, so scanning copies
+    no lexemes; a lexeme is copied only if it is read (e.g., when only
+    some tokens are captured, or only errors are reported).
+    '''
+    def __init__(self, lexicalSpec: LexicalSpec, lazy: bool = False):
+        self.ruleList = [
+            (rule.name, rule.isSkip, re.compile(rule.pattern))
+            for rule in lexicalSpec.ruleList
+            if isinstance(rule, LexicalRule)
+        ]
+        self.lazy = lazy
+
+    def scan(self, string: str, file=None):
+        last = Line(string='', number=0, file=file)
+        for line in parse_lines(string, file=file):
+            yield from self._scanLine(line)
+            last = line
+        yield Token(name=END_OF_INPUT, lexeme='!EOF', line=last)
+
+    def _scanLine(self, line: Line):
+        text = line.string + '\n'
+        start = 0
+        end = len(text)
+        while start < end:
+            name, matchEnd, skipEnd = self._matchAt(text, start)
+            if skipEnd is not None:
+                start = skipEnd
+            elif name is None:
+                yield Token(name=ERROR, lexeme=self._describeError(text[start]), line=line)
+                start += 1
+            elif self.lazy:
+                yield LazyToken(name, text, start, matchEnd, line)
+                start = matchEnd
+            else:
+                yield Token(name=name, lexeme=text[start:matchEnd], line=line)
+                start = matchEnd
+
+    def _matchAt(self, text: str, start: int) -> tuple[str | None, int, int | None]:
+        name, matchEnd = None, start
+        for ruleName, isSkip, pattern in self.ruleList:
+            if isSkip and name is not None:
+                continue
+            m = pattern.match(text, start)
+            if m is None or m.end() == start:
+                continue
+            if isSkip:
+                return None, start, m.end()
+            if matchEnd < m.end():
+                name, matchEnd = ruleName, m.end()
+        return name, matchEnd, None
+
+    def _describeError(self, ch: str) -> str:
+        if ' ' <= ch <= '~':
+            return f'!ERROR("{ch}")'
+        return f'!ERROR(\\u{ord(ch):04x})'
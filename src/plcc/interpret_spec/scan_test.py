@@ -0,0 +1,82 @@
+from pytest import raises, mark, fixture
+
+from .scan import scan, Token, LazyToken, ERROR
+from plcc.load_spec.load_rough_spec.parse_lines import Line, parse_lines
+from plcc.load_spec.parse_spec.parse_lexical_spec import parse_lexical_spec
+from plcc.load_spec.analyze_spec.compute_first_follow import END_OF_INPUT
+
+
+def test_empty_yields_eof():
+    assert names(scanWith(["A 'a'"], '')) == [END_OF_INPUT]
+
+
+def test_tokens():
+    assert lexemes(scanWith(["A 'a'", "B 'b'"], 'ab')) == ['a', 'b', '!EOF']
+
+
+def test_skips_are_consumed():
+    assert names(scanWith(["skip WS '\\s+'", "A 'a'"], ' a  a ')) == ['A', 'A', END_OF_INPUT]
+
+
+def test_longest_match_wins():
+    assert names(scanWith(["IF 'if'", "VAR '[a-z]+'"], 'iffy')) == ['VAR', END_OF_INPUT]
+
+
+def test_tie_goes_to_first_listed():
+    assert names(scanWith(["IF 'if'", "VAR '[a-z]+'"], 'if')) == ['IF', END_OF_INPUT]
+
+
+def test_skip_after_token_is_ignored():
+    assert names(scanWith(["A 'a'", "skip S 'a+'"], 'aa')) == ['A', 'A', END_OF_INPUT]
+
+
+def test_unmatched_character_is_error():
+    tokens = scanWith(["A 'a'"], 'a?a')
+    assert names(tokens) == ['A', ERROR, 'A', END_OF_INPUT]
+    assert tokens[1].lexeme == '!ERROR("?")'
+
+
+def test_tokens_know_their_line():
+    tokens = scanWith(["skip WS '\\s+'", "A 'a'"], 'a\n\na', file='f')
+    assert tokens[0].line == Line('a', 1, 'f')
+    assert tokens[1].line == Line('a', 3, 'f')
+    assert tokens[2].line == Line('a', 3, 'f')
+
+
+def test_newline_is_matchable():
+    assert names(scanWith(["NL '\\n'"], '\n\n', skipNewlines=False)) == ['NL', 'NL', END_OF_INPUT]
+
+
+def test_unskipped_newline_is_error():
+    assert names(scanWith(["A 'a'"], 'a', skipNewlines=False)) == ['A', ERROR, END_OF_INPUT]
+
+
+def test_lazy_tokens_equal_tokens():
+    rules = ["skip WS '\\s+'", "IF 'if'", "VAR '[a-z]+'"]
+    string = 'if iffy ?\nx'
+    lazy = scanWith(rules, string, file='f', lazy=True)
+    assert lazy == scanWith(rules, string, file='f')
+    assert [type(t) for t in lazy] == [LazyToken, LazyToken, Token, LazyToken, Token]
+
+
+def test_lazy_tokens_share_their_line():
+    tokens = scanWith(["skip WS '\\s+'", "A 'a+'"], 'aa a')
+    lazy = scanWith(["skip WS '\\s+'", "A 'a+'"], 'aa a', lazy=True)
+    assert lazy[0].text is lazy[1].text
+    assert (lazy[1].start, lazy[1].end, lazy[1].lexeme) == (3, 4, 'a')
+    assert hash(lazy[0]) == hash(tokens[0])
+
+
+def scanWith(rules, string, file=None, skipNewlines=True, lazy=False):
+    if skipNewlines:
+        rules = rules + ["skip NEWLINE '\\n'"]
+    lexicalSpec = parse_lexical_spec(list(parse_lines('\n'.join(rules))))
+    return list(scan(lexicalSpec, string, file=file, lazy=lazy))
+
+
+def names(tokens):
+    return [t.name for t in tokens]
+
+
+def lexemes(tokens):
+    return [t.lexeme for t in tokens]
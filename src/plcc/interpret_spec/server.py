@@ -0,0 +1,96 @@
+import json
+import sys
+
+from plcc.load_spec import load_spec
+
+from .parse import Parser
+
+
+class Server:
+    '''
+    Evaluates many programs with one Parser, so the scanner patterns and
+    the parse table are built once instead of once per program.
+
+    Requests and responses are JSON objects, one per line (JSON Lines).
+    A request is {"id": ..., "program": "...", "file": ...}, where id and
+    file are optional. Its response is
+
+        {"id": ..., "ok": true/false, "programs": N, "errors": [...]}
+
+    where N is the number of programs parsed from the request's program
+    string (like Parse, which parses programs until end of input), and
+    each error is {"line": ..., "message": ...}. Responses are written in
+    request order, and flushed after each one.
+
+    A line that is not a valid request (not a JSON object, or without a
+    "program" string), or whose evaluation fails, gets the response
+
+        {"id": ..., "ok": false, "error": "..."}
+
+    and the requests after it are still served.
+    '''
+    def __init__(self, parser: Parser):
+        self.parser = parser
+
+    def serve(self, input, output):
+        for line in input:
+            if not line.strip():
+                continue
+            output.write(json.dumps(self.respond(line)) + '\n')
+            output.flush()
+
+    def respond(self, line: str) -> dict:
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            return {'id': None, 'ok': False, 'error': f'Invalid JSON: {e}'}
+        if not isinstance(request, dict):
+            return {'id': None, 'ok': False, 'error': 'A request must be a JSON object.'}
+        if not isinstance(request.get('program'), str):
+            return {'id': request.get('id'), 'ok': False, 'error': 'A request must have a "program" string.'}
+        try:
+            return self.evaluate(request)
+        except Exception as e:
+            return {'id': request.get('id'), 'ok': False, 'error': f'{type(e).__name__}: {e}'}
+
+    def evaluate(self, request: dict) -> dict:
+        result = self.parser.parseRecovering(request['program'], file=request.get('file'))
+        return {
+            'id': request.get('id'),
+            'ok': not result.errorList,
+            'programs': len(result.treeList),
+            'errors': [
+                {'line': error.line.number, 'message': str(error)}
+                for error in result.errorList
+            ],
+        }
+
+
+def serve(file, input=sys.stdin, output=sys.stdout):
+    '''
+    Load the spec in file and serve requests from input until it ends.
+    Returns the spec's errors, without serving, if there are any.
+
+    Responses only report errors, which read the lexeme of a single
+    token, so the parser's tokens are lazy (see Scanner).
+    '''
+    spec = load_spec(file)
+    if spec.errorList:
+        return spec.errorList
+    Server(Parser(spec.lexicalSpec, spec.syntacticSpec, lazy=True)).serve(input, output)
+    return []
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print('usage: python -m plcc.interpret_spec.server SPEC', file=sys.stderr)
+        return 2
+    errorList = serve(argv[0])
+    for error in errorList:
+        print(f'{error.line.number}: {error.message}', file=sys.stderr)
+    return 1 if errorList else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
+
+
+def evaluate_programs(file, programs: list[str], processes: int = os.cpu_count() or 1) -> list[dict]:
+    with ServerPool(file, processes) as pool:
+        return pool.evaluate(programs)
+
+
+class ServerPool:
+    '''
+    Starts processes servers (see server.Server) for the spec in file and
+    fans requests out across them. Each server loads the spec once and
+    then evaluates every program it is sent.
+
+    Use it as a context manager, or call close() to stop the servers.
+    '''
+    def __init__(self, file, processes: int = os.cpu_count() or 1):
+        self.processes = [self._start(file) for _ in range(max(1, processes))]
+
+    def _start(self, file) -> subprocess.Popen:
+        environment = dict(os.environ)
+        packageRoot = str(Path(__file__).resolve().parents[2])
+        environment['PYTHONPATH'] = os.pathsep.join(filter(None, [packageRoot, environment.get('PYTHONPATH')]))
+        return subprocess.Popen(
+            [sys.executable, '-m', 'plcc.interpret_spec.server', str(file)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            env=environment,
+        )
+
+    def evaluate(self, programs: list[str]) -> list[dict]:
+        '''
+        Return the response for each program, in the order given.
+        Program i is sent to server i mod the number of servers.
+        '''
+        programs = list(programs)
+        count = len(self.processes)
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [
+                executor.submit(self._evaluateOn, process, list(range(i, len(programs), count)), programs)
+                for i, process in enumerate(self.processes)
+            ]
+            results = [None] * len(programs)
+            for future in futures:
+                for response in future.result():
+                    results[response['id']] = response
+        return results
+
+    def _evaluateOn(self, process: subprocess.Popen, ids: list[int], programs: list[str]) -> list[dict]:
+        # Requests are written from another thread so that neither side
+        # blocks on a full pipe while the other is waiting to write.
+        writer = Thread(target=self._writeRequests, args=(process, ids, programs))
+        writer.start()
+        responses = []
+        for _ in ids:
+            line = process.stdout.readline()
+            if not line:
+                raise ServerError(process.wait())
+            responses.append(json.loads(line))
+        writer.join()
+        return responses
+
+    def _writeRequests(self, process: subprocess.Popen, ids: list[int], programs: list[str]):
+        try:
+            for i in ids:
+                process.stdin.write(json.dumps({'id': i, 'program': programs[i]}) + '\n')
+            process.stdin.flush()
+        except BrokenPipeError:
+            pass
+
+    def close(self):
+        for process in self.processes:
+            process.stdin.close()
+        for process in self.processes:
+            process.wait()
+            process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ServerError(Exception):
+    def __init__(self, returncode):
+        self.returncode = returncode
+        super().__init__(f'server exited with status {returncode}')
@@ -0,0 +1,31 @@
+from pytest import raises
+
+from .server_pool import ServerPool, ServerError, evaluate_programs
+from .server_test import SPEC
+
+
+def test_results_in_program_order(tmp_path):
+    programs = ['(1)', '(2', '(3) (4)', '', '5']
+    results = evaluate_programs(writeSpec(tmp_path), programs, processes=2)
+    assert [r['id'] for r in results] == [0, 1, 2, 3, 4]
+    assert [r['ok'] for r in results] == [True, False, True, True, False]
+    assert [r['programs'] for r in results] == [1, 1, 2, 0, 0]
+
+
+def test_pool_is_reusable(tmp_path):
+    with ServerPool(writeSpec(tmp_path), 3) as pool:
+        assert [r['ok'] for r in pool.evaluate(['(1)'])] == [True]
+        assert len(pool.evaluate(['(1)'] * 100)) == 100
+
+
+def test_server_that_cannot_load_spec(tmp_path):
+    file = tmp_path / 'spec'
+    file.write_text(SPEC + '<unused> ::= LIT\n')
+    with raises(ServerError):
+        evaluate_programs(file, ['(1)'], processes=1)
+
+
+def writeSpec(tmp_path):
+    file = tmp_path / 'spec'
+    file.write_text(SPEC)
+    return file
@@ -0,0 +1,103 @@
+from io import StringIO
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+from pytest import mark
+
+from .server import Server, serve, main
+from .parse import Parser
+from plcc.load_spec.load_rough_spec.parse_rough import parse_rough
+from plcc.load_spec.load_rough_spec.split_rough_spec import split_rough_spec
+from plcc.load_spec.parse_spec.parse_lexical_spec import parse_lexical_spec
+from plcc.load_spec.parse_spec.parse_syntactic_spec import parse_syntactic_spec
+
+
+SPEC = '''\
+skip WHITESPACE '\\s+'
+LIT '\\d+'
+LPAREN '\\('
+RPAREN '\\)'
+%
+<program> ::= LPAREN <LIT> RPAREN
+'''
+
+def test_one_response_per_request_in_order():
+    responses = runServer([
+        {'id': 'a', 'program': '(1) (2)'},
+        {'id': 'b', 'program': '(3'},
+        {'program': ''},
+    ])
+    assert responses == [
+        {'id': 'a', 'ok': True, 'programs': 2, 'errors': []},
+        {'id': 'b', 'ok': False, 'programs': 1, 'errors': [
+            {'line': 1, 'message': '1: expected RPAREN, got $EOF "!EOF"'},
+        ]},
+        {'id': None, 'ok': True, 'programs': 0, 'errors': []},
+    ]
+
+
+def test_blank_request_lines_are_ignored():
+    output = StringIO()
+    makeServer().serve(StringIO('\n{"id": 1, "program": "(1)"}\n\n'), output)
+    assert output.getvalue().count('\n') == 1
+
+
+def test_invalid_json_is_answered_and_later_requests_served():
+    output = StringIO()
+    makeServer().serve(StringIO('{"id": 1, \n{"id": 2, "program": "(1)"}\n'), output)
+    responses = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert responses[0]['id'] is None and not responses[0]['ok']
+    assert responses[0]['error'].startswith('Invalid JSON')
+    assert responses[1] == {'id': 2, 'ok': True, 'programs': 1, 'errors': []}
+
+
+def test_request_without_program_is_answered_and_later_requests_served():
+    responses = runServer([{'id': 2}, {'id': 3, 'program': '(1)'}])
+    assert responses == [
+        {'id': 2, 'ok': False, 'error': 'A request must have a "program" string.'},
+        {'id': 3, 'ok': True, 'programs': 1, 'errors': []},
+    ]
+
+
+def test_serve_spec_file(tmp_path):
+    file = tmp_path / 'spec'
+    file.write_text(SPEC)
+    output = StringIO()
+    assert serve(str(file), StringIO('{"id": 1, "program": "(1)"}\n'), output) == []
+    assert json.loads(output.getvalue())['ok']
+
+
+def test_main_reports_spec_errors(tmp_path, capsys):
+    file = tmp_path / 'spec'
+    file.write_text(SPEC + '<unused> ::= LIT\n')
+    assert main([str(file)]) == 1
+    assert 'Unreachable nonterminal <unused>' in capsys.readouterr().err
+
+
+def test_main_reports_grammar_that_is_not_ll1(notLL1Spec, capsys):
+    assert main([str(notLL1Spec)]) == 1
+    assert capsys.readouterr().err == '5: Conflict on A for <s> (More than one of its rules can start with A; the grammar is not LL(1)).\n'
+
+
+@mark.parametrize('module', ['plcc.interpret_spec.server', 'plcc.interpret_spec.emit_json_ast'])
+def test_runs_as_module_without_warnings(module):
+    environment = dict(os.environ, PYTHONPATH=str(Path(__file__).resolve().parents[2]))
+    result = subprocess.run([sys.executable, '-m', module], capture_output=True, text=True, env=environment)
+    assert result.stderr.startswith('usage:')
+
+
+def runServer(requests: list[dict]) -> list[dict]:
+    output = StringIO()
+    makeServer().serve(StringIO(''.join(json.dumps(r) + '\n' for r in requests)), output)
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def makeServer():
+    roughSpec = split_rough_spec(list(parse_rough(SPEC)))
+    return Server(Parser(
+        parse_lexical_spec(roughSpec.lexicalSection),
+        parse_syntactic_spec(roughSpec.syntacticSection)
+    ))
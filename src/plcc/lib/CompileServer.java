@@ -0,0 +1,198 @@
+import java.io.*;
+import java.net.*;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.*;
+import java.nio.file.attribute.PosixFilePermissions;
+import java.security.MessageDigest;
+import java.security.SecureRandom;
+import java.util.*;
+import java.util.concurrent.*;
+import javax.tools.*;
+
+// A long-lived Java compiler that plccmk talks to over a local socket,
+// so that each build does not pay for starting and warming up a JVM.
+//
+// Usage: java CompileServer.java PORT ROOT TOKEN_FILE
+//
+// The server only compiles in directories under ROOT, and only for
+// clients that can read TOKEN_FILE: at startup it writes a random token
+// there, readable only by its owner, and each request must start with
+// it. Annotation processing is off (-proc:none), so compiling does not
+// run code from the class path.
+//
+// Each connection carries one request:
+//     the token
+//     the absolute path of the directory to compile in
+//     the class path (relative entries are resolved against that directory)
+//     one source file per line (relative to that directory)
+//     an empty line
+// The server compiles the sources into that directory and replies with
+// the compiler's diagnostics followed by a line that is OK or FAILED.
+//
+// Connections are handled by a pool of WORKERS threads, and a client that
+// sends nothing for READ_TIMEOUT_MILLIS is dropped, so a client that
+// stalls does not hold up other builds. Requests are still compiled one
+// at a time, since they share the file manager, which is reused across
+// requests so the jars on the class path stay open and indexed. The
+// diagnostics are buffered, so a client that reads slowly does not hold
+// up the compiler either.
+
+public class CompileServer {
+
+    private static final int WORKERS = 4;
+    private static final int READ_TIMEOUT_MILLIS = 10000;
+
+    private final ExecutorService workers = Executors.newFixedThreadPool(WORKERS);
+    private final JavaCompiler compiler;
+    private final StandardJavaFileManager fileManager;
+    private final Path root;
+    private final byte [] token;
+
+    public CompileServer(Path root, Path tokenFile) throws IOException {
+        compiler = ToolProvider.getSystemJavaCompiler();
+        if (compiler == null)
+            throw new IllegalStateException("no Java compiler available (a JDK is required)");
+        fileManager = compiler.getStandardFileManager(null, null, StandardCharsets.UTF_8);
+        this.root = root.toRealPath();
+        this.token = writeToken(tokenFile);
+    }
+
+    public static void main(String [] args) throws IOException {
+        if (args.length != 3) {
+            System.err.println("usage: java CompileServer.java PORT ROOT TOKEN_FILE");
+            System.exit(2);
+        }
+        int port = Integer.parseInt(args[0]);
+        new CompileServer(Paths.get(args[1]), Paths.get(args[2])).serve(port);
+    }
+
+    // Write a new random token to file, readable and writable only by
+    // its owner, and return it.
+    private static byte [] writeToken(Path file) throws IOException {
+        byte [] bytes = new byte[32];
+        new SecureRandom().nextBytes(bytes);
+        StringBuilder hex = new StringBuilder();
+        for (byte b : bytes)
+            hex.append(String.format("%02x", b));
+        Files.deleteIfExists(file);
+        try {
+            Files.createFile(file, PosixFilePermissions.asFileAttribute(
+                PosixFilePermissions.fromString("rw-------")));
+        } catch (UnsupportedOperationException e) {
+            File f = Files.createFile(file).toFile();
+            f.setReadable(false, false);
+            f.setWritable(false, false);
+            f.setReadable(true, true);
+            f.setWritable(true, true);
+        }
+        Files.write(file, (hex + "\n").getBytes(StandardCharsets.UTF_8));
+        return hex.toString().getBytes(StandardCharsets.UTF_8);
+    }
+
+    public void serve(int port) throws IOException {
+        InetAddress loopback = InetAddress.getLoopbackAddress();
+        try (ServerSocket server = new ServerSocket(port, 50, loopback)) {
+            System.err.println("CompileServer listening on " + loopback.getHostAddress() + ":" + port
+                + " for directories under " + root);
+            while (true) {
+                try {
+                    Socket socket = server.accept();
+                    workers.execute(() -> handleClient(socket));
+                } catch (IOException e) {
+                    System.err.println(e.getMessage());
+                }
+            }
+        }
+    }
+
+    private void handleClient(Socket socket) {
+        try (Socket client = socket) {
+            client.setSoTimeout(READ_TIMEOUT_MILLIS);
+            handle(client);
+        } catch (IOException e) {
+            System.err.println(e.getMessage());
+        }
+    }
+
+    private void handle(Socket socket) throws IOException {
+        BufferedReader in = new BufferedReader(
+            new InputStreamReader(socket.getInputStream(), StandardCharsets.UTF_8));
+        PrintWriter out = new PrintWriter(
+            new OutputStreamWriter(socket.getOutputStream(), StandardCharsets.UTF_8), true);
+        String clientToken = in.readLine();
+        if (clientToken == null
+                || !MessageDigest.isEqual(token, clientToken.getBytes(StandardCharsets.UTF_8))) {
+            out.println("invalid token");
+            out.println("FAILED");
+            return;
+        }
+        String dir = in.readLine();
+        String classPath = in.readLine();
+        List<File> sources = new ArrayList<File>();
+        String line;
+        while ((line = in.readLine()) != null && !line.isEmpty())
+            sources.add(new File(dir, line));
+        if (dir == null || classPath == null || sources.isEmpty()) {
+            out.println("malformed request");
+            out.println("FAILED");
+            return;
+        }
+        if (!isAllowed(Paths.get(dir), sources)) {
+            out.println("directory is not under " + root);
+            out.println("FAILED");
+            return;
+        }
+        StringWriter diagnostics = new StringWriter();
+        boolean ok = compile(new File(dir), classPath, sources, new PrintWriter(diagnostics, true));
+        out.print(diagnostics);
+        out.println(ok ? "OK" : "FAILED");
+    }
+
+    // The directory, and every source in it, must be under root once
+    // symbolic links and .. are resolved.
+    private boolean isAllowed(Path dir, List<File> sources) {
+        try {
+            Path realDir = dir.toRealPath();
+            if (!realDir.startsWith(root))
+                return false;
+            for (File source : sources) {
+                if (!source.toPath().toRealPath().startsWith(realDir))
+                    return false;
+            }
+            return true;
+        } catch (IOException e) {
+            return false;
+        }
+    }
+
+    public synchronized boolean compile(File dir, String classPath, List<File> sources, PrintWriter out) {
+        List<String> options = Arrays.asList(
+            "-proc:none",
+            "-d", dir.getPath(),
+            "-cp", resolveClassPath(dir, classPath));
+        Iterable<? extends JavaFileObject> units = fileManager.getJavaFileObjectsFromFiles(sources);
+        try {
+            return compiler.getTask(out, fileManager, null, options, null, units).call();
+        } catch (RuntimeException e) {
+            out.println(e.getMessage());
+            return false;
+        } finally {
+            try {
+                fileManager.flush();
+            } catch (IOException e) {
+                out.println(e.getMessage());
+            }
+        }
+    }
+
+    private static String resolveClassPath(File dir, String classPath) {
+        StringJoiner result = new StringJoiner(File.pathSeparator);
+        for (String entry : classPath.split(File.pathSeparator)) {
+            if (entry.isEmpty())
+                continue;
+            File file = new File(entry);
+            result.add(file.isAbsolute() ? entry : new File(dir, entry).getPath());
+        }
+        return result.toString();
+    }
+}
@@ -0,0 +1 @@
+from .load_spec import Spec, SpecLoader, load_spec
@@ -0,0 +1,6 @@
+from .compute_first_follow import FirstFollow, compute_first_follow, END_OF_INPUT
+from .index_syntactic_spec import SyntacticIndex, index_syntactic_spec
+from .find_left_recursion import LeftRecursion, find_left_recursion, find_nullable
+from .find_common_prefixes import CommonPrefix, find_common_prefixes
+from .index_semantic_spec import CodeFragmentIndex, index_semantic_spec, index_semantic_specs
+from .find_ll1_conflicts import LL1Conflict, find_ll1_conflicts
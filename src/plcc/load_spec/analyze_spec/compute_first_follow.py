@@ -0,0 +1,129 @@
+from dataclasses import dataclass, field
+
+from ..parse_spec.parse_syntactic_spec.structs import (
+    SyntacticSpec,
+    SyntacticRule,
+    RepeatingSyntacticRule,
+    RhsNonTerminal,
+    Symbol,
+)
+
+
+END_OF_INPUT = '$EOF'
+
+
+@dataclass
+class FirstFollow:
+    start: str | None = None
+    nullable: set[str] = field(default_factory=set)
+    first: dict[str, set[str]] = field(default_factory=dict)
+    follow: dict[str, set[str]] = field(default_factory=dict)
+
+    def firstOfSequence(self, symbols: list[Symbol]) -> tuple[set[str], bool]:
+        '''
+        Return the FIRST set of a sequence of RHS symbols and whether the
+        whole sequence can derive the empty string.
+        '''
+        result = set()
+        for symbol in symbols:
+            if not isinstance(symbol, RhsNonTerminal):
+                result.add(symbol.name)
+                return result, False
+            result |= self.first.get(symbol.name, set())
+            if symbol.name not in self.nullable:
+                return result, False
+        return result, True
+
+    def predict(self, rule: SyntacticRule) -> set[str]:
+        '''
+        Return the terminals that select rule when its LHS is predicted. A
+        repeating rule is selected by the FIRST set of its RHS; it is
+        skipped at any other token.
+        '''
+        first, nullable = self.firstOfSequence(rule.rhsSymbolList)
+        if nullable and not isinstance(rule, RepeatingSyntacticRule):
+            return first | self.follow.get(rule.lhs.name, set())
+        return first
+
+
+def compute_first_follow(syntacticSpec: SyntacticSpec) -> FirstFollow:
+    return FirstFollowCalculator(syntacticSpec).compute()
+
+
+class FirstFollowCalculator:
+    def __init__(self, syntacticSpec: SyntacticSpec):
+        self.rules = list(syntacticSpec) if syntacticSpec else []
+        self.result = FirstFollow()
+        self.changed = False
+
+    def compute(self) -> FirstFollow:
+        if not self.rules:
+            return self.result
+        self._initialize()
+        self._computeNullableAndFirst()
+        self._computeFollow()
+        return self.result
+
+    def _initialize(self):
+        self.result.start = self.rules[0].lhs.name
+        for rule in self.rules:
+            self.result.first.setdefault(rule.lhs.name, set())
+            self.result.follow.setdefault(rule.lhs.name, set())
+        self.result.follow[self.result.start].add(END_OF_INPUT)
+
+    def _computeNullableAndFirst(self):
+        self.changed = True
+        while self.changed:
+            self.changed = False
+            for rule in self.rules:
+                first, nullable = self.result.firstOfSequence(rule.rhsSymbolList)
+                self._addAll(self.result.first[rule.lhs.name], first)
+                if self._isNullable(rule, nullable):
+                    self._addNullable(rule.lhs.name)
+
+    def _isNullable(self, rule: SyntacticRule, bodyIsNullable: bool) -> bool:
+        return bodyIsNullable or isinstance(rule, RepeatingSyntacticRule)
+
+    def _addNullable(self, name: str):
+        if name not in self.result.nullable:
+            self.result.nullable.add(name)
+            self.changed = True
+
+    def _computeFollow(self):
+        self.changed = True
+        while self.changed:
+            self.changed = False
+            for rule in self.rules:
+                self._addFollowForRule(rule)
+
+    def _addFollowForRule(self, rule: SyntacticRule):
+        symbols = rule.rhsSymbolList
+        afterBody = self._getFollowOfBody(rule)
+        for i, symbol in enumerate(symbols):
+            if not isinstance(symbol, RhsNonTerminal):
+                continue
+            if symbol.name not in self.result.follow:
+                continue
+            first, nullable = self.result.firstOfSequence(symbols[i+1:])
+            target = self.result.follow[symbol.name]
+            self._addAll(target, first)
+            if nullable:
+                self._addAll(target, afterBody)
+
+    def _getFollowOfBody(self, rule: SyntacticRule) -> set[str]:
+        '''
+        Return what may follow the RHS of rule. For a repeating rule, the
+        RHS may be followed by its separator or by another repetition.
+        '''
+        follow = self.result.follow[rule.lhs.name]
+        if not isinstance(rule, RepeatingSyntacticRule):
+            return follow
+        if rule.separator is not None:
+            return follow | {rule.separator.name}
+        first, _ = self.result.firstOfSequence(rule.rhsSymbolList)
+        return follow | first
+
+    def _addAll(self, target: set[str], source: set[str]):
+        if not source <= target:
+            target |= source
+            self.changed = True
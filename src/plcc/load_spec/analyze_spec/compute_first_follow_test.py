@@ -0,0 +1,62 @@
+from pytest import raises, mark, fixture
+
+from .compute_first_follow import compute_first_follow, END_OF_INPUT
+from ..load_rough_spec.parse_lines import parse_lines
+from ..parse_spec.parse_syntactic_spec import parse_syntactic_spec
+
+
+def test_None_computes_nothing():
+    result = compute_first_follow(None)
+    assert result.start is None
+    assert result.first == {}
+
+
+def test_start_is_first_lhs():
+    result = computeFrom('<prog> ::= A', '<other> ::= B')
+    assert result.start == 'prog'
+    assert result.follow['prog'] == {END_OF_INPUT}
+
+
+def test_first_of_terminals():
+    result = computeFrom('<prog> ::= A <B>')
+    assert result.first['prog'] == {'A'}
+
+
+def test_first_through_nonterminals():
+    result = computeFrom('<prog> ::= <exp>', '<exp>:Lit ::= <LIT>', '<exp>:Neg ::= MINUS <exp>')
+    assert result.first['prog'] == {'LIT', 'MINUS'}
+
+
+def test_empty_rule_is_nullable():
+    result = computeFrom('<prog> ::= <opt> A', '<opt> ::=')
+    assert 'opt' in result.nullable
+    assert 'prog' not in result.nullable
+    assert result.first['prog'] == {'A'}
+    assert result.follow['opt'] == {'A'}
+
+
+def test_repeating_rule_is_nullable():
+    result = computeFrom('<prog> ::= <items> END', '<items> **= ITEM')
+    assert 'items' in result.nullable
+    assert result.first['prog'] == {'ITEM', 'END'}
+
+
+def test_follow_inside_repetition_includes_separator():
+    result = computeFrom('<prog> ::= <items>', '<items> **= <item> +COMMA', '<item> ::= <ID>')
+    assert result.follow['item'] == {'COMMA', END_OF_INPUT}
+
+
+def test_follow_inside_repetition_includes_next_repetition():
+    result = computeFrom('<prog> ::= <items>', '<items> **= <item>', '<item> ::= <ID>')
+    assert result.follow['item'] == {'ID', END_OF_INPUT}
+
+
+def test_undefined_nonterminal_is_ignored():
+    result = computeFrom('<prog> ::= <missing> A')
+    assert result.first['prog'] == set()
+    assert 'missing' not in result.follow
+
+
+def computeFrom(*rules):
+    lines = list(parse_lines('%\n' + '\n'.join(rules)))
+    return compute_first_follow(parse_syntactic_spec(lines))
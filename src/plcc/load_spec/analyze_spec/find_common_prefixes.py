@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+
+from ..parse_spec.parse_syntactic_spec.structs import (
+    SyntacticSpec,
+    SyntacticRule,
+    RepeatingSyntacticRule,
+    Symbol,
+    CapturingTerminal,
+    RhsNonTerminal,
+)
+from ..parse_spec.parse_syntactic_spec.names import getClassName
+from .index_syntactic_spec import SyntacticIndex, index_syntactic_spec
+
+
+@dataclass
+class CommonPrefix:
+    '''
+    Alternatives of the same nonterminal whose RHSs start with the same
+    symbols, and a left-factored replacement for them. If the
+    alternatives are identical, isDuplicate is True and there is no
+    replacement to suggest.
+    '''
+    name: str
+    prefix: list[Symbol]
+    rules: list[SyntacticRule]
+    suggestion: list[str]
+    isDuplicate: bool = False
+
+
+def find_common_prefixes(syntacticSpec: SyntacticSpec | SyntacticIndex) -> list[CommonPrefix]:
+    index = syntacticSpec if isinstance(syntacticSpec, SyntacticIndex) else index_syntactic_spec(syntacticSpec)
+    return CommonPrefixFinder(index).find()
+
+
+class CommonPrefixFinder:
+    '''
+    Groups the alternatives of each nonterminal by their first symbol and
+    finds the longest prefix each group shares. Terminals are compared by
+    token name, so A and <A> match the same input. Each alternative is
+    examined once per symbol of its shared prefix.
+    '''
+    def __init__(self, index: SyntacticIndex):
+        self.index = index
+        self.usedNames = set(index.rulesByName)
+
+    def find(self) -> list[CommonPrefix]:
+        result = []
+        for name, rules in self.index.rulesByName.items():
+            if len(rules) < 2:
+                continue
+            for group in self._groupByFirstSymbol(rules):
+                result.append(self._makeCommonPrefix(name, group, len(group) == len(rules)))
+        return result
+
+    def _groupByFirstSymbol(self, rules: list[SyntacticRule]) -> list[list[SyntacticRule]]:
+        groups = {}
+        for rule in rules:
+            if isinstance(rule, RepeatingSyntacticRule) or not rule.rhsSymbolList:
+                continue
+            groups.setdefault(self._key(rule.rhsSymbolList[0]), []).append(rule)
+        return [group for group in groups.values() if len(group) > 1]
+
+    def _key(self, symbol: Symbol) -> tuple[bool, str]:
+        return (isinstance(symbol, RhsNonTerminal), symbol.name)
+
+    def _makeCommonPrefix(self, name: str, group: list[SyntacticRule], isWhole: bool) -> CommonPrefix:
+        length = self._getCommonPrefixLength(group)
+        prefix = group[0].rhsSymbolList[:length]
+        if all(len(rule.rhsSymbolList) == length for rule in group):
+            return CommonPrefix(name=name, prefix=prefix, rules=group, suggestion=[], isDuplicate=True)
+        return CommonPrefix(
+            name=name,
+            prefix=prefix,
+            rules=group,
+            suggestion=self._suggest(name, prefix, group, length, isWhole)
+        )
+
+    def _getCommonPrefixLength(self, group: list[SyntacticRule]) -> int:
+        first = group[0].rhsSymbolList
+        length = len(first)
+        for rule in group[1:]:
+            symbols = rule.rhsSymbolList
+            i = 1
+            while i < length and i < len(symbols) and self._key(symbols[i]) == self._key(first[i]):
+                i += 1
+            length = i
+        return length
+
+    def _suggest(self, name: str, prefix: list[Symbol], group: list[SyntacticRule], length: int, isWhole: bool) -> list[str]:
+        '''
+        The factored rule replaces the alternatives of the group. If they
+        are all the alternatives of name, it needs no alternative name;
+        otherwise it is named after the alternatives it replaces.
+        '''
+        rest = self._makeUniqueName(f'{name}Rest')
+        altName = '' if isWhole else ':' + 'Or'.join(getClassName(rule.lhs) for rule in group)
+        lines = [f'<{name}>{altName} ::= {self._present(prefix + [RhsNonTerminal(rest)])}'.rstrip()]
+        for rule in group:
+            altName = f':{rule.lhs.altName}' if rule.lhs.altName else ''
+            lines.append(f'<{rest}>{altName} ::= {self._present(rule.rhsSymbolList[length:])}'.rstrip())
+        return lines
+
+    def _makeUniqueName(self, base: str) -> str:
+        name, n = base, 1
+        while name in self.usedNames:
+            n += 1
+            name = f'{base}{n}'
+        self.usedNames.add(name)
+        return name
+
+    def _present(self, symbols: list[Symbol]) -> str:
+        return ' '.join(self._presentSymbol(s) for s in symbols)
+
+    def _presentSymbol(self, symbol: Symbol) -> str:
+        if isinstance(symbol, (CapturingTerminal, RhsNonTerminal)):
+            return f'<{symbol.name}>{symbol.altName or ""}'
+        return symbol.name
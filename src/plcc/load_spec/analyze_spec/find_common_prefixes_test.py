@@ -0,0 +1,58 @@
+from pytest import raises, mark, fixture
+
+from .find_common_prefixes import find_common_prefixes
+from ..load_rough_spec.parse_lines import parse_lines
+from ..parse_spec.parse_syntactic_spec import parse_syntactic_spec
+
+
+def test_no_rules_no_prefixes():
+    assert find_common_prefixes(None) == []
+
+
+def test_distinct_first_symbols():
+    assert findFrom('<exp>:A ::= A', '<exp>:B ::= B') == []
+
+
+def test_common_prefix_and_suggestion():
+    result = findFrom(
+        '<stmt>:If ::= IF <exp> THEN <stmt>',
+        '<stmt>:IfElse ::= IF <exp> THEN <stmt> ELSE <stmt>else',
+        '<stmt>:Print ::= PRINT <exp>',
+    )
+    assert len(result) == 1
+    assert result[0].name == 'stmt'
+    assert [s.name for s in result[0].prefix] == ['IF', 'exp', 'THEN', 'stmt']
+    assert result[0].suggestion == [
+        '<stmt>:IfOrIfElse ::= IF <exp> THEN <stmt> <stmtRest>',
+        '<stmtRest>:If ::=',
+        '<stmtRest>:IfElse ::= ELSE <stmt>else',
+    ]
+
+
+def test_captured_and_uncaptured_terminals_match():
+    result = findFrom('<a>:X ::= <ID> A', '<a>:Y ::= ID B')
+    assert len(result[0].prefix) == 1
+
+
+def test_several_groups():
+    result = findFrom('<a>:P ::= A B', '<a>:Q ::= A C', '<a>:R ::= D E', '<a>:S ::= D F', '<aRest> ::= Z')
+    assert [[r.lhs.altName for r in c.rules] for c in result] == [['P', 'Q'], ['R', 'S']]
+    assert result[0].suggestion[1].startswith('<aRest2>')
+    assert result[1].suggestion[1].startswith('<aRest3>')
+
+
+def test_all_alternatives_factored_keep_the_base_class():
+    result = findFrom('<a>:P ::= A B', '<a>:Q ::= A C')
+    assert result[0].suggestion[0] == '<a> ::= A <aRest>'
+
+
+def test_identical_alternatives_are_duplicates():
+    result = findFrom('<s>:X ::= A', '<s>:Y ::= <A>', '<s>:Z ::= B')
+    assert result[0].isDuplicate
+    assert result[0].suggestion == []
+    assert not findFrom('<s>:X ::= A', '<s>:Y ::= A B')[0].isDuplicate
+
+
+def findFrom(*rules):
+    lines = list(parse_lines('%\n' + '\n'.join(rules)))
+    return find_common_prefixes(parse_syntactic_spec(lines))
@@ -0,0 +1,165 @@
+from dataclasses import dataclass
+
+from ..parse_spec.parse_syntactic_spec.structs import (
+    SyntacticSpec,
+    SyntacticRule,
+    RepeatingSyntacticRule,
+    RhsNonTerminal,
+)
+from .index_syntactic_spec import SyntacticIndex, index_syntactic_spec
+
+
+@dataclass
+class LeftRecursion:
+    '''
+    A set of nonterminals that can each derive a sentential form starting
+    with one of the others (or itself), and the rules responsible.
+    '''
+    names: list[str]
+    rules: list[SyntacticRule]
+
+
+def find_left_recursion(syntacticSpec: SyntacticSpec | SyntacticIndex) -> list[LeftRecursion]:
+    index = syntacticSpec if isinstance(syntacticSpec, SyntacticIndex) else index_syntactic_spec(syntacticSpec)
+    return LeftRecursionFinder(index).find()
+
+
+def find_nullable(index: SyntacticIndex) -> set[str]:
+    '''
+    Return the names of the nonterminals that can derive the empty string.
+    Each rule counts the RHS symbols that are not yet known to be nullable;
+    a terminal or undefined nonterminal means the rule is never nullable.
+    Linear in the size of the grammar.
+    '''
+    remaining = {}
+    usedBy = {}
+    nullable = set()
+    worklist = []
+    for name, rules in index.rulesByName.items():
+        for rule in rules:
+            remaining[id(rule)] = _countBlockingSymbols(rule, index, usedBy)
+            if remaining[id(rule)] == 0 and name not in nullable:
+                nullable.add(name)
+                worklist.append(name)
+    while worklist:
+        name = worklist.pop()
+        for rule in usedBy.get(name, []):
+            remaining[id(rule)] -= 1
+            if remaining[id(rule)] == 0 and rule.lhs.name not in nullable:
+                nullable.add(rule.lhs.name)
+                worklist.append(rule.lhs.name)
+    return nullable
+
+
+def _countBlockingSymbols(rule: SyntacticRule, index: SyntacticIndex, usedBy: dict) -> int:
+    if isinstance(rule, RepeatingSyntacticRule):
+        return 0
+    count = 0
+    for symbol in rule.rhsSymbolList:
+        if not isinstance(symbol, RhsNonTerminal) or not index.isDefined(symbol.name):
+            return -1
+        count += 1
+    for symbol in rule.rhsSymbolList:
+        usedBy.setdefault(symbol.name, []).append(rule)
+    return count
+
+
+class LeftRecursionFinder:
+    '''
+    Builds the left-corner graph (an edge A -> B for each rule of A whose
+    RHS starts with B, possibly after nullable nonterminals) and finds its
+    strongly connected components with an iterative version of Tarjan's
+    algorithm. A component is left recursive if it has more than one
+    nonterminal or a nonterminal with an edge to itself.
+    '''
+    def __init__(self, index: SyntacticIndex):
+        self.index = index
+        self.nullable = find_nullable(index)
+        self.edges = {}
+        self.ruleCorners = {}
+        self.order = {name: i for i, name in enumerate(index.rulesByName)}
+
+    def find(self) -> list[LeftRecursion]:
+        self._buildLeftCornerGraph()
+        return [
+            self._makeLeftRecursion(component)
+            for component in self._findStronglyConnectedComponents()
+            if self._isRecursive(component)
+        ]
+
+    def _buildLeftCornerGraph(self):
+        for name, rules in self.index.rulesByName.items():
+            successors = self.edges.setdefault(name, [])
+            seen = set()
+            for rule in rules:
+                corners = list(self._getLeftCorners(rule))
+                self.ruleCorners[id(rule)] = corners
+                for corner in corners:
+                    if corner not in seen:
+                        seen.add(corner)
+                        successors.append(corner)
+
+    def _getLeftCorners(self, rule: SyntacticRule):
+        for symbol in rule.rhsSymbolList:
+            if not isinstance(symbol, RhsNonTerminal):
+                return
+            if self.index.isDefined(symbol.name):
+                yield symbol.name
+            if symbol.name not in self.nullable:
+                return
+
+    def _findStronglyConnectedComponents(self) -> list[list[str]]:
+        number = {}
+        lowLink = {}
+        onStack = set()
+        stack = []
+        components = []
+        for root in self.edges:
+            if root in number:
+                continue
+            work = [(root, iter(self.edges[root]))]
+            number[root] = lowLink[root] = len(number)
+            stack.append(root)
+            onStack.add(root)
+            while work:
+                name, successors = work[-1]
+                for successor in successors:
+                    if successor not in number:
+                        number[successor] = lowLink[successor] = len(number)
+                        stack.append(successor)
+                        onStack.add(successor)
+                        work.append((successor, iter(self.edges[successor])))
+                        break
+                    elif successor in onStack:
+                        lowLink[name] = min(lowLink[name], number[successor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowLink[parent] = min(lowLink[parent], lowLink[name])
+                    if lowLink[name] == number[name]:
+                        components.append(self._popComponent(name, stack, onStack))
+        return components
+
+    def _popComponent(self, name: str, stack: list[str], onStack: set[str]) -> list[str]:
+        component = []
+        while True:
+            member = stack.pop()
+            onStack.discard(member)
+            component.append(member)
+            if member == name:
+                return component
+
+    def _isRecursive(self, component: list[str]) -> bool:
+        return len(component) > 1 or component[0] in self.edges[component[0]]
+
+    def _makeLeftRecursion(self, component: list[str]) -> LeftRecursion:
+        members = set(component)
+        names = sorted(component, key=self.order.get)
+        rules = [
+            rule
+            for name in names
+            for rule in self.index.rulesByName[name]
+            if any(corner in members for corner in self.ruleCorners[id(rule)])
+        ]
+        return LeftRecursion(names=names, rules=rules)
@@ -0,0 +1,62 @@
+from pytest import raises, mark, fixture
+
+from .find_left_recursion import find_left_recursion, find_nullable
+from .index_syntactic_spec import index_syntactic_spec
+from ..load_rough_spec.parse_lines import parse_lines
+from ..parse_spec.parse_syntactic_spec import parse_syntactic_spec
+
+
+def test_no_rules_no_recursion():
+    assert find_left_recursion(None) == []
+
+
+def test_right_recursion_is_fine():
+    assert findFrom('<list>:More ::= A <list>', '<list>:Done ::=') == []
+
+
+def test_direct_left_recursion():
+    result = findFrom('<exp>:Sum ::= <exp> PLUS <LIT>', '<exp>:Lit ::= <LIT>')
+    assert [r.names for r in result] == [['exp']]
+    assert [r.line.string for r in result[0].rules] == ['<exp>:Sum ::= <exp> PLUS <LIT>']
+
+
+def test_indirect_left_recursion():
+    result = findFrom('<a> ::= <b> X', '<b> ::= <c> Y', '<c>:C ::= <a> Z', '<c>:D ::= W')
+    assert [r.names for r in result] == [['a', 'b', 'c']]
+    assert len(result[0].rules) == 3
+
+
+def test_left_recursion_through_nullable_prefix():
+    result = findFrom('<a> ::= <opt> <a> X', '<opt> ::=')
+    assert [r.names for r in result] == [['a']]
+
+
+def test_left_recursion_through_repeating_rule():
+    result = findFrom('<a> ::= <as> X', '<as> **= <a>')
+    assert [r.names for r in result] == [['a', 'as']]
+
+
+def test_nonnullable_prefix_stops_left_corner():
+    assert findFrom('<a> ::= <b> <a>', '<b> ::= B') == []
+
+
+def test_nullable():
+    index = indexFrom('<a> ::= <b> <c>', '<b> ::=', '<c> **= C', '<d> ::= <b> D', '<e> ::= <missing>')
+    assert find_nullable(index) == {'a', 'b', 'c'}
+
+
+def test_long_cycle():
+    n = 20000
+    rules = [f'<n{i}> ::= <n{i+1}> A' for i in range(n)] + [f'<n{n}> ::= <n0> A']
+    result = findFrom(*rules)
+    assert len(result) == 1
+    assert len(result[0].names) == n + 1
+
+
+def findFrom(*rules):
+    return find_left_recursion(indexFrom(*rules))
+
+
+def indexFrom(*rules):
+    lines = list(parse_lines('%\n' + '\n'.join(rules)))
+    return index_syntactic_spec(parse_syntactic_spec(lines))
@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+from ..parse_spec.parse_syntactic_spec.structs import (
+    SyntacticSpec,
+    SyntacticRule,
+)
+from .compute_first_follow import compute_first_follow
+from .index_syntactic_spec import SyntacticIndex, index_syntactic_spec
+
+
+@dataclass
+class LL1Conflict:
+    '''
+    A rule of name that is selected by the same terminal as an earlier
+    rule of name, so an LL(1) parser cannot choose between them.
+    '''
+    name: str
+    terminal: str
+    rule: SyntacticRule
+
+
+def find_ll1_conflicts(syntacticSpec: SyntacticSpec | SyntacticIndex) -> list[LL1Conflict]:
+    '''
+    Return a conflict for each rule whose predict set overlaps those of
+    the earlier rules of its LHS, in source order. These are the rules on
+    which build_parse_table would fail. If several terminals overlap,
+    the conflict is reported on the first of them in sorted order.
+    '''
+    index = syntacticSpec if isinstance(syntacticSpec, SyntacticIndex) else index_syntactic_spec(syntacticSpec)
+    rules = [rule for rules in index.rulesByName.values() for rule in rules]
+    firstFollow = compute_first_follow(rules)
+    result = []
+    for name, rules in index.rulesByName.items():
+        seen = set()
+        for rule in rules:
+            predict = firstFollow.predict(rule)
+            overlap = predict & seen
+            if overlap:
+                result.append(LL1Conflict(name=name, terminal=min(overlap), rule=rule))
+            seen |= predict
+    return result
@@ -0,0 +1,33 @@
+from pytest import raises, mark, fixture
+
+from .find_ll1_conflicts import find_ll1_conflicts
+from ..load_rough_spec.parse_lines import parse_lines
+from ..parse_spec.parse_syntactic_spec import parse_syntactic_spec
+
+
+def test_no_rules_no_conflicts():
+    assert find_ll1_conflicts(None) == []
+
+
+def test_ll1_grammar():
+    assert findFrom('<s>:X ::= A <s>', '<s>:Y ::= B', '<list> **= <s> +COMMA') == []
+
+
+def test_conflict_through_nonterminals():
+    result = findFrom('<s>:X ::= <p> B', '<s>:Y ::= <q> A', '<p> ::= A', '<q> ::= A')
+    assert [(c.name, c.terminal, c.rule.line.string) for c in result] == [('s', 'A', '<s>:Y ::= <q> A')]
+
+
+def test_conflict_with_follow_of_nullable_rule():
+    result = findFrom('<prog> ::= <s> A', '<s>:X ::=', '<s>:Y ::= A')
+    assert [(c.name, c.terminal) for c in result] == [('s', 'A')]
+
+
+def test_first_terminal_is_reported():
+    result = findFrom('<s>:X ::= <t>', '<s>:Y ::= <t> C', '<t>:P ::= B', '<t>:Q ::= A')
+    assert [c.terminal for c in result] == ['A']
+
+
+def findFrom(*rules):
+    lines = list(parse_lines('%\n' + '\n'.join(rules)))
+    return find_ll1_conflicts(parse_syntactic_spec(lines))
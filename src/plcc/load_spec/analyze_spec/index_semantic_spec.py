@@ -0,0 +1,58 @@
+from dataclasses import dataclass, field
+
+from ..parse_spec.parse_semantic_spec import SemanticSpec, CodeFragment
+
+
+@dataclass
+class CodeFragmentIndex:
+    '''
+    CodeFragments grouped by TargetLocator.className, then by modifier
+    (None for fragments without one), each list in source order.
+    '''
+    fragmentsByClass: dict[str, dict[str | None, list[CodeFragment]]] = field(default_factory=dict)
+
+    def add(self, codeFragment: CodeFragment):
+        locator = codeFragment.targetLocator
+        modifiers = self.fragmentsByClass.setdefault(locator.className, {})
+        modifiers.setdefault(locator.modifier, []).append(codeFragment)
+
+    def merge(self, other: 'CodeFragmentIndex'):
+        '''
+        Append other's fragments after this index's fragments.
+        '''
+        for className, modifiers in other.fragmentsByClass.items():
+            mine = self.fragmentsByClass.setdefault(className, {})
+            for modifier, fragments in modifiers.items():
+                mine.setdefault(modifier, []).extend(fragments)
+
+    def getFragments(self, className: str, modifier: str | None = None) -> list[CodeFragment]:
+        return self.fragmentsByClass.get(className, {}).get(modifier, [])
+
+    def getModifiers(self, className: str) -> dict[str | None, list[CodeFragment]]:
+        return self.fragmentsByClass.get(className, {})
+
+    def getClassNames(self) -> list[str]:
+        return list(self.fragmentsByClass)
+
+
+def index_semantic_spec(semanticSpec: SemanticSpec) -> CodeFragmentIndex:
+    index = CodeFragmentIndex()
+    for codeFragment in semanticSpec.codeFragmentList:
+        index.add(codeFragment)
+    return index
+
+
+def index_semantic_specs(semanticSpecList: list[SemanticSpec]) -> dict[tuple[str, str], CodeFragmentIndex]:
+    '''
+    Index each semantic section once and merge the sections that share a
+    (tool, language), in the order the sections appear.
+    '''
+    result = {}
+    for semanticSpec in semanticSpecList:
+        index = index_semantic_spec(semanticSpec)
+        key = (semanticSpec.tool, semanticSpec.language)
+        if key in result:
+            result[key].merge(index)
+        else:
+            result[key] = index
+    return result
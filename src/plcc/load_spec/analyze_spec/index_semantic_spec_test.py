@@ -0,0 +1,47 @@
+from pytest import raises, mark, fixture
+
+from .index_semantic_spec import index_semantic_spec, index_semantic_specs
+from ..load_rough_spec.parse_lines import Line, parse_lines
+from ..load_rough_spec.parse_blocks import parse_blocks
+from ..load_rough_spec.parse_dividers import parse_dividers
+from ..parse_spec.parse_semantic_spec import parse_semantic_spec
+
+
+def test_empty_section():
+    index = index_semantic_spec(makeSemanticSpec('%'))
+    assert index.getClassNames() == []
+    assert index.getFragments('Missing') == []
+
+
+def test_fragments_grouped_by_class_and_modifier():
+    index = index_semantic_spec(makeSemanticSpec(
+        '% Java',
+        'Exp:import', '%%%', 'import a;', '%%%',
+        'Exp', '%%%', 'int one;', '%%%',
+        'Prog', '%%%', 'int two;', '%%%',
+        'Exp', '%%%', 'int three;', '%%%',
+    ))
+    assert index.getClassNames() == ['Exp', 'Prog']
+    assert list(index.getModifiers('Exp')) == ['import', None]
+    assert blockTexts(index.getFragments('Exp')) == ['int one;', 'int three;']
+    assert blockTexts(index.getFragments('Exp', 'import')) == ['import a;']
+
+
+def test_sections_with_same_tool_and_language_are_merged():
+    indexes = index_semantic_specs([
+        makeSemanticSpec('% Java', 'Exp', '%%%', 'first', '%%%'),
+        makeSemanticSpec('% Python', 'Exp', '%%%', 'python', '%%%'),
+        makeSemanticSpec('% Java', 'Exp', '%%%', 'second', '%%%', 'Prog:top', '%%%', 'top', '%%%'),
+    ])
+    assert list(indexes) == [('Java', 'Java'), ('Python', 'Python')]
+    assert blockTexts(indexes[('Java', 'Java')].getFragments('Exp')) == ['first', 'second']
+    assert blockTexts(indexes[('Java', 'Java')].getFragments('Prog', 'top')) == ['top']
+    assert blockTexts(indexes[('Python', 'Python')].getFragments('Exp')) == ['python']
+
+
+def makeSemanticSpec(*strings):
+    return parse_semantic_spec(list(parse_dividers(parse_blocks(parse_lines('\n'.join(strings))))))
+
+
+def blockTexts(fragments):
+    return [fragment.block.lines[1].string for fragment in fragments]
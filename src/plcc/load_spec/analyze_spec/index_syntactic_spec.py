@@ -0,0 +1,67 @@
+from dataclasses import dataclass, field
+
+from ..parse_spec.parse_syntactic_spec.structs import (
+    SyntacticSpec,
+    SyntacticRule,
+    RepeatingSyntacticRule,
+    RhsNonTerminal,
+    Terminal,
+)
+
+
+@dataclass
+class SyntacticIndex:
+    '''
+    Lookup tables over a SyntacticSpec, built in a single pass so that
+    analyses can run in time linear in the size of the grammar.
+
+        start: Name of the LHS of the first rule (the start symbol).
+        rulesByName: Rules grouped by LHS name, in source order.
+        successors: For each LHS name, the distinct RHS nonterminal names
+            used by its rules, in source order.
+        nonTerminalUses: Every (rule, RhsNonTerminal) pair, in source order.
+        terminalUses: Every (rule, Terminal) pair, including separators,
+            in source order.
+    '''
+    start: str | None = None
+    rulesByName: dict[str, list[SyntacticRule]] = field(default_factory=dict)
+    successors: dict[str, list[str]] = field(default_factory=dict)
+    nonTerminalUses: list[tuple[SyntacticRule, RhsNonTerminal]] = field(default_factory=list)
+    terminalUses: list[tuple[SyntacticRule, Terminal]] = field(default_factory=list)
+
+    def isDefined(self, name: str) -> bool:
+        return name in self.rulesByName
+
+
+def index_syntactic_spec(syntacticSpec: SyntacticSpec) -> SyntacticIndex:
+    return SyntacticIndexer(syntacticSpec).index()
+
+
+class SyntacticIndexer:
+    def __init__(self, syntacticSpec: SyntacticSpec):
+        self.rules = list(syntacticSpec) if syntacticSpec else []
+        self.result = SyntacticIndex()
+        self.seenSuccessors = {}
+
+    def index(self) -> SyntacticIndex:
+        if self.rules:
+            self.result.start = self.rules[0].lhs.name
+        for rule in self.rules:
+            self._indexRule(rule)
+        return self.result
+
+    def _indexRule(self, rule: SyntacticRule):
+        name = rule.lhs.name
+        self.result.rulesByName.setdefault(name, []).append(rule)
+        successors = self.result.successors.setdefault(name, [])
+        seen = self.seenSuccessors.setdefault(name, set())
+        for symbol in rule.rhsSymbolList:
+            if isinstance(symbol, RhsNonTerminal):
+                self.result.nonTerminalUses.append((rule, symbol))
+                if symbol.name not in seen:
+                    seen.add(symbol.name)
+                    successors.append(symbol.name)
+            else:
+                self.result.terminalUses.append((rule, symbol))
+        if isinstance(rule, RepeatingSyntacticRule) and rule.separator is not None:
+            self.result.terminalUses.append((rule, rule.separator))
@@ -0,0 +1,35 @@
+from pytest import raises, mark, fixture
+
+from .index_syntactic_spec import index_syntactic_spec
+from ..load_rough_spec.parse_lines import parse_lines
+from ..parse_spec.parse_syntactic_spec import parse_syntactic_spec
+
+
+def test_None_indexes_nothing():
+    index = index_syntactic_spec(None)
+    assert index.start is None
+    assert index.rulesByName == {}
+
+
+def test_rules_grouped_by_lhs_name():
+    index = indexFrom('<exp>:A ::= X', '<prog> ::= <exp>', '<exp>:B ::= Y')
+    assert index.start == 'exp'
+    assert [r.lhs.altName for r in index.rulesByName['exp']] == ['A', 'B']
+    assert index.isDefined('prog')
+    assert not index.isDefined('missing')
+
+
+def test_successors_are_distinct_and_ordered():
+    index = indexFrom('<prog> ::= <b> <a> <b>', '<prog> ::= <c>')
+    assert index.successors['prog'] == ['b', 'a', 'c']
+    assert [s.name for _, s in index.nonTerminalUses] == ['b', 'a', 'b', 'c']
+
+
+def test_terminal_uses_include_separators():
+    index = indexFrom('<list> **= <ITEM> SEMI +COMMA')
+    assert [s.name for _, s in index.terminalUses] == ['ITEM', 'SEMI', 'COMMA']
+
+
+def indexFrom(*rules):
+    lines = list(parse_lines('%\n' + '\n'.join(rules)))
+    return index_syntactic_spec(parse_syntactic_spec(lines))
@@ -50,7 +50,7 @@ def process(self, lines):
     def process_include(self, include):
         p = Path(include.file)
         if not p.is_absolute():
-            if include.file.line is not None:
+            if include.line is not None and include.line.file is not None:
                 p = (Path(include.line.file).parent/p).resolve()
             else:
                 p = (Path.cwd()/p).resolve()
@@ -9,6 +9,32 @@
 class Block:
     lines: [Line]
 
+    @property
+    def contentLines(self) -> list[Line]:
+        '''
+        The lines between the opening and closing bracket lines.
+        '''
+        return self.lines[1:-1]
+
+    @property
+    def text(self) -> str:
+        '''
+        The content of the block as a string, each line ending in a newline.
+        Built on each access; use writeTo to avoid building it.
+        '''
+        return ''.join(self.iterText())
+
+    def iterText(self):
+        for line in self.contentLines:
+            yield line.string
+            yield '\n'
+
+    def writeTo(self, file):
+        '''
+        Write the content of the block to file without building its text.
+        '''
+        file.writelines(self.iterText())
+
 
 def parse_blocks(lines, brackets=None, Block=Block):
     if lines is None:
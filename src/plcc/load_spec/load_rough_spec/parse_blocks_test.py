@@ -1,3 +1,5 @@
+from io import StringIO
+
 from pytest import raises, mark, fixture
 
 
@@ -78,3 +80,19 @@ def test_mixed():
         Block(list(parse_lines('%%{\nthree\n%%}', start=7))),
         Line('', 10, None),
     ]
+
+
+def test_block_text_is_its_content():
+    block = Block(list(parse_lines('%%%\none\n  two\n%%%')))
+    assert [line.string for line in block.contentLines] == ['one', '  two']
+    assert block.text == 'one\n  two\n'
+
+
+def test_empty_block_text():
+    assert Block(list(parse_lines('%%%\n%%%'))).text == ''
+
+
+def test_write_block_to_file():
+    out = StringIO()
+    Block(list(parse_lines('%%{\nx = 1\n%%}'))).writeTo(out)
+    assert out.getvalue() == 'x = 1\n'
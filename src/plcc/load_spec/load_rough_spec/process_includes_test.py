@@ -25,6 +25,13 @@ def test_include(fs):
         Line('hi', 1, '/f')
     ]
 
+def test_relative_include_is_found_next_to_including_file(fs):
+    fs.create_file('/d/f', contents='%include sub/g')
+    fs.create_file('/d/sub/g', contents='hi')
+    assert list(process_includes(parse_includes(parse_lines('%include /d/f')))) == [
+        Line('hi', 1, '/d/sub/g')
+    ]
+
 def test_circular_include_errors(fs):
     fs.create_file('/f', contents='%include /f')
     with raises(CircularIncludeError):
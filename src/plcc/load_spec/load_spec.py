@@ -0,0 +1,108 @@
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+
+from .load_rough_spec.load_rough_spec import load_rough_spec
+from .load_rough_spec.split_rough_spec import RoughSpec
+from .load_rough_spec.parse_blocks import Block
+from .load_rough_spec.validate_rough_spec import validate_rough_spec
+from .parse_spec.parse_lexical_spec import LexicalSpec, parse_lexical_spec
+from .parse_spec.parse_syntactic_spec import SyntacticSpec, parse_syntactic_spec
+from .parse_spec.parse_semantic_spec import SemanticSpec, parse_semantic_spec
+from .validate_spec.validate_syntactic_spec import validate_syntactic_spec
+from .validate_spec.validate_semantic_spec import validate_semantic_spec, validate_semantic_specs
+
+
+@dataclass
+class Spec:
+    lexicalSpec: LexicalSpec
+    syntacticSpec: SyntacticSpec
+    semanticSpecList: list[SemanticSpec] = field(default_factory=list)
+    errorList: list = field(default_factory=list)
+
+
+def load_spec(file, executor: Executor | None = None) -> Spec:
+    '''
+    Load, parse and validate the spec in file.
+
+        executor: If given, the lexical section, the syntactic section and
+            each semantic section are parsed as separate tasks on it (e.g.,
+            a concurrent.futures.ProcessPoolExecutor), and then validated
+            as separate tasks. Otherwise they are processed one after
+            another.
+
+    Validation errors are returned in the Spec's errorList in source order,
+    except that duplicate code fragments across semantic sections of the
+    same language come last.
+    If parsing a section raises, the exception from the earliest such
+    section is raised.
+    '''
+    return SpecLoader(executor).load(load_rough_spec(file))
+
+
+class SpecLoader:
+    def __init__(self, executor: Executor | None = None):
+        self.executor = executor
+
+    def load(self, roughSpec: RoughSpec) -> Spec:
+        tasks = [
+            (load_lexical_section, roughSpec.lexicalSection),
+            (load_syntactic_section, roughSpec.syntacticSection),
+        ] + [
+            (load_semantic_section, section)
+            for section in roughSpec.semanticSectionList
+        ]
+        results = self._run(tasks)
+        return self._makeSpec(roughSpec, results)
+
+    def _run(self, tasks: list) -> list:
+        if self.executor is None:
+            return [function(*args) for function, *args in tasks]
+        futures = [self.executor.submit(function, *args) for function, *args in tasks]
+        return [future.result() for future in futures]
+
+    def _makeSpec(self, roughSpec: RoughSpec, results: list) -> Spec:
+        (lexicalSpec, lexicalErrors), (syntacticSpec, syntacticErrors), *semanticResults = results
+        semanticSpecList = [semanticSpec for semanticSpec, _ in semanticResults]
+        syntacticValidation, *semanticValidations, crossSectionErrors = self._run(
+            [(validate_syntactic_spec, syntacticSpec, lexicalSpec)]
+            + [(validate_semantic_spec, semanticSpec, syntacticSpec) for semanticSpec in semanticSpecList]
+            + [(validate_semantic_specs, semanticSpecList, syntacticSpec)]
+        )
+        errorList = validate_rough_spec(roughSpec)
+        errorList.extend(lexicalErrors)
+        errorList.extend(syntacticErrors)
+        errorList.extend(syntacticValidation)
+        for (_, semanticErrors), validation in zip(semanticResults, semanticValidations):
+            errorList.extend(semanticErrors)
+            errorList.extend(validation)
+        errorList.extend(crossSectionErrors)
+        return Spec(
+            lexicalSpec=lexicalSpec,
+            syntacticSpec=syntacticSpec,
+            semanticSpecList=semanticSpecList,
+            errorList=errorList
+        )
+
+
+def load_lexical_section(section: list) -> tuple[LexicalSpec, list]:
+    return parse_lexical_spec(withoutBlocks(section)), []
+
+
+def load_syntactic_section(section: list) -> tuple[SyntacticSpec, list]:
+    return parse_syntactic_spec(withoutBlocks(section)), []
+
+
+def load_semantic_section(section: list) -> tuple[SemanticSpec, list]:
+    '''
+    Semantic sections are validated against the syntactic section once
+    both are parsed, so only parsing happens here.
+    '''
+    return parse_semantic_spec(section), []
+
+
+def withoutBlocks(section: list) -> list:
+    '''
+    Blocks are not allowed in the lexical and syntactic sections.
+    validate_rough_spec reports them, so they are dropped before parsing.
+    '''
+    return [line for line in section if not isinstance(line, Block)]
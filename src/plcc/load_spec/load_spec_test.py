@@ -0,0 +1,131 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from pytest import raises, mark, fixture
+
+from .load_spec import load_spec, SpecLoader
+from .load_rough_spec.parse_rough import parse_rough
+from .load_rough_spec.split_rough_spec import split_rough_spec
+from .load_rough_spec.validate_rough_spec import ValidationError
+from .parse_spec.parse_syntactic_spec import MalformedBNFError
+from .validate_spec.validate_syntactic_spec import UndefinedTerminalError
+from .validate_spec.validate_syntactic_spec import validate_syntactic_spec
+from .validate_spec.validate_semantic_spec import validate_semantic_spec, validate_semantic_specs
+from .validate_spec.validate_semantic_spec.validate_semantic_spec import InvalidClassNameError, UndefinedClassError, DuplicateModifierError
+
+
+SPEC = '''\
+skip WS '\\s+'
+NUM '\\d+'
+%
+<prog> ::= <NUM>
+% Java
+Prog
+%%%
+int x;
+%%%
+% Python
+Prog
+%%%
+x = 1
+%%%
+'''
+
+
+def test_load_sections():
+    spec = loadString(SPEC)
+    assert [r.name for r in spec.lexicalSpec.ruleList] == ['WS', 'NUM']
+    assert [r.lhs.name for r in spec.syntacticSpec] == ['prog']
+    assert [s.tool for s in spec.semanticSpecList] == ['Java', 'Python']
+    assert spec.errorList == []
+
+
+def test_errors_in_source_order():
+    spec = loadString('''\
+NUM '\\d+'
+%%%
+%%%
+%
+<prog> ::= <MISSING>
+% Java
+bad
+%%%
+%%%
+% Python
+alsoBad
+%%%
+%%%
+''')
+    assert [type(e) for e in spec.errorList] == [
+        ValidationError,
+        UndefinedTerminalError,
+        InvalidClassNameError,
+        InvalidClassNameError,
+    ]
+    assert [e.line.number for e in spec.errorList] == [2, 5, 7, 11]
+
+
+def test_same_result_on_thread_pool():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        concurrent = loadString(SPEC, executor)
+    serial = loadString(SPEC)
+    assert concurrent == serial
+    assert list(concurrent.syntacticSpec) == list(serial.syntacticSpec)
+    assert list(concurrent.syntacticSpec) != []
+
+
+def test_earliest_parse_error_is_raised():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        with raises(MalformedBNFError):
+            loadString('%\n<prog> +*= A\n% Java\nProg\n', executor)
+
+
+def test_load_spec_from_file_on_process_pool(tmp_path):
+    file = tmp_path / 'spec'
+    file.write_text(SPEC)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        spec = load_spec(str(file), executor)
+    assert [s.tool for s in spec.semanticSpecList] == ['Java', 'Python']
+    assert spec.semanticSpecList[1].codeFragmentList[0].block.lines[1].string == 'x = 1'
+    assert spec.errorList == []
+
+
+def test_validation_runs_on_executor():
+    class RecordingExecutor(ThreadPoolExecutor):
+        def __init__(self):
+            super().__init__(max_workers=2)
+            self.functions = []
+
+        def submit(self, function, *args):
+            self.functions.append(function)
+            return super().submit(function, *args)
+
+    with RecordingExecutor() as executor:
+        loadString(SPEC, executor)
+    assert executor.functions[-4:] == [validate_syntactic_spec, validate_semantic_spec, validate_semantic_spec, validate_semantic_specs]
+
+
+def test_duplicates_across_sections_of_one_language():
+    spec = loadString(SPEC + '% Java\nProg:class\n%%%\n%%%\n% Python\nEnv\n%%%\n%%%\n% Java\nProg:class\n%%%\n%%%\n')
+    assert [type(e) for e in spec.errorList] == [DuplicateModifierError]
+    assert spec.errorList[0].line.number == 24
+
+
+def test_semantic_sections_are_checked_against_grammar():
+    spec = loadString('''\
+NUM '\\d+'
+%
+<prog> ::= <NUM>
+% Java
+Other:init
+%%%
+%%%
+Prog:class
+%%%
+%%%
+''')
+    assert [type(e) for e in spec.errorList] == [UndefinedClassError]
+    assert spec.errorList[0].line.number == 5
+
+
+def loadString(string, executor=None):
+    return SpecLoader(executor).load(split_rough_spec(list(parse_rough(string))))
+
@@ -9,6 +9,7 @@ class LexicalRule:
     isSkip: bool
     name: str
     pattern: str
+    isMultiline: bool = False
 
 @dataclass
 class LexicalSpec:
@@ -21,8 +22,8 @@ class LexicalParser():
     def __init__(self, lines: [Line]):
         self.lines = lines
         self.patterns = {
-            'skipToken' : re.compile(r'^skip\s+(?P<Name>\S+)\s+(?P<Pattern>((\'\S+\')|(\"\S+\")))\s*(?:#.*)*$'),
-            'tokenToken' : re.compile(r'(?:^token\s+)?(?P<Name>\S+)\s+(?P<Pattern>((\'\S+\')|(\"\S+\")))\s*(?:#.*)*$')
+            'skipToken' : re.compile(r'^skip\s+(?P<Name>\S+)\s+(?P<Pattern>((\'\S+\')|(\"\S+\")))(?:\s+(?P<Multiline>multiline))?\s*(?:#.*)*$'),
+            'tokenToken' : re.compile(r'(?:^token\s+)?(?P<Name>\S+)\s+(?P<Pattern>((\'\S+\')|(\"\S+\")))(?:\s+(?P<Multiline>multiline))?\s*(?:#.*)*$')
         }
         self.spec = LexicalSpec([])
 
@@ -45,9 +46,9 @@ def _processLine(self, line: Line):
 
     def _generateTokenRule(self, line: Line, lineIsSkipToken: Match[str], lineIsRegularToken: Match[str]) -> LexicalRule:
         if lineIsSkipToken:
-            return self._generateSkipToken(line, lineIsSkipToken['Name'], lineIsSkipToken['Pattern'])
+            return self._generateSkipToken(line, lineIsSkipToken['Name'], lineIsSkipToken['Pattern'], lineIsSkipToken['Multiline'] is not None)
         elif lineIsRegularToken:
-            return self._generateRegularToken(line, lineIsRegularToken['Name'], lineIsRegularToken['Pattern'])
+            return self._generateRegularToken(line, lineIsRegularToken['Name'], lineIsRegularToken['Pattern'], lineIsRegularToken['Multiline'] is not None)
 
     def _isBlankOrComment(self, line: Line) -> bool:
         return not line.string.strip() or line.string.strip().startswith("#")
@@ -57,14 +58,14 @@ def _matchToken(self, lineStr: str) -> tuple[Match[str] | None, Match[str] | Non
         isRegularToken = re.match(self.patterns['tokenToken'], lineStr)
         return isSkipToken, isRegularToken
 
-    def _generateSkipToken(self, line: Line, name: str, pattern: str) -> LexicalRule:
+    def _generateSkipToken(self, line: Line, name: str, pattern: str, isMultiline: bool = False) -> LexicalRule:
         pattern = self._stripQuotes(pattern)
-        newSkipRule = LexicalRule(line=line, isSkip=True, name=name, pattern=pattern)
+        newSkipRule = LexicalRule(line=line, isSkip=True, name=name, pattern=pattern, isMultiline=isMultiline)
         return newSkipRule
 
-    def _generateRegularToken(self, line: Line, name: str, pattern: str) -> LexicalRule:
+    def _generateRegularToken(self, line: Line, name: str, pattern: str, isMultiline: bool = False) -> LexicalRule:
         pattern = self._stripQuotes(pattern)
-        newTokenRule = LexicalRule(line=line, isSkip=False, name=name, pattern=pattern)
+        newTokenRule = LexicalRule(line=line, isSkip=False, name=name, pattern=pattern, isMultiline=isMultiline)
         return newTokenRule
 
     def _stripQuotes(self, pattern: str) -> str:
@@ -54,6 +54,11 @@ def test_token_must_begin_with_no_whitespace():
     lexical_spec = parse_lexical_spec([makeLine('  skip WHITESPACE \',\' ', 1, None)])
     assert lexical_spec.ruleList == [makeLine('  skip WHITESPACE \',\' ', 1, None)]
 
+def test_multiline_flag():
+    lexical_spec = parse_lexical_spec([makeLine("skip COMMENT '/\\*(.|\\n)*?\\*/' multiline # spans lines", 1), makeLine("token STR '\"[^\"]*\"'", 2)])
+    assert [rule.isMultiline for rule in lexical_spec.ruleList] == [True, False]
+    assert lexical_spec.ruleList[0].pattern == '/\\*(.|\\n)*?\\*/'
+
 def makeLexicalRule(line, isSkip, name, pattern):
     return LexicalRule(line, isSkip, name, pattern)
 
@@ -1,3 +1,3 @@
 from .parse_semantic_spec import SemanticSpec, parse_semantic_spec
-from .parse_code_fragments import CodeFragment, parse_code_fragments, UndefinedTargetLocatorError, DuplicateTargetLocatorError, CodeFragmentMissingBlockError
-from .parse_target_locator import TargetLocator, parse_target_locator
+from .parse_code_fragments import CodeFragment, parse_code_fragments, iterate_code_fragments, UndefinedTargetLocatorError, DuplicateTargetLocatorError, CodeFragmentMissingBlockError
+from .parse_target_locator import TargetLocator, parse_target_locator, TARGET_LOCATOR_PATTERN
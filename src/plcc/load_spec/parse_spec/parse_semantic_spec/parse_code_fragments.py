@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from .parse_target_locator import TargetLocator, parse_target_locator
+from .parse_target_locator import TargetLocator, parse_target_locator, TARGET_LOCATOR_PATTERN
 from plcc.load_spec.load_rough_spec.parse_lines import Line
 from plcc.load_spec.load_rough_spec.parse_blocks import Block
 from plcc.load_spec.load_rough_spec.parse_dividers import Divider
@@ -14,50 +14,59 @@ def parse_code_fragments(lines_and_blocks: list[Line | Block]):
     parser = CodeFragmentParser(lines_and_blocks)
     return parser.parse()
 
+def iterate_code_fragments(lines_and_blocks):
+    '''
+    Yield CodeFragments one at a time from any iterable of Lines and Blocks.
+    '''
+    parser = CodeFragmentParser(lines_and_blocks)
+    return parser.iterate()
+
 class CodeFragmentParser:
+    COMMENT_OR_BLANK_PATTERN = re.compile(r'\s*(?:#|$)')
+
     def __init__(self, lines_and_blocks: list[Line | Block]):
         self.lines_and_blocks = lines_and_blocks
-        self.codeFragmentList = []
         self.targetLocator = None
-        self.targetLocator_regex = r'^(.+?)(?::([a-z]+))?\s*(?:#.*)?$'
+        self.targetLocator_regex = TARGET_LOCATOR_PATTERN
 
     def parse(self):
+        return list(self.iterate())
+
+    def iterate(self):
+        handlers = self.HANDLERS
         for obj in self.lines_and_blocks:
-            self._parse_line_or_block(obj)
+            codeFragment = handlers.get(type(obj))(self, obj)
+            if codeFragment is not None:
+                yield codeFragment
 
         if self.targetLocator != None:
             raise CodeFragmentMissingBlockError(self.targetLocator.line)
 
-        return self.codeFragmentList
-
-    def _parse_line_or_block(self, obj):
-        handler = {
-                Line: self._parse_line,
-                Block: self._parse_block
-            }.get(type(obj))
-
-        handler(obj)
-
-
     def _parse_block(self, block):
         if self.targetLocator == None:
             raise UndefinedTargetLocatorError(block.lines[0])
 
-        self.codeFragmentList.append(CodeFragment(targetLocator=self.targetLocator, block=block))
+        codeFragment = CodeFragment(targetLocator=self.targetLocator, block=block)
         self.targetLocator = None
+        return codeFragment
 
     def _parse_line(self, line):
         if self._isCommentOrBlank(line.string):
-                return
+                return None
 
         if self.targetLocator != None:
             raise DuplicateTargetLocatorError(line.string)
         else:
             self.targetLocator = parse_target_locator(line, self.targetLocator_regex)
-
+        return None
 
     def _isCommentOrBlank(self, obj_str):
-        return True if re.match(r'\s*#', obj_str) or re.match(r'\s*$', obj_str) else False
+        return self.COMMENT_OR_BLANK_PATTERN.match(obj_str) is not None
+
+    HANDLERS = {
+        Line: _parse_line,
+        Block: _parse_block
+    }
 
 
 class CodeFragmentMissingBlockError(Exception):
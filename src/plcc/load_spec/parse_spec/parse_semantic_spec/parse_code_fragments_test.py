@@ -1,5 +1,5 @@
 from pytest import raises
-from .parse_code_fragments import CodeFragment, parse_code_fragments, UndefinedTargetLocatorError, DuplicateTargetLocatorError, CodeFragmentMissingBlockError
+from .parse_code_fragments import CodeFragment, parse_code_fragments, iterate_code_fragments, UndefinedTargetLocatorError, DuplicateTargetLocatorError, CodeFragmentMissingBlockError
 from .parse_target_locator import TargetLocator, InvalidTargetLocatorError
 from plcc.load_spec.load_rough_spec.parse_blocks import Block
 from plcc.load_spec.load_rough_spec.parse_lines import Line, parse_lines
@@ -42,6 +42,16 @@ def test_block_must_have_target_locator():
     with raises(UndefinedTargetLocatorError):
         parse_code_fragments([make_block()])
 
+def test_accepts_a_generator():
+    lines_and_blocks = (x for x in [make_line('Class:init'), make_block(), make_line('# comment'), make_line('Main'), make_block()])
+    assert [f.targetLocator.className for f in parse_code_fragments(lines_and_blocks)] == ['Class', 'Main']
+
+def test_iterate_yields_fragments_lazily():
+    fragments = iterate_code_fragments([make_line('Class'), make_block(), make_block()])
+    assert next(fragments).targetLocator.className == 'Class'
+    with raises(UndefinedTargetLocatorError):
+        next(fragments)
+
 def make_target_locator(line, className, modifier):
     return TargetLocator(line, className, modifier)
 
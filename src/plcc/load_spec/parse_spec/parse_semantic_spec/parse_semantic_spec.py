@@ -4,6 +4,7 @@
 from plcc.load_spec.load_rough_spec.parse_blocks import Block
 from plcc.load_spec.load_rough_spec.parse_dividers import Divider
 import re
+from itertools import islice
 
 @dataclass
 class SemanticSpec:
@@ -13,6 +14,6 @@ class SemanticSpec:
 
 def parse_semantic_spec(semantic_spec: list[Divider | Line | Block]) -> SemanticSpec:
     divider = semantic_spec[0]
-    codeFragmentList = parse_code_fragments(semantic_spec[1:])
+    codeFragmentList = parse_code_fragments(islice(semantic_spec, 1, None))
     return SemanticSpec(language = divider.language, tool = divider.tool, codeFragmentList=codeFragmentList)
 
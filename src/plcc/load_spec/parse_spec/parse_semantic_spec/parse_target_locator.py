@@ -8,8 +8,10 @@ class TargetLocator:
     className: str
     modifier: str = None
 
-def parse_target_locator(line, regex=r'^(.+?)(?::([a-z]+))?\s*(?:#.*)?$'):
-    match = re.match(regex, line.string)
+TARGET_LOCATOR_PATTERN = re.compile(r'^(.+?)(?::([a-z]+))?\s*(?:#.*)?$')
+
+def parse_target_locator(line, regex=TARGET_LOCATOR_PATTERN):
+    match = regex.match(line.string) if isinstance(regex, re.Pattern) else re.match(regex, line.string)
     if match:
         name, modifier = match.group(1), match.group(2) or None
         return TargetLocator(line = line, className=name, modifier=modifier)
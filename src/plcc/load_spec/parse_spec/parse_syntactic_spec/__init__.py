@@ -13,3 +13,10 @@
     MalformedLHSError,
     MalformedBNFError,
 )
+from .symbol_table import SymbolTable
+from .names import (
+    getClassName,
+    getBaseClassName,
+    getFieldName,
+    getListFieldName,
+)
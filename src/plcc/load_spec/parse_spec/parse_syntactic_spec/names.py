@@ -0,0 +1,43 @@
+from .structs import (
+    CapturingSymbol,
+    CapturingTerminal,
+    LhsNonTerminal,
+)
+
+
+def getClassName(lhs: LhsNonTerminal) -> str:
+    '''
+    Return the name of the class that a rule with this LHS defines.
+    '''
+    if lhs.altName:
+        return lhs.altName
+    return getBaseClassName(lhs)
+
+
+def getBaseClassName(lhs: LhsNonTerminal) -> str:
+    '''
+    Return the name of the abstract base class shared by all the
+    alternatives of this LHS.
+    '''
+    return lhs.name[:1].upper() + lhs.name[1:]
+
+
+def getFieldName(symbol: CapturingSymbol) -> str:
+    '''
+    Return the name of the field that a captured RHS symbol defines.
+    '''
+    if symbol.altName:
+        return symbol.altName
+    if isinstance(symbol, CapturingTerminal):
+        return symbol.name.lower()
+    return symbol.name
+
+
+def getListFieldName(symbol: CapturingSymbol) -> str:
+    '''
+    Return the name of the list field that a captured RHS symbol of a
+    repeating rule defines.
+    '''
+    if symbol.altName:
+        return symbol.altName
+    return f'{getFieldName(symbol)}List'
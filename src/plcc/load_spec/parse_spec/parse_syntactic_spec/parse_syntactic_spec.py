@@ -17,6 +17,7 @@
     MalformedLHSError,
     MalformedBNFError,
 )
+from .symbol_table import SymbolTable
 
 
 def parse_syntactic_spec(lines: List[Line | Divider] | None) -> SyntacticSpec:
@@ -32,7 +33,7 @@ def parseSpec(self) -> SyntacticSpec:
         if not self.lines:
             return self.spec
         for line in self.lines[1:]:
-            parser = SyntacticLineParser(line)
+            parser = SyntacticLineParser(line, self.spec.symbolTable)
             if parser.isSyntacticRule():
                 self.spec.append(parser.parseSyntacticRule())
         return self.spec
@@ -40,8 +41,9 @@ def parseSpec(self) -> SyntacticSpec:
 
 class SyntacticLineParser:
 
-    def __init__(self, line: Line):
+    def __init__(self, line: Line, symbolTable: SymbolTable | None = None):
         self.line = line
+        self.symbolTable = symbolTable if symbolTable is not None else SymbolTable()
         self.lhs = None
         self.rhs = None
         self.separator = None
@@ -64,7 +66,7 @@ def _parseLeft(self) -> LhsNonTerminal:
         match = self._matchLeft()
         if not match:
             raise MalformedLHSError(self.line)
-        return LhsNonTerminal(match["nonTerminal"], match["altName"])
+        return self.symbolTable.intern(LhsNonTerminal, match["nonTerminal"], match["altName"])
 
     def _parseRight(self) -> List[Symbol]:
         if self.rhs is None:
@@ -80,16 +82,14 @@ def _parseSymbol(self, symbol: str) -> Symbol:
         return (
             self._parseCapturing(capturing["name"], capturing["altName"])
             if capturing
-            else Terminal(symbol)
+            else self.symbolTable.intern(Terminal, symbol)
         )
 
     def _parseCapturing(self, name: str, altName: str) -> CapturingSymbol:
         terminal = re.match(r"[A-Z_]+", name)
         altName = altName.strip(":") if altName is not None else altName
-        return (
-            CapturingTerminal(name, altName)
-            if terminal
-            else RhsNonTerminal(name, altName)
+        return self.symbolTable.intern(
+            CapturingTerminal if terminal else RhsNonTerminal, name, altName
         )
 
     def _buildMatches(
@@ -125,7 +125,7 @@ def _parseRepeating(self) -> RepeatingSyntacticRule:
             self.line,
             self._parseLeft(),
             self._parseRight(),
-            Terminal(self.separator) if self.separator else None,
+            self.symbolTable.intern(Terminal, self.separator) if self.separator else None,
         )
 
     def _matchLeft(self) -> Match[str] | None:
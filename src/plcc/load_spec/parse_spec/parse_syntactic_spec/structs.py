@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 from plcc.load_spec.load_rough_spec.parse_lines import Line
+from .symbol_table import SymbolTable
 
 
 @dataclass(frozen=True)
@@ -61,7 +62,7 @@ class RepeatingSyntacticRule(SyntacticRule):
 
 @dataclass
 class SyntacticSpec(list):
-    pass
+    symbolTable: SymbolTable = field(default_factory=SymbolTable, compare=False, repr=False)
 
 
 class MalformedLHSError(Exception):
@@ -0,0 +1,23 @@
+class SymbolTable:
+    '''
+    Interns symbols by (kind, name, altName) so that each distinct symbol
+    is a single object shared by every rule that uses it.
+    '''
+    def __init__(self):
+        self.symbolList = []
+        self._symbolsByKey = {}
+
+    def intern(self, kind: type, name: str | None, altName: str | None = None) -> object:
+        key = (kind, name, altName)
+        symbol = self._symbolsByKey.get(key)
+        if symbol is None:
+            symbol = kind(name) if altName is None else kind(name, altName)
+            self._symbolsByKey[key] = symbol
+            self.symbolList.append(symbol)
+        return symbol
+
+    def __len__(self):
+        return len(self.symbolList)
+
+    def __iter__(self):
+        return iter(self.symbolList)
@@ -0,0 +1,46 @@
+from pytest import raises, mark, fixture
+
+from .symbol_table import SymbolTable
+from .structs import (
+    Terminal,
+    CapturingTerminal,
+    LhsNonTerminal,
+    RhsNonTerminal,
+)
+from .parse_syntactic_spec import parse_syntactic_spec
+from plcc.load_spec.load_rough_spec.parse_lines import parse_lines
+
+
+def test_equal_symbols_are_interned_once():
+    table = SymbolTable()
+    assert table.intern(Terminal, 'COMMA') is table.intern(Terminal, 'COMMA')
+    assert len(table) == 1
+
+
+def test_kind_and_altName_distinguish_symbols():
+    table = SymbolTable()
+    symbols = [
+        table.intern(Terminal, 'A'),
+        table.intern(CapturingTerminal, 'A'),
+        table.intern(CapturingTerminal, 'A', 'a'),
+        table.intern(RhsNonTerminal, 'exp'),
+        table.intern(LhsNonTerminal, 'exp'),
+    ]
+    assert symbols == [
+        Terminal('A'),
+        CapturingTerminal('A'),
+        CapturingTerminal('A', 'a'),
+        RhsNonTerminal('exp'),
+        LhsNonTerminal('exp'),
+    ]
+    assert list(table) == symbols
+
+
+def test_parsed_spec_shares_symbols():
+    spec = parse_syntactic_spec(list(parse_lines('%\n<a> ::= COMMA <b>\n<b> **= <ID> +COMMA\n<a> ::= <b>')))
+    first, second, third = spec
+    assert first.rhsSymbolList[0] is second.separator
+    assert first.rhsSymbolList[1] is third.rhsSymbolList[0]
+    assert first.lhs is third.lhs
+    assert len(spec.symbolTable) == 5
+
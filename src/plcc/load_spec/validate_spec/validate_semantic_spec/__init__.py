@@ -1,3 +1,9 @@
-from .validate_semantic_spec import validate_semantic_spec
-
-from ...load_rough_spec.parse_lines import Line, parse_lines
+from .validate_semantic_spec import (
+    validate_semantic_spec,
+    validate_semantic_specs,
+    InvalidClassNameError,
+    UndefinedClassError,
+    ReservedClassNameError,
+    DuplicateModifierError,
+    RUNTIME_CLASS_NAMES,
+)
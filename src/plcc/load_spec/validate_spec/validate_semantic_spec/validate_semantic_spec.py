@@ -1,19 +1,113 @@
 from dataclasses import dataclass
 from ...load_rough_spec.parse_lines import Line, parse_lines
 from ...parse_spec.parse_semantic_spec import SemanticSpec, CodeFragment
+from ...parse_spec.parse_syntactic_spec import SyntacticSpec, getClassName, getBaseClassName
+from ...analyze_spec.index_semantic_spec import index_semantic_specs
 import re
 
+CLASS_NAME_PATTERN = re.compile(r'^[A-Z][A-Za-z0-9_]*$')
+
+RUNTIME_CLASS_NAMES = frozenset([
+    '_Start',
+    'ILazy',
+    'IMatch',
+    'IScan',
+    'ITrace',
+    'Trace',
+    'PLCCException',
+    'Scan',
+    'ProcessFiles',
+    'Parse',
+    'Rep',
+    'ParseJsonAst',
+    'Token',
+])
+
+UNIQUE_MODIFIERS = frozenset(['class'])
+
 @dataclass
 class InvalidClassNameError:
     line: Line
     message: str
 
-def validate_semantic_spec(semanticSpec: SemanticSpec):
-    return SemanticValidator(semanticSpec).validate()
+@dataclass
+class UndefinedClassError:
+    line: Line
+    message: str
+
+@dataclass
+class ReservedClassNameError:
+    line: Line
+    message: str
+
+@dataclass
+class DuplicateModifierError:
+    line: Line
+    message: str
+
+def validate_semantic_spec(semanticSpec: SemanticSpec, syntacticSpec: SyntacticSpec | None = None):
+    return SemanticValidator(semanticSpec, syntacticSpec).validate()
+
+def validate_semantic_specs(semanticSpecList: list[SemanticSpec], syntacticSpec: SyntacticSpec) -> list:
+    '''
+    Check for duplicate code fragments across the semantic sections that
+    share a (tool, language), since their fragments are merged into one
+    CodeFragmentIndex (see index_semantic_specs). Duplicates within a
+    section are reported by validate_semantic_spec, so here only the first
+    duplicate in each later section is reported.
+    '''
+    generatedClassNames = get_generated_class_names(syntacticSpec)
+    sectionOf = {
+        id(codeFragment): i
+        for i, semanticSpec in enumerate(semanticSpecList)
+        for codeFragment in semanticSpec.codeFragmentList
+    }
+    errorList = []
+    for index in index_semantic_specs(semanticSpecList).values():
+        for className, modifiers in index.fragmentsByClass.items():
+            if not CLASS_NAME_PATTERN.match(className):
+                continue
+            for modifier, fragments in modifiers.items():
+                if not is_unique_fragment(className, modifier, generatedClassNames):
+                    continue
+                first = fragments[0].targetLocator
+                reported = {sectionOf[id(fragments[0])]}
+                for codeFragment in fragments[1:]:
+                    section = sectionOf[id(codeFragment)]
+                    if section not in reported:
+                        reported.add(section)
+                        errorList.append(make_duplicate_error(codeFragment.targetLocator, first))
+    return errorList
+
+def get_generated_class_names(syntacticSpec: SyntacticSpec) -> set[str]:
+    '''
+    Return the names of the classes generated for the rules of
+    syntacticSpec: each rule's class and, for LHSs with alternatives,
+    their abstract base class.
+    '''
+    names = set()
+    for rule in syntacticSpec:
+        names.add(getClassName(rule.lhs))
+        names.add(getBaseClassName(rule.lhs))
+    return names
 
 class SemanticValidator:
-    def __init__(self, semanticSpec: SemanticSpec):
+    '''
+    If syntacticSpec is None, only the format of class names is checked.
+    Otherwise each fragment is also checked against the set of generated
+    classes, which is built once, so validation is linear in the number
+    of fragments.
+
+    A fragment with a modifier is inserted into a generated class, so its
+    class must be generated. A fragment without one defines a class of
+    its own, unless the class is generated; it must not replace a runtime
+    class, and only one fragment may define it. A class may have at most
+    one fragment for each modifier in UNIQUE_MODIFIERS.
+    '''
+    def __init__(self, semanticSpec: SemanticSpec, syntacticSpec: SyntacticSpec | None = None):
         self.semanticSpec = semanticSpec
+        self.generatedClassNames = None if syntacticSpec is None else get_generated_class_names(syntacticSpec)
+        self.seen = {}
         self.errorList = []
 
     def validate(self) -> list:
@@ -21,17 +115,55 @@ def validate(self) -> list:
             return self.errorList
 
         for codeFragment in self.semanticSpec.codeFragmentList:
-            self._checkTargetLocatorClassName(codeFragment)
+            if not self._checkTargetLocatorClassName(codeFragment):
+                continue
+            if self.generatedClassNames is not None:
+                self._checkTargetLocatorClass(codeFragment)
+                self._checkDuplicateModifier(codeFragment)
 
         return self.errorList
 
-    def _checkTargetLocatorClassName(self, codeFragment: CodeFragment):
-        if not re.match(r'^[A-Z][A-Za-z0-9_]*$', codeFragment.targetLocator.className):
+    def _checkTargetLocatorClassName(self, codeFragment: CodeFragment) -> bool:
+        if not CLASS_NAME_PATTERN.match(codeFragment.targetLocator.className):
             self.errorList.append(InvalidClassNameError(codeFragment.targetLocator.line,
             f"Invalid name format for ClassName {codeFragment.targetLocator.className}, (Must start with an upper case letter, and may contain upper or lower case letters, numbers, and underscores)."))
+            return False
+        return True
 
+    def _checkTargetLocatorClass(self, codeFragment: CodeFragment):
+        locator = codeFragment.targetLocator
+        if locator.className in self.generatedClassNames:
+            return
+        if locator.modifier is not None:
+            self.errorList.append(UndefinedClassError(locator.line,
+            f"Undefined class {locator.className} for modifier {locator.modifier} (No rule of the syntactic section generates {locator.className})."))
+        elif locator.className in RUNTIME_CLASS_NAMES:
+            self.errorList.append(ReservedClassNameError(locator.line,
+            f"Reserved class name {locator.className} (It is a class of the PLCC runtime)."))
 
+    def _checkDuplicateModifier(self, codeFragment: CodeFragment):
+        locator = codeFragment.targetLocator
+        if not self._isUnique(locator):
+            return
+        key = (locator.className, locator.modifier)
+        first = self.seen.setdefault(key, locator)
+        if first is not locator:
+            self.errorList.append(make_duplicate_error(locator, first))
 
+    def _isUnique(self, locator) -> bool:
+        return is_unique_fragment(locator.className, locator.modifier, self.generatedClassNames)
 
+def is_unique_fragment(className: str, modifier: str | None, generatedClassNames: set[str]) -> bool:
+    '''
+    Return whether a class may have only one fragment with modifier: a
+    fragment that defines a new class, or one with a UNIQUE_MODIFIERS
+    modifier.
+    '''
+    if modifier is None:
+        return className not in generatedClassNames
+    return modifier in UNIQUE_MODIFIERS
 
-
+def make_duplicate_error(locator, first) -> DuplicateModifierError:
+    target = locator.className if locator.modifier is None else f'{locator.className}:{locator.modifier}'
+    return DuplicateModifierError(locator.line,
+        f"Duplicate code fragment for {target} (It conflicts with the one on line {first.line.number}).")
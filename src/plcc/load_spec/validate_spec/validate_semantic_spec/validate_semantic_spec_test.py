@@ -1,6 +1,14 @@
 from pytest import raises, mark, fixture
-from .validate_semantic_spec import InvalidClassNameError, validate_semantic_spec
+from .validate_semantic_spec import (
+    InvalidClassNameError,
+    UndefinedClassError,
+    ReservedClassNameError,
+    DuplicateModifierError,
+    validate_semantic_spec,
+    validate_semantic_specs,
+)
 from ...parse_spec.parse_semantic_spec import SemanticSpec, parse_semantic_spec
+from ...parse_spec.parse_syntactic_spec import parse_syntactic_spec
 from ...load_rough_spec.parse_lines import Line, parse_lines
 from ...load_rough_spec.parse_dividers import Divider
 from ...load_rough_spec.parse_blocks import Block
@@ -33,6 +41,68 @@ def test_valid_and_invalid_names():
     assert len(errors) == 1
     assert errors[0] == makeInvalidClassNameError("invalid")
 
+GRAMMAR = '''\
+<exp>:VarExp ::= <VAR>
+<exp>:LitExp ::= <LIT>
+<prog> ::= <exp>
+'''
+
+def test_generated_classes_accept_modifiers():
+    errors = validateAgainstGrammar(["Exp:top", "VarExp:init", "LitExp:import", "Prog:class", "Prog"])
+    assert errors == []
+
+def test_modifier_on_undefined_class():
+    errors = validateAgainstGrammar(["Prog", "Missing:init"])
+    assert errors == [UndefinedClassError(makeLine("Missing:init", 3),
+        "Undefined class Missing for modifier init (No rule of the syntactic section generates Missing).")]
+
+def test_modifier_on_runtime_class_is_undefined():
+    errors = validateAgainstGrammar(["Token:init"])
+    assert [type(e) for e in errors] == [UndefinedClassError]
+
+def test_new_class_without_modifier():
+    assert validateAgainstGrammar(["Env", "Val"]) == []
+
+def test_runtime_class_without_modifier_is_reserved():
+    errors = validateAgainstGrammar(["Scan"])
+    assert errors == [ReservedClassNameError(makeLine("Scan", 1),
+        "Reserved class name Scan (It is a class of the PLCC runtime).")]
+
+def test_duplicate_class_modifier():
+    errors = validateAgainstGrammar(["Prog:class", "Prog:init", "Prog:class"])
+    assert errors == [DuplicateModifierError(makeLine("Prog:class", 5),
+        "Duplicate code fragment for Prog:class (It conflicts with the one on line 1).")]
+
+def test_repeated_appending_modifiers_are_allowed():
+    assert validateAgainstGrammar(["Prog:init", "Prog:init", "Prog", "Prog", "Exp:top", "Exp:top"]) == []
+
+def test_duplicate_new_class():
+    errors = validateAgainstGrammar(["Env", "Env"])
+    assert errors == [DuplicateModifierError(makeLine("Env", 3),
+        "Duplicate code fragment for Env (It conflicts with the one on line 1).")]
+
+def test_invalid_names_are_not_cross_checked():
+    errors = validateAgainstGrammar(["bad:init"])
+    assert [type(e) for e in errors] == [InvalidClassNameError]
+
+def test_duplicates_across_merged_sections():
+    sections = [
+        makeSemanticSpec([makeLine("Prog:class", 1), makeBlock(), makeLine("Env", 3), makeBlock()]),
+        makeSemanticSpec([makeLine("Prog:class", 11), makeBlock(), makeLine("Prog:class", 13), makeBlock()]),
+        makeSemanticSpec([makeLine("Env", 21), makeBlock()], tool='Python', language='Python'),
+    ]
+    syntacticSpec = parse_syntactic_spec([makeLine('%')] + list(parse_lines(GRAMMAR)))
+    assert validate_semantic_specs(sections, syntacticSpec) == [DuplicateModifierError(makeLine("Prog:class", 11),
+        "Duplicate code fragment for Prog:class (It conflicts with the one on line 1).")]
+
+def validateAgainstGrammar(targets: list[str]):
+    linesAndBlocks = []
+    for i, target in enumerate(targets):
+        linesAndBlocks.append(makeLine(target, 2 * i + 1))
+        linesAndBlocks.append(makeBlock())
+    syntacticSpec = parse_syntactic_spec([makeLine('%')] + list(parse_lines(GRAMMAR)))
+    return validate_semantic_spec(makeSemanticSpec(linesAndBlocks), syntacticSpec)
+
 def assertValidClassNames(names: list[str]):
     for name in names:
         assertValidClassName(name)
@@ -72,8 +142,8 @@ def makeInvalidClassNameError(name: str):
         makeLine(name),
         f"Invalid name format for ClassName {name}, (Must start with an upper case letter, and may contain upper or lower case letters, numbers, and underscores).")
 
-def makeSemanticSpec(linesAndBlocks: list[Line | Block]):
-    return parse_semantic_spec([makeDivider('Java', 'Java', makeLine("%"))] + linesAndBlocks)
+def makeSemanticSpec(linesAndBlocks: list[Line | Block], tool='Java', language='Java'):
+    return parse_semantic_spec([makeDivider(tool, language, makeLine("%"))] + linesAndBlocks)
 
 def makeLine(string, lineNumber=1, file=None):
     return Line(string, lineNumber, file)
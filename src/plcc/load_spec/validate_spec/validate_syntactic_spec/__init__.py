@@ -0,0 +1,12 @@
+from .validate_syntactic_spec import (
+    validate_syntactic_spec,
+    UndefinedNonTerminalError,
+    UndefinedTerminalError,
+    UnreachableNonTerminalError,
+    NonProductiveNonTerminalError,
+    ReservedClassNameError,
+    LeftRecursionError,
+    CommonPrefixError,
+    DuplicateAlternativeError,
+    LL1ConflictError,
+)
@@ -0,0 +1,202 @@
+from dataclasses import dataclass
+from ...load_rough_spec.parse_lines import Line
+from ...parse_spec.parse_lexical_spec import LexicalSpec, LexicalRule
+from ...parse_spec.parse_syntactic_spec import SyntacticSpec, RepeatingSyntacticRule, RhsNonTerminal, getClassName, getBaseClassName
+from ...analyze_spec.index_syntactic_spec import index_syntactic_spec
+from ...analyze_spec.find_left_recursion import find_left_recursion
+from ...analyze_spec.find_common_prefixes import find_common_prefixes
+from ...analyze_spec.find_ll1_conflicts import find_ll1_conflicts
+from ..validate_semantic_spec import RUNTIME_CLASS_NAMES, ReservedClassNameError
+
+
+@dataclass
+class UndefinedNonTerminalError:
+    line: Line
+    message: str
+
+
+@dataclass
+class UndefinedTerminalError:
+    line: Line
+    message: str
+
+
+@dataclass
+class UnreachableNonTerminalError:
+    line: Line
+    message: str
+
+
+@dataclass
+class NonProductiveNonTerminalError:
+    line: Line
+    message: str
+
+
+@dataclass
+class LeftRecursionError:
+    line: Line
+    message: str
+
+
+@dataclass
+class CommonPrefixError:
+    line: Line
+    message: str
+
+
+@dataclass
+class DuplicateAlternativeError:
+    line: Line
+    message: str
+
+
+@dataclass
+class LL1ConflictError:
+    line: Line
+    message: str
+
+
+def validate_syntactic_spec(syntacticSpec: SyntacticSpec, lexicalSpec: LexicalSpec | None = None):
+    return SyntacticValidator(syntacticSpec, lexicalSpec).validate()
+
+
+class SyntacticValidator:
+    '''
+    Checks the grammar as a graph of nonterminals. Every check is linear
+    in the size of the grammar.
+
+    If lexicalSpec is None, terminals are not checked. LL(1) conflicts
+    are only checked if no other error was found, since the other errors
+    either explain them (left recursion, common prefixes) or make the
+    FIRST and FOLLOW sets meaningless.
+    '''
+    def __init__(self, syntacticSpec: SyntacticSpec, lexicalSpec: LexicalSpec | None = None):
+        self.index = index_syntactic_spec(syntacticSpec)
+        self.lexicalSpec = lexicalSpec
+        self.errorList = []
+
+    def validate(self) -> list:
+        if self.index.start is None:
+            return self.errorList
+        self._checkUndefinedNonTerminals()
+        self._checkUndefinedTerminals()
+        self._checkUnreachableNonTerminals()
+        self._checkNonProductiveNonTerminals()
+        self._checkReservedClassNames()
+        self._checkLeftRecursion()
+        self._checkCommonPrefixes()
+        if not self.errorList:
+            self._checkLL1Conflicts()
+        return self.errorList
+
+    def _checkUndefinedNonTerminals(self):
+        for rule, symbol in self.index.nonTerminalUses:
+            if not self.index.isDefined(symbol.name):
+                self.errorList.append(UndefinedNonTerminalError(rule.line,
+                f"Undefined nonterminal <{symbol.name}> (No rule has <{symbol.name}> on its left-hand side)."))
+
+    def _checkUndefinedTerminals(self):
+        if self.lexicalSpec is None:
+            return
+        tokenNames = {rule.name for rule in self.lexicalSpec.ruleList
+                      if isinstance(rule, LexicalRule) and not rule.isSkip}
+        for rule, symbol in self.index.terminalUses:
+            if symbol.name not in tokenNames:
+                self.errorList.append(UndefinedTerminalError(rule.line,
+                f"Undefined terminal {symbol.name} (No token named {symbol.name} in the lexical section)."))
+
+    def _checkUnreachableNonTerminals(self):
+        reachable = self._findReachable()
+        for name, rules in self.index.rulesByName.items():
+            if name not in reachable:
+                self.errorList.append(UnreachableNonTerminalError(rules[0].line,
+                f"Unreachable nonterminal <{name}> (It cannot be derived from the start symbol <{self.index.start}>)."))
+
+    def _findReachable(self) -> set[str]:
+        reachable = {self.index.start}
+        worklist = [self.index.start]
+        while worklist:
+            name = worklist.pop()
+            for successor in self.index.successors.get(name, []):
+                if successor not in reachable:
+                    reachable.add(successor)
+                    worklist.append(successor)
+        return reachable
+
+    def _checkNonProductiveNonTerminals(self):
+        productive = self._findProductive()
+        for name, rules in self.index.rulesByName.items():
+            if name not in productive:
+                self.errorList.append(NonProductiveNonTerminalError(rules[0].line,
+                f"Nonproductive nonterminal <{name}> (None of its rules derives a finite string of terminals)."))
+
+    def _findProductive(self) -> set[str]:
+        '''
+        A rule is productive once every nonterminal on its RHS is. Each
+        rule counts its RHS nonterminals that are not yet known to be
+        productive; each time a nonterminal becomes productive, the
+        counts of the rules that use it are decremented. Repeating rules
+        can derive the empty string, and undefined nonterminals are
+        reported elsewhere, so both are treated as productive.
+        '''
+        remaining = {}
+        usedBy = {}
+        productive = set()
+        worklist = []
+        for name, rules in self.index.rulesByName.items():
+            for rule in rules:
+                remaining[id(rule)] = 0
+                for symbol in self._getRequiredSymbols(rule):
+                    if isinstance(symbol, RhsNonTerminal) and self.index.isDefined(symbol.name):
+                        remaining[id(rule)] += 1
+                        usedBy.setdefault(symbol.name, []).append(rule)
+                if remaining[id(rule)] == 0 and name not in productive:
+                    productive.add(name)
+                    worklist.append(name)
+        while worklist:
+            name = worklist.pop()
+            for rule in usedBy.get(name, []):
+                remaining[id(rule)] -= 1
+                lhs = rule.lhs.name
+                if remaining[id(rule)] == 0 and lhs not in productive:
+                    productive.add(lhs)
+                    worklist.append(lhs)
+        return productive
+
+    def _checkReservedClassNames(self):
+        reported = set()
+        for rules in self.index.rulesByName.values():
+            for rule in rules:
+                for name in (getBaseClassName(rule.lhs), getClassName(rule.lhs)):
+                    if name in RUNTIME_CLASS_NAMES and name not in reported:
+                        reported.add(name)
+                        self.errorList.append(ReservedClassNameError(rule.line,
+                        f"Reserved class name {name} for <{rule.lhs.name}> (It is a class of the PLCC runtime; rename the nonterminal or alternative)."))
+
+    def _checkLeftRecursion(self):
+        for recursion in find_left_recursion(self.index):
+            names = ', '.join(f'<{name}>' for name in recursion.names)
+            self.errorList.append(LeftRecursionError(recursion.rules[0].line,
+            f"Left recursion through {names} (The generated recursive-descent parser would never terminate)."))
+
+    def _checkCommonPrefixes(self):
+        for common in find_common_prefixes(self.index):
+            if common.isDuplicate:
+                names = ', '.join(f'<{common.name}>:{getClassName(rule.lhs)}' for rule in common.rules)
+                self.errorList.append(DuplicateAlternativeError(common.rules[1].line,
+                f"Duplicate alternatives {names} (They have the same right-hand side; remove all but one of them)."))
+                continue
+            suggestion = '; '.join(common.suggestion)
+            self.errorList.append(CommonPrefixError(common.rules[1].line,
+            f"Alternatives of <{common.name}> start with the same symbols (Consider left-factoring them: {suggestion})."))
+
+    def _checkLL1Conflicts(self):
+        for conflict in find_ll1_conflicts(self.index):
+            self.errorList.append(LL1ConflictError(conflict.rule.line,
+            f"Conflict on {conflict.terminal} for <{conflict.name}> (More than one of its rules can start with {conflict.terminal}; the grammar is not LL(1))."))
+
+    def _getRequiredSymbols(self, rule):
+        if isinstance(rule, RepeatingSyntacticRule):
+            return []
+        return rule.rhsSymbolList
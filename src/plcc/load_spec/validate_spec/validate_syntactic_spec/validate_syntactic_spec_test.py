@@ -0,0 +1,138 @@
+from pytest import raises, mark, fixture
+from .validate_syntactic_spec import (
+    validate_syntactic_spec,
+    UndefinedNonTerminalError,
+    UndefinedTerminalError,
+    UnreachableNonTerminalError,
+    NonProductiveNonTerminalError,
+    ReservedClassNameError,
+    LeftRecursionError,
+    CommonPrefixError,
+    DuplicateAlternativeError,
+    LL1ConflictError,
+)
+from ...load_rough_spec.parse_lines import Line, parse_lines
+from ...parse_spec.parse_lexical_spec import parse_lexical_spec
+from ...parse_spec.parse_syntactic_spec import parse_syntactic_spec
+
+
+def test_empty_spec_no_errors():
+    assert validate_syntactic_spec(parse_syntactic_spec(None)) == []
+
+
+def test_valid_grammar_no_errors():
+    errors = validate('<prog> ::= <exp>', '<exp>:Lit ::= <LIT>', '<exp>:Neg ::= MINUS <exp>')
+    assert errors == []
+
+
+def test_undefined_nonterminal():
+    errors = validate('<prog> ::= <exp>')
+    assert errors == [UndefinedNonTerminalError(makeLine('<prog> ::= <exp>', 2),
+        "Undefined nonterminal <exp> (No rule has <exp> on its left-hand side).")]
+
+
+def test_unreachable_nonterminal():
+    errors = validate('<prog> ::= A', '<orphan> ::= B')
+    assert errors == [UnreachableNonTerminalError(makeLine('<orphan> ::= B', 3),
+        "Unreachable nonterminal <orphan> (It cannot be derived from the start symbol <prog>).")]
+
+
+def test_unreachable_cycle():
+    errors = validate('<prog> ::= A', '<a> ::= X <b>', '<b> ::= Y <a>', '<b> ::= C')
+    assert [type(e) for e in errors] == [UnreachableNonTerminalError, UnreachableNonTerminalError]
+
+
+def test_nonproductive_nonterminal():
+    errors = validate('<prog> ::= <loop>', '<loop> ::= A <loop>')
+    assert errors == [
+        NonProductiveNonTerminalError(makeLine('<prog> ::= <loop>', 2),
+            "Nonproductive nonterminal <prog> (None of its rules derives a finite string of terminals)."),
+        NonProductiveNonTerminalError(makeLine('<loop> ::= A <loop>', 3),
+            "Nonproductive nonterminal <loop> (None of its rules derives a finite string of terminals)."),
+    ]
+
+
+def test_one_productive_alternative_is_enough():
+    errors = validate('<prog> ::= <list>', '<list>:More ::= A <list>', '<list>:Done ::=')
+    assert errors == []
+
+
+def test_repeating_rule_is_productive():
+    errors = validate('<prog> ::= <items>', '<items> **= LPAREN <prog> RPAREN')
+    assert errors == []
+
+
+def test_undefined_nonterminal_not_also_nonproductive():
+    errors = validate('<prog> ::= <exp>')
+    assert [type(e) for e in errors] == [UndefinedNonTerminalError]
+
+
+def test_undefined_terminals_with_lexical_spec():
+    errors = validate('<prog> ::= A <B>', '<items> **= <A> +C', lexical=["A 'a'", "skip B 'b'"])
+    assert errors == [
+        UndefinedTerminalError(makeLine('<prog> ::= A <B>', 2),
+            "Undefined terminal B (No token named B in the lexical section)."),
+        UndefinedTerminalError(makeLine('<items> **= <A> +C', 3),
+            "Undefined terminal C (No token named C in the lexical section)."),
+        UnreachableNonTerminalError(makeLine('<items> **= <A> +C', 3),
+            "Unreachable nonterminal <items> (It cannot be derived from the start symbol <prog>)."),
+    ]
+
+
+def test_large_grammar_chain():
+    n = 20000
+    rules = [f'<n{i}> ::= A <n{i+1}>' for i in range(n)] + [f'<n{n}> ::= A']
+    assert validate(*rules) == []
+
+
+def validate(*rules, lexical=None):
+    lines = list(parse_lines('%\n' + '\n'.join(rules)))
+    lexicalSpec = None if lexical is None else parse_lexical_spec(list(parse_lines('\n'.join(lexical))))
+    return validate_syntactic_spec(parse_syntactic_spec(lines), lexicalSpec)
+
+
+def makeLine(string, number, file=None):
+    return Line(string, number, file)
+
+
+def test_reserved_class_names():
+    errors = validate('<prog> ::= <trace> <tokens>', '<trace>:Scan ::= A', '<trace>:Other ::= B', '<tokens> ::= C')
+    assert errors == [
+        ReservedClassNameError(makeLine('<trace>:Scan ::= A', 3),
+            "Reserved class name Trace for <trace> (It is a class of the PLCC runtime; rename the nonterminal or alternative)."),
+        ReservedClassNameError(makeLine('<trace>:Scan ::= A', 3),
+            "Reserved class name Scan for <trace> (It is a class of the PLCC runtime; rename the nonterminal or alternative)."),
+    ]
+
+
+def test_parser_and_tokens_are_not_reserved():
+    assert validate('<prog> ::= <parser>', '<parser>:Tokens ::= A') == []
+
+
+def test_left_recursion():
+    errors = validate('<exp>:Sum ::= <exp> PLUS <LIT>', '<exp>:Lit ::= <LIT>')
+    assert errors == [LeftRecursionError(makeLine('<exp>:Sum ::= <exp> PLUS <LIT>', 2),
+        "Left recursion through <exp> (The generated recursive-descent parser would never terminate).")]
+
+
+def test_common_prefix():
+    errors = validate('<exp>:A ::= X Y', '<exp>:B ::= X Z')
+    assert errors == [CommonPrefixError(makeLine('<exp>:B ::= X Z', 3),
+        "Alternatives of <exp> start with the same symbols (Consider left-factoring them: "
+        "<exp> ::= X <expRest>; <expRest>:A ::= Y; <expRest>:B ::= Z).")]
+
+
+def test_duplicate_alternatives():
+    errors = validate('<s>:X ::= A', '<s>:Y ::= A')
+    assert errors == [DuplicateAlternativeError(makeLine('<s>:Y ::= A', 3),
+        "Duplicate alternatives <s>:X, <s>:Y (They have the same right-hand side; remove all but one of them).")]
+
+
+def test_ll1_conflict():
+    errors = validate('<s>:X ::= <p> B', '<s>:Y ::= <q> A', '<p> ::= A', '<q> ::= A')
+    assert errors == [LL1ConflictError(makeLine('<s>:Y ::= <q> A', 3),
+        "Conflict on A for <s> (More than one of its rules can start with A; the grammar is not LL(1)).")]
+
+
+def test_ll1_conflicts_not_reported_with_other_errors():
+    assert [type(e) for e in validate('<s>:X ::= A B', '<s>:Y ::= A C')] == [CommonPrefixError]
@@ -0,0 +1,5 @@
+from .visitor import Visitor
+from .transformation import Transformation
+from .transformer import Transform
+from .dispatch import get_handler, get_field_names, is_frozen_dataclass
+from .memo import LruCache, IDENTITY, VALUE
@@ -0,0 +1,82 @@
+from dataclasses import fields, is_dataclass
+from inspect import getattr_static
+
+
+# Visitor and node classes live as long as their modules, so the caches
+# are plain dictionaries keyed on them.
+_handlers = {}
+_fieldNames = {}
+_frozen = {}
+
+
+def get_node_type(node) -> type:
+    '''
+    Return the type whose MRO selects the visit method for node. A node
+    that is itself a type is dispatched on its own MRO.
+    '''
+    return node if isinstance(node, type) else type(node)
+
+
+def get_handler(visitorClass: type, nodeType: type):
+    '''
+    Return the visit_T function of visitorClass for the first class T in
+    nodeType's MRO that has one, or None. The MRO is searched once per
+    (visitorClass, nodeType); later calls are a dictionary lookup.
+
+    The result is the plain function, to be called with the visitor as
+    its first argument, so no bound method is created per node. Handlers
+    are looked up statically, so a staticmethod or classmethod handler is
+    wrapped to be called the same way.
+    '''
+    key = (visitorClass, nodeType)
+    try:
+        return _handlers[key]
+    except KeyError:
+        pass
+    handler = None
+    for cls in nodeType.__mro__:
+        handler = getattr_static(visitorClass, 'visit_' + cls.__name__, None)
+        if handler is not None:
+            handler = _asFunction(handler)
+            break
+    _handlers[key] = handler
+    return handler
+
+
+def _asFunction(handler):
+    # The descriptor is bound on each call, as attribute access would, so
+    # a classmethod handler receives the visitor's own class.
+    if not isinstance(handler, (staticmethod, classmethod)):
+        return handler
+
+    def call(visitor, *args, **kws):
+        return handler.__get__(visitor, type(visitor))(*args, **kws)
+    return call
+
+
+def get_field_names(nodeType: type) -> tuple[str, ...] | None:
+    '''
+    Return the names of the fields of a dataclass type, in definition
+    order, or None if nodeType is not a dataclass. Computed once per type.
+    '''
+    try:
+        return _fieldNames[nodeType]
+    except KeyError:
+        pass
+    names = tuple(f.name for f in fields(nodeType)) if is_dataclass(nodeType) else None
+    _fieldNames[nodeType] = names
+    return names
+
+
+def is_frozen_dataclass(nodeType: type) -> bool:
+    '''
+    Return whether nodeType is a frozen dataclass. Computed once per type.
+    '''
+    try:
+        return _frozen[nodeType]
+    except KeyError:
+        pass
+    params = getattr(nodeType, '__dataclass_params__', None) if is_dataclass(nodeType) else None
+    frozen = bool(params and params.frozen)
+    _frozen[nodeType] = frozen
+    return frozen
@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+
+from .dispatch import get_handler, get_field_names, get_node_type
+
+
+class Base:
+    pass
+
+
+class Derived(Base):
+    pass
+
+
+class Handlers:
+    def visit_Base(self, node):
+        return 'base'
+
+
+class MoreHandlers(Handlers):
+    def visit_Derived(self, node):
+        return 'derived'
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+def test_handler_found_through_mro():
+    assert get_handler(Handlers, Derived) is Handlers.visit_Base
+
+
+def test_most_specific_handler_wins():
+    assert get_handler(MoreHandlers, Derived) is MoreHandlers.visit_Derived
+    assert get_handler(MoreHandlers, Base) is Handlers.visit_Base
+
+
+def test_missing_handler_is_none():
+    assert get_handler(Handlers, int) is None
+
+
+def test_static_and_class_method_handlers():
+    class Static:
+        @staticmethod
+        def visit_Base(node):
+            return 'static'
+
+        @classmethod
+        def visit_Derived(cls, node):
+            return cls
+
+    assert get_handler(Static, Base)(Static(), Base()) == 'static'
+    assert get_handler(Static, Derived)(Static(), Derived()) is Static
+
+
+def test_classmethod_handler_gets_the_visitor_subclass():
+    class Visitor:
+        @classmethod
+        def visit_Base(cls, node):
+            return cls
+
+    class SubVisitor(Visitor):
+        pass
+
+    assert get_handler(SubVisitor, Base)(SubVisitor(), Base()) is SubVisitor
+
+
+def test_field_names():
+    assert get_field_names(Point) == ('x', 'y')
+    assert get_field_names(list) is None
+
+
+def test_node_type():
+    assert get_node_type(Derived()) is Derived
+    assert get_node_type(Derived) is Derived
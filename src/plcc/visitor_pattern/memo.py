@@ -0,0 +1,57 @@
+from collections import OrderedDict
+
+
+IDENTITY = 'identity'
+VALUE = 'value'
+
+MISSING = object()
+
+
+class LruCache:
+    '''
+    A bounded cache of transformation results for frozen nodes, evicting
+    the least recently used entry once it holds maxsize entries.
+
+    Nodes are keyed by identity (the same object) or by value (equal
+    objects). Keyed by identity, the node is kept alive by its entry so
+    that its id is not reused while cached. Keyed by value, nodes that
+    are not hashable (e.g., a frozen dataclass with a list field) are
+    not cached.
+    '''
+    def __init__(self, keyedBy: str = IDENTITY, maxsize: int = 4096):
+        if keyedBy not in (IDENTITY, VALUE):
+            raise ValueError(f'keyedBy must be {IDENTITY!r} or {VALUE!r}, not {keyedBy!r}')
+        self.byIdentity = keyedBy == IDENTITY
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+
+    def get(self, node):
+        key = self._key(node)
+        if key is MISSING:
+            return MISSING
+        entry = self.entries.get(key, MISSING)
+        if entry is MISSING or (self.byIdentity and entry[0] is not node):
+            return MISSING
+        self.entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, node, result):
+        key = self._key(node)
+        if key is MISSING or self.maxsize <= 0:
+            return
+        self.entries[key] = (node, result)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _key(self, node):
+        if self.byIdentity:
+            return id(node)
+        try:
+            hash(node)
+        except TypeError:
+            return MISSING
+        return node
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+from pytest import raises
+
+from .memo import LruCache, MISSING, IDENTITY, VALUE
+
+
+@dataclass(frozen=True)
+class Leaf:
+    name: str
+
+
+@dataclass(frozen=True)
+class Branch:
+    children: list
+
+
+def test_identity_keys():
+    cache = LruCache(IDENTITY)
+    a = Leaf('a')
+    cache.put(a, 1)
+    assert cache.get(a) == 1
+    assert cache.get(Leaf('a')) is MISSING
+
+
+def test_value_keys():
+    cache = LruCache(VALUE)
+    cache.put(Leaf('a'), 1)
+    assert cache.get(Leaf('a')) == 1
+
+
+def test_unhashable_nodes_are_not_cached():
+    cache = LruCache(VALUE)
+    cache.put(Branch([]), 1)
+    assert cache.get(Branch([])) is MISSING
+    assert len(cache) == 0
+
+
+def test_least_recently_used_is_evicted():
+    cache = LruCache(VALUE, maxsize=2)
+    cache.put(Leaf('a'), 1)
+    cache.put(Leaf('b'), 2)
+    cache.get(Leaf('a'))
+    cache.put(Leaf('c'), 3)
+    assert cache.get(Leaf('b')) is MISSING
+    assert cache.get(Leaf('a')) == 1
+    assert cache.get(Leaf('c')) == 3
+
+
+def test_invalid_key_kind():
+    with raises(ValueError):
+        LruCache('name')
@@ -0,0 +1,140 @@
+from .dispatch import get_field_names, is_frozen_dataclass
+from .memo import LruCache, MISSING
+
+
+class Transformation:
+    '''
+    Applies a visitor to each node a tree following a bottom-up traversal.
+    The results of applying the visitor to each attribute of a node is passed
+    to the visit_T(...) method as keyword arguments with the same name as
+    the attributes.
+
+    When lists are encountered, returns a new list with the results of visiting
+    each element of the list.
+
+    Example
+        from dataclasses import dataclass
+        from plcc.visitor_pattern import Transformation, Transform
+
+        @dataclass
+        class A:
+            bs: [B]
+
+        @dataclass
+        class B:
+            m: str
+
+        class Copy(Transform):
+            """Create a deep copy of tree."""
+
+            def visit_A(self, obj, bs):
+                return A(bs)
+
+            def visit_B(self, obj, m):
+                return B(m)
+
+        copyMaker = Transformation(Copy())
+        tree = A([B("hi")])
+        newTree = copyMaker.visit(tree)
+
+    If memoize is 'identity' or 'value', the result for each frozen
+    dataclass node is cached (see LruCache), and a node that is the same
+    object as, or equal to, a cached one is not visited again; the cached
+    result is reused, so repeated subtrees share their result. Only use
+    it if visitor's results depend on nothing but the node and its
+    children's results.
+    '''
+    def __init__(self, visitor, memoize: str | None = None, maxsize: int = 4096):
+        self.visitor = visitor
+        self.cache = None if memoize is None else LruCache(memoize, maxsize)
+
+    def visit(self, obj):
+        '''
+        Apply visitor to each dataclass object, bottom up.
+        Results from visiting a dataclass object's children are passed to the
+        visit method as keyword arguments. For example if the dataclass object
+        has fields x and y, then those fields are visited first and their
+        results are passed to the visit call for the original object as
+        keyword arguments x and y (roughly v.visit(o, x=v.visit(o.x), y=v.visit(o.y))).
+
+        Trees are traversed recursively, which is fastest. Below a depth of
+        RECURSION_DEPTH, the rest of a subtree is traversed with an explicit
+        stack instead, so deep trees do not exhaust Python's call stack.
+        '''
+        return self._visit(obj, 0)
+
+    def _visit(self, obj, depth: int):
+        if depth >= RECURSION_DEPTH:
+            return self._visitIteratively(obj)
+        names = get_field_names(type(obj))
+        if names is not None:
+            cache = self.cache if self.cache is not None and is_frozen_dataclass(type(obj)) else None
+            if cache is not None:
+                cached = cache.get(obj)
+                if cached is not MISSING:
+                    return cached
+            depth += 1
+            result = self.visitor.visit(obj, **{name: self._visit(getattr(obj, name), depth) for name in names})
+            if cache is not None:
+                cache.put(obj, result)
+            return result
+        elif isinstance(obj, list):
+            depth += 1
+            return [self._visit(e, depth) for e in obj]
+        else:
+            return obj
+
+    def _visitIteratively(self, obj):
+        results = []
+        work = [(obj, _EXPAND)]
+        while work:
+            item, action = work.pop()
+            if action is _EXPAND:
+                names = get_field_names(type(item))
+                if names is not None:
+                    if self.cache is not None and is_frozen_dataclass(type(item)):
+                        cached = self.cache.get(item)
+                        if cached is not MISSING:
+                            results.append(cached)
+                            continue
+                    work.append((item, names))
+                    work.extend((getattr(item, name), _EXPAND) for name in reversed(names))
+                elif isinstance(item, list):
+                    work.append((len(item), _COLLECT))
+                    work.extend((e, _EXPAND) for e in reversed(item))
+                else:
+                    results.append(item)
+            elif action is _COLLECT:
+                start = len(results) - item
+                values = results[start:]
+                del results[start:]
+                results.append(values)
+            else:
+                start = len(results) - len(action)
+                visitedFields = dict(zip(action, results[start:]))
+                del results[start:]
+                result = self.visitor.visit(item, **visitedFields)
+                if self.cache is not None and is_frozen_dataclass(type(item)):
+                    self.cache.put(item, result)
+                results.append(result)
+        return results[0]
+
+    def visitEach(self, objs):
+        '''
+        Yield the result of visiting each element of objs (e.g., a very
+        long list or a generator), one at a time, instead of building the
+        list of all results.
+        '''
+        for obj in objs:
+            yield self.visit(obj)
+
+
+# Nesting of dataclass objects and lists below which a subtree is
+# traversed iteratively. Each level takes at most two Python frames.
+RECURSION_DEPTH = 200
+
+# Work stack actions: visit an item's children, or gather the results of
+# a list's elements. Otherwise the action is the tuple of a dataclass
+# object's field names, and its children's results are passed to visitor.
+_EXPAND = object()
+_COLLECT = object()
@@ -0,0 +1,195 @@
+from dataclasses import dataclass
+
+from pytest import raises
+
+from plcc.load_spec.load_rough_spec.parse_lines import Line
+from plcc.load_spec.parse_spec.parse_syntactic_spec import parse_syntactic_spec, Terminal
+
+from . import Transformation, Transform, Visitor
+from .transformation import RECURSION_DEPTH
+
+
+@dataclass
+class B:
+    m: str
+
+
+@dataclass
+class A:
+    bs: list[B]
+    name: str
+
+
+@dataclass
+class C(A):
+    extra: int = 0
+
+
+class Copy(Transform):
+    def visit_A(self, obj, bs, name):
+        return A(bs, name)
+
+    def visit_B(self, obj, m):
+        return B(m)
+
+
+class Names(Transform):
+    def visit_A(self, obj, bs, name, **kws):
+        return [name] + bs
+
+    def visit_B(self, obj, m):
+        return m
+
+
+def test_copy():
+    tree = A([B('x'), B('y')], 'a')
+    copy = Transformation(Copy()).visit(tree)
+    assert copy == tree
+    assert copy is not tree
+    assert copy.bs[0] is not tree.bs[0]
+
+
+def test_children_are_passed_as_keywords():
+    assert Transformation(Names()).visit(A([B('x'), B('y')], 'a')) == ['a', 'x', 'y']
+
+
+def test_subclass_uses_base_handler():
+    assert Transformation(Names()).visit(C([B('x')], 'c', 1)) == ['c', 'x']
+
+
+def test_transform_without_handler_returns_node():
+    tree = A([], 'a')
+    assert Transform().visit(tree) is tree
+
+
+def test_non_dataclasses_are_returned():
+    assert Transformation(Copy()).visit('s') == 's'
+    assert Transformation(Copy()).visit([1, 'a']) == [1, 'a']
+
+
+class Describe(Visitor):
+    def visit_A(self, node):
+        return f'A {node.name}'
+
+    def visit_object(self, node):
+        return 'object'
+
+
+def test_visitor_dispatch():
+    assert Describe().visit(C([], 'c')) == 'A c'
+    assert Describe().visit(3) == 'object'
+
+
+def test_visitor_without_handler():
+    class Empty(Visitor):
+        pass
+    with raises(NotImplementedError):
+        Empty().visit(B('x'))
+
+
+@dataclass
+class Nest:
+    inner: object
+
+
+class Depth(Transform):
+    def visit_Nest(self, obj, inner):
+        return inner + 1
+
+
+def test_deep_tree_does_not_exhaust_stack():
+    tree = 0
+    for _ in range(100000):
+        tree = Nest(tree)
+    assert Transformation(Depth()).visit(tree) == 100000
+
+
+def test_subtrees_below_recursion_depth_visit_the_same():
+    class Unwrap(Transform):
+        def visit_Nest(self, obj, inner):
+            return inner
+
+    tree, expected = 0, 0
+    for _ in range(RECURSION_DEPTH * 2):
+        tree, expected = Nest([tree, B('x')]), [expected, B('x')]
+    assert Transformation(Unwrap()).visit(tree) == expected
+
+
+def test_nested_lists():
+    assert Transformation(Names()).visit([[A([], 'a')], [], [B('b'), [B('c')]]]) == [[['a']], [], ['b', ['c']]]
+
+
+def test_empty_dataclass():
+    @dataclass
+    class Empty:
+        pass
+    tree = A([B('x')], 'a')
+    assert Transformation(Transform()).visit([Empty(), tree])[1] is tree
+
+
+def test_visit_each_streams_results():
+    def generate():
+        for i in range(3):
+            yield B(str(i))
+    results = Transformation(Names()).visitEach(generate())
+    assert next(results) == '0'
+    assert list(results) == ['1', '2']
+
+
+class CountTerminals(Transform):
+    def __init__(self):
+        self.visits = 0
+
+    def visit_Terminal(self, obj, name):
+        self.visits += 1
+        return name.lower()
+
+
+def parseRules():
+    lines = [Line('%', 1)] + [Line(f'<r{i}> ::= A B <r{i + 1}> A', i + 2) for i in range(10)]
+    return list(parse_syntactic_spec(lines))
+
+
+def test_memoize_by_value_visits_equal_nodes_once():
+    rules = parseRules()
+    visitor = CountTerminals()
+    result = Transformation(visitor, memoize='value').visit(rules)
+    assert visitor.visits == 2
+    assert result == Transformation(CountTerminals()).visit(rules)
+
+
+def test_memoize_by_identity_visits_the_same_object_once():
+    visitor = CountTerminals()
+    tree = [Terminal('A'), Terminal('A')]
+    shared = Terminal('B')
+    assert Transformation(visitor, memoize='identity').visit(tree + [shared, shared]) == ['a', 'a', 'b', 'b']
+    assert visitor.visits == 3
+
+
+def test_results_are_shared():
+    @dataclass(frozen=True)
+    class Pair:
+        left: object
+        right: object
+
+    class MakeList(Transform):
+        def visit_Pair(self, obj, left, right):
+            return [left, right]
+
+    results = Transformation(MakeList(), memoize='value').visit([Pair(1, 2), Pair(1, 2)])
+    assert results[0] is results[1]
+
+
+def test_mutable_nodes_are_not_memoized():
+    class CountBs(Transform):
+        def __init__(self):
+            self.visits = 0
+
+        def visit_B(self, obj, m):
+            self.visits += 1
+            return m
+
+    visitor = CountBs()
+    shared = B('x')
+    assert Transformation(visitor, memoize='value').visit([B('x'), B('x'), shared, shared]) == ['x'] * 4
+    assert visitor.visits == 4
@@ -0,0 +1 @@
+from .write_files import OutputFiles, write_files, read_manifest, MANIFEST
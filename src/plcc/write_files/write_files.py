@@ -0,0 +1,121 @@
+from hashlib import sha256
+import os
+from pathlib import Path
+import tempfile
+
+
+MANIFEST = '.plcc-changed'
+
+
+def write_files(directory, files: dict[str, str | bytes], manifest: str | None = None) -> list[str]:
+    '''
+    Write files (relative path -> content) under directory as one batch
+    and return the paths that changed. See OutputFiles.
+    '''
+    output = OutputFiles(directory, manifest)
+    for path, content in files.items():
+        output.add(path, content)
+    return output.write()
+
+
+class OutputFiles:
+    '''
+    Collects generated files in memory and writes them under directory in
+    one batch.
+
+    A file whose content is unchanged on disk is not touched, so its mtime
+    is preserved for build tools that compare mtimes. Changed files are
+    first written to temporary files in their destination directories,
+    then all renamed into place, so an interrupted run never leaves a
+    partially written file behind. A replaced file keeps its permissions;
+    a new one gets the permissions open() would have given it.
+
+    If manifest is given, the changed paths are added to the file of that
+    name in directory, one per line, in the same batch. Paths already
+    listed are kept until the consumer (plccmk) removes the manifest after
+    a successful build, so a failed build does not lose them.
+    '''
+    def __init__(self, directory, manifest: str | None = None):
+        self.directory = Path(directory)
+        self.manifest = manifest
+        self.files = {}
+
+    def add(self, path: str, content: str | bytes):
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        self.files[path] = content
+
+    def addCopy(self, path: str, source):
+        '''
+        Add a copy of the file source (e.g., a runtime library file).
+        '''
+        with open(source, 'rb') as f:
+            self.add(path, f.read())
+
+    def write(self) -> list[str]:
+        changed = [path for path, content in self.files.items() if self._isChanged(path, content)]
+        temporaries = []
+        try:
+            for path in changed:
+                temporaries.append((self._writeTemporary(path, self.files[path]), self.directory / path))
+            if self.manifest is not None:
+                temporaries.append((self._writeTemporary(self.manifest, self._makeManifest(changed)), self.directory / self.manifest))
+            for temporary, destination in temporaries:
+                os.replace(temporary, destination)
+        except BaseException:
+            for temporary, _ in temporaries:
+                if os.path.exists(temporary):
+                    os.remove(temporary)
+            raise
+        return changed
+
+    def _makeManifest(self, changed: list[str]) -> bytes:
+        paths = dict.fromkeys(read_manifest(self.directory, self.manifest) + changed)
+        return ''.join(f'{path}\n' for path in paths).encode('utf-8')
+
+    def _isChanged(self, path: str, content: bytes) -> bool:
+        destination = self.directory / path
+        if not destination.is_file() or destination.stat().st_size != len(content):
+            return True
+        return self._hash(destination) != sha256(content).digest()
+
+    def _hash(self, file: Path) -> bytes:
+        digest = sha256()
+        with open(file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+        return digest.digest()
+
+    def _writeTemporary(self, path: str, content: bytes) -> str:
+        destination = self.directory / path
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=destination.parent, prefix=f'.{destination.name}.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        mode = destination.stat().st_mode & 0o7777 if destination.is_file() else _NEW_FILE_MODE
+        os.chmod(temporary, mode)
+        return temporary
+
+
+def read_manifest(directory, manifest: str = MANIFEST) -> list[str]:
+    '''
+    Return the paths listed in the manifest in directory, or [] if there
+    is none.
+    '''
+    file = Path(directory) / manifest
+    if not file.is_file():
+        return []
+    return file.read_text().splitlines()
+
+
+def _getUmask() -> int:
+    # The umask can only be read by setting it, which would race with
+    # threads creating files, so it is read once, at import.
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# mkstemp creates files as 0600; open() would have applied the umask to
+# 0666.
+_NEW_FILE_MODE = 0o666 & ~_getUmask()
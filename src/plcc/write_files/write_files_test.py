@@ -0,0 +1,99 @@
+import os
+
+from pytest import raises
+
+from .write_files import OutputFiles, write_files, read_manifest, MANIFEST
+
+
+def test_writes_new_files(tmp_path):
+    changed = write_files(tmp_path / 'Java', {'Prog.java': 'class Prog {}\n', 'sub/Exp.java': 'class Exp {}\n'})
+    assert changed == ['Prog.java', 'sub/Exp.java']
+    assert (tmp_path / 'Java' / 'Prog.java').read_text() == 'class Prog {}\n'
+    assert (tmp_path / 'Java' / 'sub' / 'Exp.java').read_text() == 'class Exp {}\n'
+
+
+def test_unchanged_file_is_not_touched(tmp_path):
+    write_files(tmp_path, {'Prog.java': 'class Prog {}\n'})
+    file = tmp_path / 'Prog.java'
+    os.utime(file, (0, 0))
+    assert write_files(tmp_path, {'Prog.java': 'class Prog {}\n'}) == []
+    assert file.stat().st_mtime == 0
+
+
+def test_changed_file_is_replaced(tmp_path):
+    write_files(tmp_path, {'Prog.java': 'class Prog {}\n', 'Exp.java': 'class Exp {}\n'})
+    changed = write_files(tmp_path, {'Prog.java': 'class Prog { int x; }\n', 'Exp.java': 'class Exp {}\n'})
+    assert changed == ['Prog.java']
+    assert (tmp_path / 'Prog.java').read_text() == 'class Prog { int x; }\n'
+
+
+def test_same_size_change_is_detected(tmp_path):
+    write_files(tmp_path, {'A.java': 'aaaa'})
+    assert write_files(tmp_path, {'A.java': 'bbbb'}) == ['A.java']
+
+
+def test_no_temporary_files_left(tmp_path):
+    write_files(tmp_path, {'A.java': 'a', 'B.java': 'b'})
+    assert sorted(os.listdir(tmp_path)) == ['A.java', 'B.java']
+
+
+def test_add_copy(tmp_path):
+    source = tmp_path / 'Scan.java'
+    source.write_bytes(b'class Scan {}\n')
+    output = OutputFiles(tmp_path / 'Java')
+    output.addCopy('Scan.java', source)
+    assert output.write() == ['Scan.java']
+    assert output.write() == []
+    assert (tmp_path / 'Java' / 'Scan.java').read_bytes() == b'class Scan {}\n'
+
+
+def test_failed_batch_leaves_nothing_behind(tmp_path):
+    (tmp_path / 'blocked').write_text('a file, not a directory')
+    output = OutputFiles(tmp_path)
+    output.add('A.java', 'a')
+    output.add('blocked/B.java', 'b')
+    with raises(OSError):
+        output.write()
+    assert sorted(os.listdir(tmp_path)) == ['blocked']
+
+
+
+def test_new_files_get_the_umask_permissions(tmp_path):
+    umask = os.umask(0o022)
+    os.umask(umask)
+    write_files(tmp_path, {'A.java': 'a'})
+    assert (tmp_path / 'A.java').stat().st_mode & 0o777 == 0o666 & ~umask
+
+
+def test_write_does_not_change_the_umask(tmp_path, monkeypatch):
+    def umask(mask):
+        raise AssertionError('os.umask called')
+    monkeypatch.setattr(os, 'umask', umask)
+    write_files(tmp_path, {'A.java': 'a'})
+
+
+def test_replaced_file_keeps_its_permissions(tmp_path):
+    (tmp_path / 'A.java').write_text('old')
+    (tmp_path / 'A.java').chmod(0o600)
+    write_files(tmp_path, {'A.java': 'new'})
+    assert (tmp_path / 'A.java').stat().st_mode & 0o777 == 0o600
+
+
+def test_manifest_lists_changed_files(tmp_path):
+    write_files(tmp_path, {'A.java': 'a', 'B.java': 'b'}, MANIFEST)
+    assert read_manifest(tmp_path) == ['A.java', 'B.java']
+
+
+def test_manifest_accumulates_until_removed(tmp_path):
+    write_files(tmp_path, {'A.java': 'a', 'B.java': 'b'}, MANIFEST)
+    write_files(tmp_path, {'A.java': 'a', 'B.java': 'b2'}, MANIFEST)
+    assert read_manifest(tmp_path) == ['A.java', 'B.java']
+    (tmp_path / MANIFEST).unlink()
+    write_files(tmp_path, {'A.java': 'a', 'B.java': 'b3'}, MANIFEST)
+    assert read_manifest(tmp_path) == ['B.java']
+
+
+def test_manifest_written_when_nothing_changed(tmp_path):
+    write_files(tmp_path, {'A.java': 'a'})
+    write_files(tmp_path, {'A.java': 'a'}, MANIFEST)
+    assert (tmp_path / MANIFEST).read_text() == ''